@@ -9,8 +9,11 @@ from app.models.base import BaseLLM, BaseEmbeddings
 from app.models.factory import ModelFactory
 from app.services.rag_service import RAGService
 from app.services.chat_service import ChatService
-from app.config.settings import get_db_settings
+from app.services.stream_metrics import StreamMetricsRecorder
+from app.config.settings import get_db_settings, get_vector_cache_settings
 from app.repository.base import BaseVectorRepository
+from app.repository.cache import VectorSearchCache
+from app.repository.cached_vector_repository import CachedVectorRepository
 from app.repository.vector_store_repository import PGVectorRepository
 from langchain_postgres import PGVector
 
@@ -48,6 +51,23 @@ def get_embeddings() -> BaseEmbeddings:
     return ModelFactory.create_embeddings()
 
 
+def _build_connection_string(driver: str) -> str:
+    """
+    PostgreSQL 연결 문자열을 생성합니다.
+
+    Args:
+        driver: SQLAlchemy 드라이버 이름 (psycopg2, psycopg 등)
+    """
+    db_settings = get_db_settings()
+
+    # SSL 모드가 있는 경우 connection string에 추가
+    ssl_param = f"?sslmode={db_settings.sslmode}" if db_settings.sslmode else ""
+    return (
+        f"postgresql+{driver}://{db_settings.user}:{db_settings.password}"
+        f"@{db_settings.host}:{db_settings.port}/{db_settings.name}{ssl_param}"
+    )
+
+
 @lru_cache()
 def get_vector_store() -> PGVector:
     """
@@ -56,18 +76,44 @@ def get_vector_store() -> PGVector:
     db_settings = get_db_settings()
     embeddings_provider = get_embeddings()
 
-    # SSL 모드가 있는 경우 connection string에 추가
-    ssl_param = f"?sslmode={db_settings.sslmode}" if db_settings.sslmode else ""
-    connection_string = (
-        f"postgresql+psycopg2://{db_settings.user}:{db_settings.password}"
-        f"@{db_settings.host}:{db_settings.port}/{db_settings.name}{ssl_param}"
+    return PGVector(
+        embeddings=embeddings_provider.get_embeddings(),
+        collection_name=db_settings.collection_name,
+        connection=_build_connection_string("psycopg2"),
+        use_jsonb=True,
     )
 
+
+@lru_cache()
+def get_async_vector_store() -> PGVector:
+    """
+    비동기 벡터 스토어 인스턴스를 반환합니다 (싱글톤).
+
+    psycopg(v3) 드라이버의 async 엔진을 사용하므로 검색 중에
+    이벤트 루프를 막지 않습니다.
+    """
+    db_settings = get_db_settings()
+    embeddings_provider = get_embeddings()
+
     return PGVector(
         embeddings=embeddings_provider.get_embeddings(),
         collection_name=db_settings.collection_name,
-        connection=connection_string,
+        connection=_build_connection_string("psycopg"),
         use_jsonb=True,
+        async_mode=True,
+    )
+
+
+@lru_cache()
+def get_vector_cache() -> VectorSearchCache:
+    """
+    벡터 검색 캐시 인스턴스를 반환합니다 (싱글톤).
+    """
+    cache_settings = get_vector_cache_settings()
+    return VectorSearchCache(
+        max_embeddings=cache_settings.max_embeddings,
+        max_results=cache_settings.max_results,
+        ttl=cache_settings.ttl_seconds,
     )
 
 
@@ -75,9 +121,16 @@ def get_vector_store() -> PGVector:
 def get_repository() -> BaseVectorRepository:
     """
     벡터 스토어 Repository 인스턴스를 반환합니다 (싱글톤).
+
+    VECTOR_CACHE_ENABLED가 true(기본값)이면 검색 캐시를 앞에 둡니다.
     """
-    vector_store = get_vector_store()
-    return PGVectorRepository(vector_store=vector_store)
+    repository = PGVectorRepository(
+        vector_store=get_vector_store(),
+        async_vector_store=get_async_vector_store(),
+    )
+    if not get_vector_cache_settings().enabled:
+        return repository
+    return CachedVectorRepository(repository=repository, cache=get_vector_cache())
 
 
 def get_rag_service() -> RAGService:
@@ -95,10 +148,21 @@ def get_rag_service() -> RAGService:
     )
 
 
+@lru_cache()
+def get_stream_metrics_recorder() -> StreamMetricsRecorder:
+    """
+    스트리밍 지표 기록기 인스턴스를 반환합니다 (싱글톤).
+    """
+    return StreamMetricsRecorder()
+
+
 def get_chat_service() -> ChatService:
     """
     채팅 서비스 인스턴스를 반환합니다.
     """
     rag_service = get_rag_service()
-    return ChatService(rag_service=rag_service)
+    return ChatService(
+        rag_service=rag_service,
+        metrics_recorder=get_stream_metrics_recorder(),
+    )
 
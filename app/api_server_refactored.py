@@ -41,7 +41,9 @@ async def root():
         "description": "RAG를 사용한 지능형 챗봇 API",
         "endpoints": {
             "health": "/health",
+            "cache_stats": "/health/cache",
             "chat_rag": "/api/chat/rag",
+            "chat_rag_stream": "/api/chat/rag/stream",
             "chat_general": "/api/chat/general",
             "chat_legacy": "/api/chat"
         },
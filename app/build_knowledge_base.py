@@ -1,16 +1,28 @@
 """
 지식 베이스 구축 스크립트
 
-텍스트 파일을 읽어서 청크로 나누고 PGVector에 저장합니다.
+지식 파일과 리뷰 덤프(app/data/*.json)를 읽어서 청크로 나누고 PGVector에 저장합니다.
+진행 상황은 RecordManager에 기록되어, 다시 실행하면 중단된 지점부터 이어서 처리합니다.
+
+사용법:
+    python -m app.build_knowledge_base [파일 또는 디렉터리 ...]
 """
 import os
 import sys
+from pathlib import Path
 from typing import List
 
-from langchain_core.documents import Document
+from langchain_classic.indexes import SQLRecordManager
 from langchain_openai import OpenAIEmbeddings
 from langchain_postgres import PGVector
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from app.services.embedding_ingest_service import EmbeddingIngestService, IngestStats
+
+# 기본 인덱싱 대상: 지식 파일 디렉터리 + 영화 리뷰 덤프
+DEFAULT_KNOWLEDGE_PATHS = [
+    "/knowledge",
+    str(Path(__file__).resolve().parent / "data"),
+]
 
 
 def print_banner(text: str) -> None:
@@ -20,44 +32,28 @@ def print_banner(text: str) -> None:
     print("=" * 70)
 
 
-def load_knowledge_file(file_path: str) -> str:
-    """지식 파일을 읽어옵니다."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
-    except FileNotFoundError:
-        print(f"❌ 파일을 찾을 수 없습니다: {file_path}")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ 파일 읽기 실패: {e}")
-        sys.exit(1)
-
-
-def split_text_into_chunks(text: str, chunk_size: int = 500, chunk_overlap: int = 50) -> List[Document]:
-    """텍스트를 청크로 분할합니다."""
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=chunk_size,
-        chunk_overlap=chunk_overlap,
-        separators=["\n## ", "\n### ", "\n\n", "\n", " ", ""],
-        length_function=len,
-    )
+def get_knowledge_paths() -> List[str]:
+    """
+    인덱싱할 경로 목록을 반환합니다.
 
-    chunks = text_splitter.split_text(text)
+    명령행 인자 > KNOWLEDGE_PATHS 환경 변수(콤마 구분) > 기본 경로 순으로 사용하며,
+    존재하지 않는 경로는 제외합니다.
+    """
+    if len(sys.argv) > 1:
+        paths = sys.argv[1:]
+    elif os.getenv("KNOWLEDGE_PATHS"):
+        paths = [p.strip() for p in os.getenv("KNOWLEDGE_PATHS", "").split(",") if p.strip()]
+    else:
+        paths = DEFAULT_KNOWLEDGE_PATHS
+    return [p for p in paths if os.path.exists(p)]
 
-    # Document 객체로 변환
-    documents = []
-    for i, chunk in enumerate(chunks):
-        doc = Document(
-            page_content=chunk,
-            metadata={
-                "chunk_id": i,
-                "source": "knowledge_base",
-                "total_chunks": len(chunks)
-            }
-        )
-        documents.append(doc)
 
-    return documents
+def print_progress(stats: IngestStats) -> None:
+    """배치가 끝날 때마다 진행 상황을 출력합니다."""
+    print(
+        f"   [배치 {stats.batches}] 파일 {stats.files}개 / 청크 {stats.chunks}개 "
+        f"(추가 {stats.num_added}, 건너뜀 {stats.num_skipped}, 실패 {len(stats.errors)})"
+    )
 
 
 def build_knowledge_base() -> None:
@@ -70,38 +66,18 @@ def build_knowledge_base() -> None:
         print("\n❌ OPENAI_API_KEY가 설정되지 않았습니다!")
         sys.exit(1)
 
-    # Step 1: 지식 파일 읽기
-    print_banner("Step 1: 지식 파일 읽기")
-
-    knowledge_file = "/knowledge/sample_knowledge.txt"
-    print(f"\n📖 파일 경로: {knowledge_file}")
+    # Step 1: 인덱싱 대상 확인
+    print_banner("Step 1: 인덱싱 대상 확인")
 
-    content = load_knowledge_file(knowledge_file)
-    print(f"✅ 파일 읽기 성공!")
-    print(f"   총 문자 수: {len(content):,}")
-    print(f"   총 줄 수: {len(content.splitlines())}")
-
-    # Step 2: 텍스트 청크 분할
-    print_banner("Step 2: 텍스트 청크 분할")
-
-    print("\n🔪 텍스트를 작은 청크로 분할 중...")
-    print("   청크 크기: 500 문자")
-    print("   중복 영역: 50 문자")
-    print("   (청크 간 문맥 유지를 위해)")
-
-    documents = split_text_into_chunks(content)
-
-    print(f"\n✅ 분할 완료!")
-    print(f"   생성된 청크 수: {len(documents)}")
-
-    # 몇 개 샘플 출력
-    print("\n📄 샘플 청크 미리보기:")
-    for i, doc in enumerate(documents[:3], 1):
-        preview = doc.page_content[:100].replace('\n', ' ')
-        print(f"   [{i}] {preview}...")
+    knowledge_paths = get_knowledge_paths()
+    if not knowledge_paths:
+        print("❌ 인덱싱할 파일 또는 디렉터리를 찾을 수 없습니다")
+        sys.exit(1)
+    for path in knowledge_paths:
+        print(f"📖 경로: {path}")
 
-    # Step 3: OpenAI Embeddings 초기화
-    print_banner("Step 3: OpenAI Embeddings 초기화")
+    # Step 2: OpenAI Embeddings 초기화
+    print_banner("Step 2: OpenAI Embeddings 초기화")
 
     embeddings = OpenAIEmbeddings(
         model="text-embedding-3-small",
@@ -111,8 +87,8 @@ def build_knowledge_base() -> None:
     print("   모델: text-embedding-3-small")
     print("   벡터 차원: 1536")
 
-    # Step 4: PGVector 초기화
-    print_banner("Step 4: PGVector 데이터베이스 연결")
+    # Step 3: PGVector 초기화
+    print_banner("Step 3: PGVector 데이터베이스 연결")
 
     db_user = os.getenv("POSTGRES_USER", "langchain")
     db_password = os.getenv("POSTGRES_PASSWORD", "langchain123")
@@ -139,26 +115,47 @@ def build_knowledge_base() -> None:
         use_jsonb=True,
     )
 
+    # 인덱싱 진행 기록 (재실행 시 바뀌지 않은 청크는 건너뜀)
+    record_manager = SQLRecordManager(
+        f"pgvector/{collection_name}",
+        db_url=connection_string,
+    )
+    record_manager.create_schema()
+
     print("✅ 데이터베이스 연결 완료")
 
-    # Step 5: 벡터 저장
-    print_banner("Step 5: 문서를 벡터로 변환하여 저장")
+    # Step 4: 분할 + 임베딩 + 저장
+    print_banner("Step 4: 문서를 청크로 나누어 벡터로 저장")
 
-    print(f"\n📤 {len(documents)}개의 청크를 벡터로 변환하여 저장 중...")
-    print("   (OpenAI API 호출 중 - 수 초 소요)")
-    print("   ⏳ 잠시만 기다려주세요...")
+    batch_size = int(os.getenv("INGEST_BATCH_SIZE", "64"))
+    max_concurrency = int(os.getenv("INGEST_MAX_CONCURRENCY", "4"))
+    print(f"\n📤 배치 크기 {batch_size}, 동시 배치 {max_concurrency}개로 인덱싱 중...")
+    print("   청크 크기: 500 문자 / 중복 영역: 50 문자")
+    print("   (이미 인덱싱된 청크는 임베딩 없이 건너뜁니다)")
 
-    try:
-        ids = vector_store.add_documents(documents)
-        print(f"\n✅ 저장 완료!")
-        print(f"   저장된 문서 ID: {len(ids)}개")
-        print(f"   첫 3개 ID: {ids[:3]}")
-    except Exception as e:
-        print(f"\n❌ 저장 실패: {e}")
+    service = EmbeddingIngestService(
+        vector_store=vector_store,
+        record_manager=record_manager,
+        batch_size=batch_size,
+        max_concurrency=max_concurrency,
+    )
+    stats = service.ingest(knowledge_paths, on_batch=print_progress)
+
+    print(f"\n✅ 인덱싱 완료!")
+    print(f"   처리한 파일: {stats.files}개")
+    print(f"   생성된 청크: {stats.chunks}개")
+    print(f"   추가: {stats.num_added} / 갱신: {stats.num_updated} / "
+          f"건너뜀: {stats.num_skipped} / 삭제: {stats.num_deleted}")
+
+    if stats.errors:
+        print(f"\n❌ 실패한 배치 {len(stats.errors)}개:")
+        for error in stats.errors[:5]:
+            print(f"   - {error}")
+        print("   다시 실행하면 실패한 배치부터 이어서 처리합니다.")
         sys.exit(1)
 
-    # Step 6: 저장 확인 (테스트 검색)
-    print_banner("Step 6: 저장 확인 (테스트 검색)")
+    # Step 5: 저장 확인 (테스트 검색)
+    print_banner("Step 5: 저장 확인 (테스트 검색)")
 
     test_queries = [
         "LangChain이 뭐야?",
@@ -181,7 +178,9 @@ def build_knowledge_base() -> None:
     # Step 7: 비용 정보
     print_banner("💰 예상 비용")
 
-    total_chars = sum(len(doc.page_content) for doc in documents)
+    # 이번 실행에서 새로 임베딩한 청크 비율만큼만 비용이 발생
+    embedded_ratio = (stats.num_added + stats.num_updated) / max(stats.chunks, 1)
+    total_chars = int(stats.characters * embedded_ratio)
     estimated_tokens = int(total_chars * 1.3)  # 문자를 토큰으로 대략 변환
     cost = (estimated_tokens / 1_000_000) * 0.02
 
@@ -197,7 +196,7 @@ def build_knowledge_base() -> None:
     print(f"\n🎉 성공적으로 지식 베이스를 구축했습니다!")
     print(f"\n📊 구축 결과:")
     print(f"   • Collection: {collection_name}")
-    print(f"   • 저장된 청크: {len(documents)}개")
+    print(f"   • 저장된 청크: {stats.chunks}개")
     print(f"   • 벡터 차원: 1536")
     print(f"   • 임베딩 모델: text-embedding-3-small")
     print(f"\n다음 단계:")
@@ -38,3 +38,27 @@ def get_db_settings() -> DatabaseSettings:
         sslmode=os.getenv("POSTGRES_SSLMODE", "require"),
     )
 
+
+@dataclass
+class VectorCacheSettings:
+    """벡터 검색 캐시 설정"""
+
+    enabled: bool = True
+    max_embeddings: int = 4096
+    max_results: int = 1024
+    ttl_seconds: float = 300.0
+
+
+@lru_cache()
+def get_vector_cache_settings() -> VectorCacheSettings:
+    """
+    벡터 검색 캐시 설정을 반환합니다.
+
+    환경 변수에서 읽어오며, 없으면 기본값을 사용합니다.
+    """
+    return VectorCacheSettings(
+        enabled=os.getenv("VECTOR_CACHE_ENABLED", "true").lower() == "true",
+        max_embeddings=int(os.getenv("VECTOR_CACHE_MAX_EMBEDDINGS", "4096")),
+        max_results=int(os.getenv("VECTOR_CACHE_MAX_RESULTS", "1024")),
+        ttl_seconds=float(os.getenv("VECTOR_CACHE_TTL_SECONDS", "300")),
+    )
@@ -5,7 +5,15 @@ Repository 패키지
 """
 
 from app.repository.base import BaseVectorRepository
+from app.repository.cache import LRUTTLCache, VectorSearchCache
+from app.repository.cached_vector_repository import CachedVectorRepository
 from app.repository.vector_store_repository import PGVectorRepository
 
-__all__ = ["BaseVectorRepository", "PGVectorRepository"]
+__all__ = [
+    "BaseVectorRepository",
+    "CachedVectorRepository",
+    "LRUTTLCache",
+    "PGVectorRepository",
+    "VectorSearchCache",
+]
 
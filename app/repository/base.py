@@ -3,6 +3,7 @@ Repository 베이스 클래스
 
 데이터 접근의 추상 인터페이스를 정의합니다.
 """
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Tuple
 
@@ -42,6 +43,25 @@ class BaseVectorRepository(ABC):
         """
         pass
 
+    async def asearch_with_score(
+        self, query: str, k: int = 3
+    ) -> List[Tuple[Document, float]]:
+        """
+        유사도 점수와 함께 비동기 검색을 수행합니다.
+
+        기본 구현은 동기 search_with_score를 스레드 풀에서 실행하여
+        이벤트 루프를 막지 않습니다. 비동기 드라이버를 지원하는
+        구현체는 이 메서드를 오버라이드하세요.
+
+        Args:
+            query: 검색 쿼리
+            k: 반환할 문서 수
+
+        Returns:
+            (문서, 유사도 점수) 튜플 리스트
+        """
+        return await asyncio.to_thread(self.search_with_score, query, k)
+
     @abstractmethod
     def add_documents(self, documents: List[Document]) -> List[str]:
         """
@@ -0,0 +1,187 @@
+"""
+벡터 검색 캐시
+
+쿼리 임베딩과 검색 결과를 보관하는 LRU + TTL 캐시입니다.
+"""
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+from langchain_core.documents import Document
+
+V = TypeVar("V")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """
+    캐시 키로 쓸 수 있도록 쿼리를 정규화합니다.
+
+    유니코드 NFKC 정규화 후 앞뒤 공백을 제거하고 연속 공백을 하나로 합칩니다.
+
+    Args:
+        query: 검색 쿼리
+
+    Returns:
+        정규화된 쿼리
+    """
+    query = unicodedata.normalize("NFKC", query)
+    return _WHITESPACE.sub(" ", query).strip()
+
+
+class LRUTTLCache(Generic[V]):
+    """크기 제한(LRU)과 만료 시간(TTL)을 가진 스레드 안전 캐시"""
+
+    def __init__(self, max_size: int = 1024, ttl: Optional[float] = None):
+        """
+        캐시를 초기화합니다.
+
+        Args:
+            max_size: 최대 항목 수 (넘으면 가장 오래 사용하지 않은 항목 제거)
+            ttl: 항목 만료 시간(초) (None이면 만료 없음)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """
+        항목을 조회합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            캐시된 값 (없거나 만료되었으면 None)
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if self.ttl is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: Hashable, value: V) -> None:
+        """
+        항목을 저장합니다.
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else 0.0
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """모든 항목을 제거합니다."""
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/실패 횟수와 현재 크기를 반환합니다."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "size": len(self._data),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+            }
+
+
+ScoredDocuments = List[Tuple[Document, float]]
+
+
+class VectorSearchCache:
+    """
+    벡터 검색용 2단계 캐시
+
+    - 정규화된 쿼리 -> 임베딩
+    - (임베딩, k) -> (문서, 점수) 리스트
+
+    문서가 추가/삭제되면 invalidate()로 검색 결과 캐시를 비웁니다.
+    임베딩은 저장된 문서와 무관하므로 그대로 유지합니다.
+    """
+
+    def __init__(
+        self,
+        max_embeddings: int = 4096,
+        max_results: int = 1024,
+        ttl: Optional[float] = 300.0,
+    ):
+        """
+        캐시를 초기화합니다.
+
+        Args:
+            max_embeddings: 보관할 쿼리 임베딩 수
+            max_results: 보관할 검색 결과 수
+            ttl: 항목 만료 시간(초)
+        """
+        self.embeddings: LRUTTLCache[List[float]] = LRUTTLCache(max_embeddings, ttl)
+        self.results: LRUTTLCache[ScoredDocuments] = LRUTTLCache(max_results, ttl)
+        self.invalidations = 0
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """무효화될 때마다 증가하는 세대 번호"""
+        return self._generation
+
+    @staticmethod
+    def result_key(embedding: List[float], k: int) -> Hashable:
+        """검색 결과 캐시 키를 만듭니다."""
+        return (tuple(embedding), k)
+
+    def set_results(
+        self,
+        embedding: List[float],
+        k: int,
+        results: ScoredDocuments,
+        generation: int,
+    ) -> None:
+        """
+        검색 결과를 저장합니다.
+
+        검색 도중 무효화가 일어났다면(세대 번호가 바뀌었다면) 오래된
+        결과일 수 있으므로 저장하지 않습니다.
+
+        Args:
+            embedding: 쿼리 임베딩
+            k: 반환 문서 수
+            results: 검색 결과
+            generation: 검색을 시작할 때의 세대 번호
+        """
+        if generation == self._generation:
+            self.results.set(self.result_key(embedding, k), list(results))
+
+    def invalidate(self) -> None:
+        """검색 결과 캐시를 비웁니다."""
+        self._generation += 1
+        self.invalidations += 1
+        self.results.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중/실패 통계를 반환합니다."""
+        return {
+            "embeddings": self.embeddings.stats(),
+            "results": self.results.stats(),
+            "invalidations": self.invalidations,
+        }
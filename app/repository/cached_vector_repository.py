@@ -0,0 +1,130 @@
+"""
+캐시 Repository 구현
+
+PGVectorRepository 앞에서 쿼리 임베딩과 검색 결과를 캐시하는 Repository입니다.
+"""
+from typing import List, Tuple
+
+from langchain_core.documents import Document
+
+from app.repository.base import BaseVectorRepository
+from app.repository.cache import VectorSearchCache, normalize_query
+from app.repository.vector_store_repository import PGVectorRepository
+
+
+class CachedVectorRepository(BaseVectorRepository):
+    """
+    검색 캐시를 적용한 Repository 구현
+
+    같은(정규화 기준) 질문이 반복되면 임베딩 API와 벡터 검색을 건너뜁니다.
+    이 Repository를 거친 add_documents/delete_by_ids는 검색 결과 캐시를
+    자동으로 무효화합니다. 외부에서 직접 벡터 스토어를 수정하는 경우는
+    TTL이 지나야 반영됩니다.
+    """
+
+    def __init__(self, repository: PGVectorRepository, cache: VectorSearchCache):
+        """
+        캐시 Repository를 초기화합니다.
+
+        Args:
+            repository: 실제 검색을 수행할 PGVector Repository
+            cache: 벡터 검색 캐시
+        """
+        self.repository = repository
+        self.cache = cache
+
+    def search(self, query: str, k: int = 3) -> List[Document]:
+        """
+        유사도 검색을 수행합니다.
+
+        Args:
+            query: 검색 쿼리
+            k: 반환할 문서 수
+
+        Returns:
+            관련 문서 리스트
+        """
+        return [doc for doc, _ in self.search_with_score(query, k=k)]
+
+    def search_with_score(
+        self, query: str, k: int = 3
+    ) -> List[Tuple[Document, float]]:
+        """
+        유사도 점수와 함께 검색을 수행합니다.
+
+        Args:
+            query: 검색 쿼리
+            k: 반환할 문서 수
+
+        Returns:
+            (문서, 유사도 점수) 튜플 리스트
+        """
+        normalized = normalize_query(query)
+        embedding = self.cache.embeddings.get(normalized)
+        if embedding is None:
+            embedding = self.repository.embed_query(normalized)
+            self.cache.embeddings.set(normalized, embedding)
+
+        key = self.cache.result_key(embedding, k)
+        results = self.cache.results.get(key)
+        if results is None:
+            generation = self.cache.generation
+            results = self.repository.search_with_score_by_vector(embedding, k=k)
+            self.cache.set_results(embedding, k, results, generation)
+        return list(results)
+
+    async def asearch_with_score(
+        self, query: str, k: int = 3
+    ) -> List[Tuple[Document, float]]:
+        """
+        유사도 점수와 함께 비동기 검색을 수행합니다.
+
+        Args:
+            query: 검색 쿼리
+            k: 반환할 문서 수
+
+        Returns:
+            (문서, 유사도 점수) 튜플 리스트
+        """
+        normalized = normalize_query(query)
+        embedding = self.cache.embeddings.get(normalized)
+        if embedding is None:
+            embedding = await self.repository.aembed_query(normalized)
+            self.cache.embeddings.set(normalized, embedding)
+
+        key = self.cache.result_key(embedding, k)
+        results = self.cache.results.get(key)
+        if results is None:
+            generation = self.cache.generation
+            results = await self.repository.asearch_with_score_by_vector(
+                embedding, k=k
+            )
+            self.cache.set_results(embedding, k, results, generation)
+        return list(results)
+
+    def add_documents(self, documents: List[Document]) -> List[str]:
+        """
+        문서를 벡터 스토어에 추가하고 검색 결과 캐시를 무효화합니다.
+
+        Args:
+            documents: 추가할 문서 리스트
+
+        Returns:
+            추가된 문서의 ID 리스트
+        """
+        try:
+            return self.repository.add_documents(documents)
+        finally:
+            self.cache.invalidate()
+
+    def delete_by_ids(self, ids: List[str]) -> None:
+        """
+        ID로 문서를 삭제하고 검색 결과 캐시를 무효화합니다.
+
+        Args:
+            ids: 삭제할 문서 ID 리스트
+        """
+        try:
+            self.repository.delete_by_ids(ids)
+        finally:
+            self.cache.invalidate()
@@ -3,7 +3,8 @@ PGVector Repository 구현
 
 PGVector를 사용하는 구체적인 Repository 구현입니다.
 """
-from typing import List, Tuple
+import asyncio
+from typing import List, Optional, Tuple
 
 from langchain_core.documents import Document
 from langchain_postgres import PGVector
@@ -14,14 +15,21 @@ from app.repository.base import BaseVectorRepository
 class PGVectorRepository(BaseVectorRepository):
     """PGVector를 사용하는 Repository 구현"""
 
-    def __init__(self, vector_store: PGVector):
+    def __init__(
+        self,
+        vector_store: PGVector,
+        async_vector_store: Optional[PGVector] = None,
+    ):
         """
         PGVector Repository를 초기화합니다.
 
         Args:
             vector_store: PGVector 인스턴스
+            async_vector_store: async_mode=True로 생성된 PGVector 인스턴스
+                (None이면 비동기 검색을 스레드 풀에서 실행)
         """
         self.vector_store = vector_store
+        self.async_vector_store = async_vector_store
 
     def search(self, query: str, k: int = 3) -> List[Document]:
         """
@@ -51,6 +59,87 @@ class PGVectorRepository(BaseVectorRepository):
         """
         return self.vector_store.similarity_search_with_score(query, k=k)
 
+    async def asearch_with_score(
+        self, query: str, k: int = 3
+    ) -> List[Tuple[Document, float]]:
+        """
+        유사도 점수와 함께 비동기 검색을 수행합니다.
+
+        Args:
+            query: 검색 쿼리
+            k: 반환할 문서 수
+
+        Returns:
+            (문서, 유사도 점수) 튜플 리스트
+        """
+        if self.async_vector_store is None:
+            return await super().asearch_with_score(query, k=k)
+        return await self.async_vector_store.asimilarity_search_with_score(
+            query, k=k
+        )
+
+    def embed_query(self, query: str) -> List[float]:
+        """
+        쿼리를 임베딩합니다.
+
+        Args:
+            query: 검색 쿼리
+
+        Returns:
+            쿼리 임베딩 벡터
+        """
+        return self.vector_store.embeddings.embed_query(query)
+
+    async def aembed_query(self, query: str) -> List[float]:
+        """
+        쿼리를 비동기로 임베딩합니다.
+
+        Args:
+            query: 검색 쿼리
+
+        Returns:
+            쿼리 임베딩 벡터
+        """
+        return await self.vector_store.embeddings.aembed_query(query)
+
+    def search_with_score_by_vector(
+        self, embedding: List[float], k: int = 3
+    ) -> List[Tuple[Document, float]]:
+        """
+        임베딩 벡터로 유사도 점수와 함께 검색을 수행합니다.
+
+        Args:
+            embedding: 쿼리 임베딩 벡터
+            k: 반환할 문서 수
+
+        Returns:
+            (문서, 유사도 점수) 튜플 리스트
+        """
+        return self.vector_store.similarity_search_with_score_by_vector(
+            embedding, k=k
+        )
+
+    async def asearch_with_score_by_vector(
+        self, embedding: List[float], k: int = 3
+    ) -> List[Tuple[Document, float]]:
+        """
+        임베딩 벡터로 유사도 점수와 함께 비동기 검색을 수행합니다.
+
+        Args:
+            embedding: 쿼리 임베딩 벡터
+            k: 반환할 문서 수
+
+        Returns:
+            (문서, 유사도 점수) 튜플 리스트
+        """
+        if self.async_vector_store is None:
+            return await asyncio.to_thread(
+                self.search_with_score_by_vector, embedding, k
+            )
+        return await self.async_vector_store.asimilarity_search_with_score_by_vector(
+            embedding, k=k
+        )
+
     def add_documents(self, documents: List[Document]) -> List[str]:
         """
         문서를 벡터 스토어에 추가합니다.
@@ -10,17 +10,23 @@ chat_router.py
 POST /api/chat
 세션 ID, 메시지 리스트 등을 받아 대화형 응답 반환.
 
+POST /api/chat/rag/stream
+RAG 답변을 Server-Sent Events로 스트리밍.
+
 QLoRA 파인튜닝 및 대화 엔드포인트 포함.
 
 """
 
-from typing import Any, Dict, List, Optional
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from app.api.dependencies import get_chat_service
+from app.api.dependencies import get_chat_service, get_stream_metrics_recorder
 from app.services.chat_service import ChatService
+from app.services.stream_metrics import StreamMetricsRecorder
 
 # QLoRA 모델을 저장하는 전역 변수
 _qlora_model = None
@@ -85,12 +91,58 @@ async def chat_rag(
     지식 베이스를 검색하여 관련 문서를 찾고, LLM으로 답변을 생성합니다.
     """
     try:
-        result = chat_service.chat_rag(request.message)
+        result = await chat_service.achat_rag(request.message)
         return ChatResponse(**result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _format_sse(event: str, data: Dict[str, Any]) -> str:
+    """Server-Sent Events 형식의 메시지를 만듭니다."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@chat_router.post("/rag/stream")
+async def chat_rag_stream(
+    request: ChatRequest, chat_service: ChatService = Depends(get_chat_service)
+):
+    """
+    RAG 스트리밍 채팅 엔드포인트 (Server-Sent Events)
+
+    이벤트 순서:
+        sources: 출처 정보 (검색 직후 가장 먼저 전송)
+        token: 답변 조각 (생성되는 대로 전송)
+        metrics: 첫 토큰 지연(ms)과 초당 토큰 수
+        done: 스트림 종료
+    오류가 발생하면 error 이벤트를 보내고 종료합니다.
+    """
+
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            async for event, data in chat_service.astream_chat_rag(request.message):
+                yield _format_sse(event, data)
+        except Exception as e:
+            yield _format_sse("error", {"detail": str(e)})
+            return
+        yield _format_sse("done", {})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@chat_router.get("/rag/stream/metrics")
+async def chat_rag_stream_metrics(
+    recorder: StreamMetricsRecorder = Depends(get_stream_metrics_recorder),
+):
+    """
+    최근 스트리밍 요청들의 첫 토큰 지연과 초당 토큰 수를 반환합니다.
+    """
+    return {"summary": recorder.summary(), "recent": recorder.recent()}
+
+
 @chat_router.post("/general", response_model=ChatResponse)
 async def chat_general(
     request: ChatRequest, chat_service: ChatService = Depends(get_chat_service)
@@ -101,7 +153,7 @@ async def chat_general(
     지식 베이스 검색 없이 LLM만 사용하여 답변을 생성합니다.
     """
     try:
-        result = chat_service.chat_general(request.message)
+        result = await chat_service.achat_general(request.message)
         return ChatResponse(**result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -3,9 +3,15 @@
 
 서버 상태를 확인하는 엔드포인트입니다.
 """
-from fastapi import APIRouter
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
+from app.api.dependencies import get_vector_cache
+from app.config.settings import get_vector_cache_settings
+from app.repository.cache import VectorSearchCache
+
 
 class HealthResponse(BaseModel):
     """헬스체크 응답 모델"""
@@ -13,6 +19,14 @@ class HealthResponse(BaseModel):
     message: str
 
 
+class CacheStatsResponse(BaseModel):
+    """벡터 검색 캐시 통계 응답 모델"""
+    enabled: bool
+    embeddings: Dict[str, Any]
+    results: Dict[str, Any]
+    invalidations: int
+
+
 health_router = APIRouter(tags=["health"])
 
 
@@ -24,3 +38,11 @@ async def health_check():
         message="RAG Chatbot API is running"
     )
 
+
+@health_router.get("/health/cache", response_model=CacheStatsResponse)
+async def cache_stats(cache: VectorSearchCache = Depends(get_vector_cache)):
+    """벡터 검색 캐시의 적중/실패 통계 엔드포인트"""
+    return CacheStatsResponse(
+        enabled=get_vector_cache_settings().enabled,
+        **cache.stats()
+    )
@@ -0,0 +1,216 @@
+"""
+RAG 채팅 동시성 벤치마크
+
+스텁 LLM과 로컬 InMemoryVectorStore를 사용하여 /api/chat/rag 핸들러의
+처리량(requests/sec)을 기존 동기 경로(chat_rag)와 비동기 경로(achat_rag)로
+비교합니다. 하나의 이벤트 루프(= uvicorn 워커 1개)에서 동시 요청을 처리하는
+상황을 재현합니다.
+
+실행:
+    python -m app.scripts.benchmark_chat_concurrency --requests 200 --concurrency 50
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding, Embeddings
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.vectorstores import InMemoryVectorStore
+
+from app.models.base import BaseEmbeddings, BaseLLM
+from app.repository.base import BaseVectorRepository
+from app.services.chat_service import ChatService
+from app.services.rag_service import RAGService
+
+
+class StubChatModel(BaseChatModel):
+    """고정 지연 후 고정 답변을 반환하는 스텁 채팅 모델"""
+
+    latency: float = 0.05
+
+    @property
+    def _llm_type(self) -> str:
+        return "stub-chat-model"
+
+    def _result(self) -> ChatResult:
+        message = AIMessage(content="답변: 벤치마크용 스텁 응답입니다.")
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        time.sleep(self.latency)
+        return self._result()
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        await asyncio.sleep(self.latency)
+        return self._result()
+
+
+class StubLLM(BaseLLM):
+    """StubChatModel을 제공하는 LLM 제공자"""
+
+    def __init__(self, latency: float):
+        self.model = StubChatModel(latency=latency)
+
+    def get_model(self) -> BaseChatModel:
+        return self.model
+
+    def get_model_name(self) -> str:
+        return "stub"
+
+    def get_model_config(self) -> dict[str, Any]:
+        return {"latency": self.model.latency}
+
+
+class StubEmbeddings(BaseEmbeddings):
+    """DeterministicFakeEmbedding을 제공하는 Embeddings 제공자"""
+
+    def __init__(self, size: int = 64):
+        self.embeddings = DeterministicFakeEmbedding(size=size)
+
+    def get_embeddings(self) -> Embeddings:
+        return self.embeddings
+
+    def get_model_name(self) -> str:
+        return "deterministic-fake"
+
+    def get_model_config(self) -> dict[str, Any]:
+        return {"size": self.embeddings.size}
+
+
+class LocalVectorRepository(BaseVectorRepository):
+    """
+    InMemoryVectorStore 기반 Repository
+
+    PGVector 왕복 시간을 흉내 내기 위해 검색마다 고정 지연을 추가하고,
+    점수는 PGVector의 코사인 거리와 같은 의미(작을수록 유사)로 변환합니다.
+    """
+
+    def __init__(self, embeddings: Embeddings, latency: float):
+        self.vector_store = InMemoryVectorStore(embedding=embeddings)
+        self.latency = latency
+
+    def search(self, query: str, k: int = 3) -> List[Document]:
+        return [doc for doc, _ in self.search_with_score(query, k=k)]
+
+    def search_with_score(
+        self, query: str, k: int = 3
+    ) -> List[Tuple[Document, float]]:
+        time.sleep(self.latency)
+        results = self.vector_store.similarity_search_with_score(query, k=k)
+        return [(doc, 1 - score) for doc, score in results]
+
+    async def asearch_with_score(
+        self, query: str, k: int = 3
+    ) -> List[Tuple[Document, float]]:
+        await asyncio.sleep(self.latency)
+        results = await self.vector_store.asimilarity_search_with_score(query, k=k)
+        return [(doc, 1 - score) for doc, score in results]
+
+    def add_documents(self, documents: List[Document]) -> List[str]:
+        return self.vector_store.add_documents(documents)
+
+    def delete_by_ids(self, ids: List[str]) -> None:
+        self.vector_store.delete(ids=ids)
+
+
+def build_chat_service(llm_latency: float, db_latency: float) -> ChatService:
+    """스텁 모델과 로컬 벡터 스토어로 ChatService를 구성합니다."""
+    embeddings = StubEmbeddings()
+    repository = LocalVectorRepository(embeddings.get_embeddings(), db_latency)
+    repository.add_documents(
+        [Document(page_content=f"지식 베이스 문서 {i}") for i in range(100)]
+    )
+    rag_service = RAGService(
+        llm=StubLLM(llm_latency),
+        embeddings=embeddings,
+        repository=repository,
+        # 스텁 임베딩은 의미가 없으므로 모든 문서를 관련 문서로 취급
+        similarity_threshold=2.0,
+    )
+    return ChatService(rag_service=rag_service)
+
+
+async def run_load(handler, num_requests: int, concurrency: int) -> float:
+    """
+    동시 요청을 실행하고 requests/sec를 반환합니다.
+
+    Args:
+        handler: 메시지를 받아 응답을 반환하는 코루틴 함수
+        num_requests: 총 요청 수
+        concurrency: 동시에 진행 중인 최대 요청 수
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> dict:
+        async with semaphore:
+            return await handler(f"질문 {i % 10}")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(num_requests)))
+    elapsed = time.perf_counter() - start
+    return num_requests / elapsed
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    chat_service = build_chat_service(args.llm_latency, args.db_latency)
+
+    async def blocking_handler(message: str) -> dict:
+        # 기존 라우터: async def 안에서 동기 chat_rag 호출
+        return chat_service.chat_rag(message)
+
+    async def async_handler(message: str) -> dict:
+        return await chat_service.achat_rag(message)
+
+    print("=" * 60)
+    print("RAG 채팅 동시성 벤치마크")
+    print("=" * 60)
+    print(
+        f"요청 수: {args.requests}, 동시성: {args.concurrency}, "
+        f"LLM 지연: {args.llm_latency}s, DB 지연: {args.db_latency}s"
+    )
+
+    before = await run_load(blocking_handler, args.requests, args.concurrency)
+    print(f"동기 경로 (chat_rag):   {before:10.1f} req/s")
+
+    after = await run_load(async_handler, args.requests, args.concurrency)
+    print(f"비동기 경로 (achat_rag): {after:10.1f} req/s")
+    print(f"개선 배율: {after / before:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--llm-latency", type=float, default=0.05)
+    parser.add_argument("--db-latency", type=float, default=0.01)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -15,22 +15,31 @@ QLoRA 기반 파인튜닝 및 대화 지원.
 
 import os
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from langchain_core.documents import Document
 
 from app.services.rag_service import RAGService
+from app.services.stream_metrics import StreamMetrics, StreamMetricsRecorder
 
 
 class ChatService:
     """채팅 서비스 클래스"""
 
-    def __init__(self, rag_service: RAGService):
+    def __init__(
+        self,
+        rag_service: RAGService,
+        metrics_recorder: Optional[StreamMetricsRecorder] = None,
+    ):
         """
         채팅 서비스를 초기화합니다.
 
         Args:
             rag_service: RAG 서비스 인스턴스
+            metrics_recorder: 스트리밍 지표 기록기 (None이면 기록하지 않음)
         """
         self.rag_service = rag_service
+        self.metrics_recorder = metrics_recorder
 
     def chat_rag(self, message: str) -> dict:
         """
@@ -48,27 +57,120 @@ class ChatService:
         if not relevant_docs:
             # 관련 문서가 없으면 일반 대화 모드
             answer = self.rag_service.generate_answer(message, context=None)
-            sources = ["💬 출처: LLM (지식 베이스에 관련 문서 없음)"]
         else:
             # RAG 모드
-            docs = [doc for doc, score in relevant_docs]
-            context = "\n\n---\n\n".join([doc.page_content for doc in docs])
+            context = self.build_context(relevant_docs)
             answer = self.rag_service.generate_answer(message, context=context)
 
-            # 출처 정보 생성
-            sources = [f"📚 출처: {self.rag_service.llm.get_model_name()} + Vector DB"]
-            for doc, score in relevant_docs:
-                preview = doc.page_content[:80].replace("\n", " ").strip()
-                if len(doc.page_content) > 80:
-                    preview += "..."
-                sources.append(f"{preview} (유사도: {1 - score:.2f})")
+        return {
+            "answer": answer,
+            "sources": self.build_rag_sources(relevant_docs),
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    async def achat_rag(self, message: str) -> dict:
+        """
+        RAG 모드로 비동기 채팅합니다.
+
+        검색과 LLM 호출을 모두 await 하므로 이벤트 루프를 막지 않습니다.
+
+        Args:
+            message: 사용자 메시지
+
+        Returns:
+            답변과 출처 정보가 포함된 딕셔너리
+        """
+        # 관련 문서 검색
+        relevant_docs = await self.rag_service.asearch_relevant_documents(
+            message, k=3
+        )
+
+        if not relevant_docs:
+            # 관련 문서가 없으면 일반 대화 모드
+            answer = await self.rag_service.agenerate_answer(message, context=None)
+        else:
+            # RAG 모드
+            context = self.build_context(relevant_docs)
+            answer = await self.rag_service.agenerate_answer(message, context=context)
 
         return {
             "answer": answer,
-            "sources": sources,
+            "sources": self.build_rag_sources(relevant_docs),
             "timestamp": datetime.now().isoformat(),
         }
 
+    async def astream_chat_rag(
+        self, message: str
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        RAG 모드로 답변을 스트리밍합니다.
+
+        출처 정보를 가장 먼저 보내고, 이어서 답변 조각을, 마지막으로
+        첫 토큰 지연과 초당 토큰 수 지표를 보냅니다.
+
+        Args:
+            message: 사용자 메시지
+
+        Yields:
+            (이벤트 이름, 데이터) 튜플 - "sources", "token", "metrics"
+        """
+        metrics = StreamMetrics()
+
+        relevant_docs = await self.rag_service.asearch_relevant_documents(
+            message, k=3
+        )
+        context = self.build_context(relevant_docs) if relevant_docs else None
+
+        yield "sources", {
+            "sources": self.build_rag_sources(relevant_docs),
+            "timestamp": datetime.now().isoformat(),
+        }
+
+        async for text in self.rag_service.astream_answer(
+            message, context=context, metrics=metrics
+        ):
+            yield "token", {"content": text}
+
+        metrics.finish()
+        if self.metrics_recorder is not None:
+            self.metrics_recorder.record(metrics)
+        yield "metrics", metrics.to_dict()
+
+    def build_context(self, relevant_docs: List[Tuple[Document, float]]) -> str:
+        """
+        검색된 문서들을 하나의 컨텍스트 문자열로 합칩니다.
+
+        Args:
+            relevant_docs: (문서, 유사도 점수) 튜플 리스트
+
+        Returns:
+            프롬프트에 넣을 컨텍스트
+        """
+        return "\n\n---\n\n".join([doc.page_content for doc, _ in relevant_docs])
+
+    def build_rag_sources(
+        self, relevant_docs: List[Tuple[Document, float]]
+    ) -> List[str]:
+        """
+        RAG 응답의 출처 정보를 생성합니다.
+
+        Args:
+            relevant_docs: (문서, 유사도 점수) 튜플 리스트
+
+        Returns:
+            출처 문자열 리스트
+        """
+        if not relevant_docs:
+            return ["💬 출처: LLM (지식 베이스에 관련 문서 없음)"]
+
+        sources = [f"📚 출처: {self.rag_service.llm.get_model_name()} + Vector DB"]
+        for doc, score in relevant_docs:
+            preview = doc.page_content[:80].replace("\n", " ").strip()
+            if len(doc.page_content) > 80:
+                preview += "..."
+            sources.append(f"{preview} (유사도: {1 - score:.2f})")
+        return sources
+
     def chat_general(self, message: str) -> dict:
         """
         일반 대화 모드로 채팅합니다.
@@ -88,6 +190,25 @@ class ChatService:
             "timestamp": datetime.now().isoformat(),
         }
 
+    async def achat_general(self, message: str) -> dict:
+        """
+        일반 대화 모드로 비동기 채팅합니다.
+
+        Args:
+            message: 사용자 메시지
+
+        Returns:
+            답변과 출처 정보가 포함된 딕셔너리
+        """
+        answer = await self.rag_service.agenerate_answer(message, context=None)
+        model_name = self.rag_service.llm.get_model_name()
+
+        return {
+            "answer": answer,
+            "sources": [f"💬 출처: {model_name} (일반 대화 모드)"],
+            "timestamp": datetime.now().isoformat(),
+        }
+
     def load_qlora_model(
         self,
         model_name: str = "beomi/Llama-3-Open-Ko-8B",
@@ -5,3 +5,245 @@
 
 배치/주기적인 인덱싱 작업도 이 서비스 레벨에서 처리.
 """
+
+import json
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Literal, Optional, Set, Union
+
+from langchain_core.documents import Document
+from langchain_core.indexing import IndexingResult, RecordManager, index
+from langchain_core.vectorstores import VectorStore
+from langchain_text_splitters import RecursiveCharacterTextSplitter, TextSplitter
+
+# 텍스트로 읽어들일 파일 확장자 (JSON은 리뷰 덤프로 별도 처리)
+TEXT_SUFFIXES = {".txt", ".md"}
+
+
+@dataclass
+class IngestStats:
+    """인덱싱 실행 결과 통계"""
+
+    files: int = 0
+    chunks: int = 0
+    characters: int = 0
+    batches: int = 0
+    num_added: int = 0
+    num_updated: int = 0
+    num_skipped: int = 0
+    num_deleted: int = 0
+    errors: List[str] = field(default_factory=list)
+
+    def add_result(self, result: IndexingResult) -> None:
+        """배치 하나의 IndexingResult를 합산합니다."""
+        self.batches += 1
+        self.num_added += result["num_added"]
+        self.num_updated += result["num_updated"]
+        self.num_skipped += result["num_skipped"]
+        self.num_deleted += result["num_deleted"]
+
+
+class EmbeddingIngestService:
+    """
+    지식 베이스 인덱싱 서비스
+
+    디렉터리의 파일을 하나씩 읽어 청크로 나누고, 배치 단위로 동시에
+    임베딩하여 벡터 스토어에 저장합니다. 진행 상황은 RecordManager에
+    기록되므로(langchain_core.indexing.index) 다시 실행하면 바뀌지 않은
+    청크는 임베딩 없이 건너뛰고 중단된 지점부터 이어서 처리합니다.
+    """
+
+    def __init__(
+        self,
+        vector_store: VectorStore,
+        record_manager: RecordManager,
+        text_splitter: Optional[TextSplitter] = None,
+        batch_size: int = 64,
+        max_concurrency: int = 4,
+        cleanup: Optional[Literal["incremental"]] = "incremental",
+    ):
+        """
+        인덱싱 서비스를 초기화합니다.
+
+        Args:
+            vector_store: 청크를 저장할 벡터 스토어
+            record_manager: 인덱싱 기록을 보관할 RecordManager (스키마 생성 완료)
+            text_splitter: 텍스트 분할기 (None이면 기본 RecursiveCharacterTextSplitter)
+            batch_size: 한 배치에 담을 최소 청크 수
+            max_concurrency: 동시에 임베딩/저장할 최대 배치 수
+            cleanup: "incremental"이면 같은 파일에서 사라진 청크를 삭제
+        """
+        self.vector_store = vector_store
+        self.record_manager = record_manager
+        self.text_splitter = text_splitter or RecursiveCharacterTextSplitter(
+            chunk_size=500,
+            chunk_overlap=50,
+            separators=["\n## ", "\n### ", "\n\n", "\n", " ", ""],
+            length_function=len,
+        )
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.cleanup = cleanup
+
+    def iter_files(self, paths: Iterable[Union[str, Path]]) -> Iterator[Path]:
+        """
+        경로 목록에서 인덱싱할 파일을 정렬된 순서로 하나씩 반환합니다.
+
+        Args:
+            paths: 파일 또는 디렉터리 경로 목록 (디렉터리는 재귀 탐색)
+        """
+        for path in map(Path, paths):
+            if path.is_dir():
+                for file_path in sorted(path.rglob("*")):
+                    if file_path.is_file() and self._is_supported(file_path):
+                        yield file_path
+            elif path.is_file():
+                yield path
+            else:
+                raise FileNotFoundError(f"파일을 찾을 수 없습니다: {path}")
+
+    def _is_supported(self, path: Path) -> bool:
+        return path.suffix.lower() in TEXT_SUFFIXES | {".json"}
+
+    def load_file(self, path: Path) -> Iterator[Document]:
+        """
+        파일 하나를 Document로 읽어옵니다.
+
+        JSON 파일은 리뷰 덤프(app/data/*.json)처럼 객체 리스트로 보고
+        항목마다 Document를 만듭니다. "review" 필드가 있으면 본문으로,
+        나머지 필드는 메타데이터로 사용합니다.
+
+        Args:
+            path: 읽을 파일 경로
+        """
+        source = str(path)
+        if path.suffix.lower() != ".json":
+            yield Document(
+                page_content=path.read_text(encoding="utf-8"),
+                metadata={"source": source},
+            )
+            return
+
+        with open(path, "r", encoding="utf-8") as f:
+            records = json.load(f)
+        if isinstance(records, dict):
+            records = [records]
+
+        for record in records:
+            if isinstance(record, dict) and "review" in record:
+                metadata = {k: v for k, v in record.items() if k != "review"}
+                content = str(record["review"])
+            else:
+                metadata = {}
+                content = json.dumps(record, ensure_ascii=False)
+            metadata["source"] = source
+            yield Document(page_content=content, metadata=metadata)
+
+    def split_file(self, path: Path) -> List[Document]:
+        """
+        파일 하나를 읽어 청크 리스트로 분할합니다.
+
+        청크 순번/개수 같은 위치 정보는 메타데이터에 넣지 않습니다.
+        메타데이터도 청크 해시에 포함되므로, 파일에 내용이 조금만 추가되어도
+        모든 청크가 바뀐 것으로 보고 다시 임베딩하게 됩니다.
+
+        Args:
+            path: 읽을 파일 경로
+
+        Returns:
+            청크 리스트
+        """
+        return self.text_splitter.split_documents(self.load_file(path))
+
+    def iter_batches(
+        self, paths: Iterable[Union[str, Path]], stats: Optional[IngestStats] = None
+    ) -> Iterator[List[Document]]:
+        """
+        파일을 스트리밍하며 청크 배치를 만듭니다.
+
+        한 파일의 청크는 항상 같은 배치에 들어갑니다. 그래야 incremental
+        cleanup이 동시에 처리 중인 다른 배치의 청크를 지우지 않습니다.
+
+        Args:
+            paths: 파일 또는 디렉터리 경로 목록
+            stats: 파일/청크 수를 누적할 통계 객체
+        """
+        batch: List[Document] = []
+        for path in self.iter_files(paths):
+            chunks = self.split_file(path)
+            if stats is not None:
+                stats.files += 1
+                stats.chunks += len(chunks)
+                stats.characters += sum(len(c.page_content) for c in chunks)
+            batch.extend(chunks)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def index_batch(self, batch: List[Document]) -> IndexingResult:
+        """
+        배치 하나를 임베딩하여 저장하고 RecordManager에 기록합니다.
+
+        Args:
+            batch: 청크 리스트
+
+        Returns:
+            추가/갱신/건너뜀/삭제 개수
+        """
+        # 배치를 index() 안에서 다시 나누면 incremental cleanup이 같은 파일의
+        # 아직 처리되지 않은 청크를 지웠다가 다시 추가하므로 한 번에 넘깁니다.
+        return index(
+            batch,
+            self.record_manager,
+            self.vector_store,
+            batch_size=len(batch),
+            cleanup=self.cleanup,
+            source_id_key="source",
+            key_encoder="sha256",
+        )
+
+    def ingest(
+        self,
+        paths: Iterable[Union[str, Path]],
+        on_batch: Optional[Callable[[IngestStats], None]] = None,
+    ) -> IngestStats:
+        """
+        경로 목록의 모든 파일을 인덱싱합니다.
+
+        최대 max_concurrency개의 배치를 동시에 처리하며, 대기 중인 배치도
+        그 수만큼으로 제한하여 메모리 사용량을 일정하게 유지합니다.
+        실패한 배치는 errors에 기록하고 나머지 배치는 계속 처리합니다.
+        다시 실행하면 실패한 배치만 새로 임베딩됩니다.
+
+        Args:
+            paths: 파일 또는 디렉터리 경로 목록
+            on_batch: 배치가 끝날 때마다 현재 통계로 호출되는 콜백
+
+        Returns:
+            인덱싱 결과 통계
+        """
+        stats = IngestStats()
+        pending: Set[Future] = set()
+
+        def collect(done: Set[Future]) -> None:
+            for future in done:
+                try:
+                    stats.add_result(future.result())
+                except Exception as e:
+                    stats.errors.append(str(e))
+                if on_batch is not None:
+                    on_batch(stats)
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            for batch in self.iter_batches(paths, stats):
+                if len(pending) >= self.max_concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending.add(executor.submit(self.index_batch, batch))
+            done, _ = wait(pending)
+            collect(done)
+
+        return stats
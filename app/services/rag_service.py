@@ -17,14 +17,198 @@ rag_chain.py를 실제로 호출하는 “애플리케이션 서비스”.
 
 """
 
-from typing import List, Optional, Tuple
+from typing import AsyncIterator, List, Optional, Tuple
 
 from langchain_core.documents import Document
-from langchain_core.messages import SystemMessage
+from langchain_core.messages import BaseMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
 
 from app.models.base import BaseEmbeddings, BaseLLM
 from app.repository.base import BaseVectorRepository
+from app.services.stream_metrics import StreamMetrics
+
+# 답변에서 제거할 패턴들 (더 많이 추가)
+ANSWER_PATTERNS = [
+    "System:",
+    "시스템:",
+    "Human:",
+    "Answer:",
+    "답변:",
+    "질문:",
+    "질문에 자연스럽게 답변하세요.",
+    "질문에 답변하세요.",
+    "다음 문서 내용을 바탕으로 질문에 답하세요.",
+    "참고 문서:",
+    "H:",
+    "A:",
+]
+
+# 프롬프트 텍스트가 포함된 경우 제거
+PROMPT_INDICATORS = [
+    "질문에 자연스럽게 답변하세요",
+    "질문에 답변하세요",
+    "다음 문서 내용을 바탕으로",
+]
+
+
+def clean_answer_line(line: str) -> str:
+    """
+    답변 한 줄에서 메타 정보를 제거합니다.
+
+    Args:
+        line: 답변의 한 줄
+
+    Returns:
+        정리된 줄 (버려야 하는 줄이면 빈 문자열)
+    """
+    cleaned_line = line.strip()
+
+    # 완전히 패턴으로만 이루어진 라인은 건너뛰기
+    for pattern in ANSWER_PATTERNS:
+        if cleaned_line == pattern.rstrip(":").rstrip("?").rstrip("."):
+            return ""
+
+    # 라인 시작 부분의 패턴만 제거
+    for pattern in ANSWER_PATTERNS:
+        if cleaned_line.startswith(pattern):
+            return cleaned_line[len(pattern) :].strip()
+
+    return cleaned_line
+
+
+class StreamingAnswerCleaner:
+    """
+    스트리밍 답변에 clean_answer와 같은 정리를 점진적으로 적용합니다.
+
+    각 줄의 시작 부분은 패턴 길이만큼의 작은 lookahead 버퍼에 모아 두었다가
+    접두어 제거 여부가 결정되면 내보내고, 그 뒤로는 토큰을 바로 흘려보냅니다.
+    프롬프트 지시문은 답변 앞부분(lookahead 범위)에 나타난 경우에만 제거합니다.
+    """
+
+    def __init__(self, lookahead: Optional[int] = None):
+        """
+        스트리밍 정리기를 초기화합니다.
+
+        Args:
+            lookahead: 줄 시작 부분을 보류할 글자 수 (None이면 가장 긴 패턴 길이)
+        """
+        self.lookahead = lookahead or max(
+            len(text) for text in ANSWER_PATTERNS + PROMPT_INDICATORS
+        )
+        self._head_done = False
+        self._head_buffer = ""
+        self._indicators = list(PROMPT_INDICATORS)
+        self._line_buffer = ""
+        self._line_open = False
+        self._line_has_content = False
+        self._pending_whitespace = ""
+        self._emitted_any = False
+
+    def feed(self, text: str) -> str:
+        """
+        새로 생성된 텍스트 조각을 받아 지금 내보낼 수 있는 부분을 반환합니다.
+
+        Args:
+            text: 모델이 생성한 텍스트 조각
+
+        Returns:
+            정리된 텍스트 (아직 보류 중이면 빈 문자열)
+        """
+        if not self._head_done:
+            self._head_buffer += text
+            if len(self._head_buffer.strip()) < self.lookahead:
+                return ""
+            text = self._consume_head(final=False)
+            if not self._head_done:
+                return ""
+        return self._feed_lines(text)
+
+    def flush(self) -> str:
+        """스트림이 끝났을 때 보류 중인 텍스트를 정리하여 반환합니다."""
+        output = ""
+        if not self._head_done:
+            output += self._feed_lines(self._consume_head(final=True))
+        if not self._line_open and self._line_buffer:
+            output += self._emit_line(clean_answer_line(self._line_buffer))
+        self._line_buffer = ""
+        self._line_open = False
+        self._pending_whitespace = ""
+        return output
+
+    def _consume_head(self, final: bool) -> str:
+        """답변 앞부분에 섞인 프롬프트 지시문을 제거합니다."""
+        found = False
+        for indicator in list(self._indicators):
+            if indicator in self._head_buffer:
+                self._head_buffer = self._head_buffer.split(indicator, 1)[1]
+                self._indicators.remove(indicator)
+                found = True
+
+        # 지시문을 잘라낸 뒤 남은 부분이 짧으면 조금 더 기다림
+        if found and not final and len(self._head_buffer.strip()) < self.lookahead:
+            return ""
+
+        self._head_done = True
+        head, self._head_buffer = self._head_buffer, ""
+        return head
+
+    def _feed_lines(self, text: str) -> str:
+        output = ""
+        while text:
+            newline = text.find("\n")
+            segment = text if newline == -1 else text[:newline]
+            text = "" if newline == -1 else text[newline + 1 :]
+
+            if self._line_open:
+                output += self._stream_segment(segment)
+            elif newline == -1:
+                self._line_buffer += segment
+                if len(self._line_buffer.lstrip()) >= self.lookahead:
+                    output += self._open_line()
+            else:
+                output += self._emit_line(
+                    clean_answer_line(self._line_buffer + segment)
+                )
+
+            if newline != -1:
+                self._line_buffer = ""
+                self._line_open = False
+                self._line_has_content = False
+                self._pending_whitespace = ""
+        return output
+
+    def _open_line(self) -> str:
+        """줄 시작 부분이 충분히 모이면 접두어를 제거하고 스트리밍을 시작합니다."""
+        cleaned_line = self._line_buffer.lstrip()
+        for pattern in ANSWER_PATTERNS:
+            if cleaned_line.startswith(pattern):
+                cleaned_line = cleaned_line[len(pattern) :]
+                break
+        self._line_buffer = ""
+        self._line_open = True
+        return self._stream_segment(cleaned_line)
+
+    def _stream_segment(self, segment: str) -> str:
+        """열린 줄에 이어지는 텍스트를 내보내되 줄 끝 공백은 보류합니다."""
+        if not self._line_has_content:
+            segment = segment.lstrip()
+        body = self._pending_whitespace + segment
+        stripped = body.rstrip()
+        self._pending_whitespace = body[len(stripped) :]
+        if not stripped:
+            return ""
+        if self._line_has_content:
+            return stripped
+        self._line_has_content = True
+        return self._emit_line(stripped)
+
+    def _emit_line(self, line: str) -> str:
+        """새 줄의 첫 내용을 내보내며 필요하면 줄바꿈을 앞에 붙입니다."""
+        if not line:
+            return ""
+        prefix = "\n" if self._emitted_any else ""
+        self._emitted_any = True
+        return prefix + line
 
 
 class RAGService:
@@ -73,60 +257,19 @@ class RAGService:
         if not isinstance(answer, str):
             answer = str(answer)
 
-        # 제거할 패턴들 (더 많이 추가)
-        patterns = [
-            "System:",
-            "시스템:",
-            "Human:",
-            "Answer:",
-            "답변:",
-            "질문:",
-            "질문에 자연스럽게 답변하세요.",
-            "질문에 답변하세요.",
-            "다음 문서 내용을 바탕으로 질문에 답하세요.",
-            "참고 문서:",
-            "H:",
-            "A:",
-        ]
-
         result = answer.strip()
 
-        # 프롬프트 텍스트가 포함된 경우 제거
-        prompt_indicators = [
-            "질문에 자연스럽게 답변하세요",
-            "질문에 답변하세요",
-            "다음 문서 내용을 바탕으로",
-        ]
-
         # 프롬프트가 답변에 포함되어 있으면, 실제 답변 부분만 추출
-        for indicator in prompt_indicators:
+        for indicator in PROMPT_INDICATORS:
             if indicator in result:
                 parts = result.split(indicator, 1)
                 if len(parts) > 1:
                     result = parts[1].strip()
 
         # 각 줄에서 패턴을 찾아서 제거 (라인은 유지)
-        lines = result.split("\n")
         cleaned_lines = []
-
-        for line in lines:
-            cleaned_line = line.strip()
-
-            # 완전히 패턴으로만 이루어진 라인은 건너뛰기
-            skip_line = False
-            for pattern in patterns:
-                if cleaned_line == pattern.rstrip(":").rstrip("?").rstrip("."):
-                    skip_line = True
-                    break
-
-            if skip_line:
-                continue
-
-            # 라인 시작 부분의 패턴만 제거
-            for pattern in patterns:
-                if cleaned_line.startswith(pattern):
-                    cleaned_line = cleaned_line[len(pattern) :].strip()
-                    break
+        for line in result.split("\n"):
+            cleaned_line = clean_answer_line(line)
 
             # 빈 줄이 아니면 추가
             if cleaned_line:
@@ -150,41 +293,63 @@ class RAGService:
             (문서, 유사도 점수) 튜플 리스트
         """
         docs_with_scores = self.repository.search_with_score(query, k=k)
-        relevant_docs = [
+        return self._filter_by_threshold(docs_with_scores)
+
+    async def asearch_relevant_documents(
+        self, query: str, k: int = 3
+    ) -> List[Tuple[Document, float]]:
+        """
+        관련 문서를 비동기로 검색합니다.
+
+        Args:
+            query: 검색 쿼리
+            k: 반환할 문서 수
+
+        Returns:
+            (문서, 유사도 점수) 튜플 리스트
+        """
+        docs_with_scores = await self.repository.asearch_with_score(query, k=k)
+        return self._filter_by_threshold(docs_with_scores)
+
+    def _filter_by_threshold(
+        self, docs_with_scores: List[Tuple[Document, float]]
+    ) -> List[Tuple[Document, float]]:
+        """유사도 임계값을 넘지 않는 문서만 남깁니다."""
+        return [
             (doc, score)
             for doc, score in docs_with_scores
             if score <= self.similarity_threshold
         ]
-        return relevant_docs
 
-    def generate_answer(self, question: str, context: Optional[str] = None) -> str:
+    def build_prompt(
+        self, question: str, context: Optional[str] = None
+    ) -> List[BaseMessage]:
         """
-        답변을 생성합니다.
+        답변 생성용 프롬프트 메시지를 만듭니다.
 
         Args:
             question: 사용자 질문
             context: 컨텍스트 (None이면 일반 대화)
 
         Returns:
-            생성된 답변
+            LLM에 전달할 메시지 리스트
         """
         if context:
             # RAG 모드
             prompt_template = self.create_rag_prompt()
-            prompt = prompt_template.format_messages(context=context, question=question)
-        else:
-            # 일반 대화 모드
-            general_prompt = ChatPromptTemplate.from_messages(
-                [
-                    SystemMessage(content="질문에 자연스럽게 답변하세요."),
-                    ("human", "{question}"),
-                ]
-            )
-            prompt = general_prompt.format_messages(question=question)
+            return prompt_template.format_messages(context=context, question=question)
 
-        chat_model = self.llm.get_model()
-        response = chat_model.invoke(prompt)
+        # 일반 대화 모드
+        general_prompt = ChatPromptTemplate.from_messages(
+            [
+                SystemMessage(content="질문에 자연스럽게 답변하세요."),
+                ("human", "{question}"),
+            ]
+        )
+        return general_prompt.format_messages(question=question)
 
+    def _postprocess_response(self, response: BaseMessage) -> str:
+        """LLM 응답에서 답변 문자열을 추출하고 정리합니다."""
         # content가 str이 아닐 수 있으므로 안전하게 처리
         if isinstance(response.content, str):
             answer = response.content
@@ -192,6 +357,75 @@ class RAGService:
             answer = str(response.content)
 
         # 불필요한 메타 정보 제거
-        answer = self.clean_answer(answer)
+        return self.clean_answer(answer)
+
+    def generate_answer(self, question: str, context: Optional[str] = None) -> str:
+        """
+        답변을 생성합니다.
+
+        Args:
+            question: 사용자 질문
+            context: 컨텍스트 (None이면 일반 대화)
+
+        Returns:
+            생성된 답변
+        """
+        prompt = self.build_prompt(question, context)
+        chat_model = self.llm.get_model()
+        response = chat_model.invoke(prompt)
+        return self._postprocess_response(response)
+
+    async def agenerate_answer(
+        self, question: str, context: Optional[str] = None
+    ) -> str:
+        """
+        답변을 비동기로 생성합니다.
+
+        Args:
+            question: 사용자 질문
+            context: 컨텍스트 (None이면 일반 대화)
+
+        Returns:
+            생성된 답변
+        """
+        prompt = self.build_prompt(question, context)
+        chat_model = self.llm.get_model()
+        response = await chat_model.ainvoke(prompt)
+        return self._postprocess_response(response)
+
+    async def astream_answer(
+        self,
+        question: str,
+        context: Optional[str] = None,
+        metrics: Optional[StreamMetrics] = None,
+    ) -> AsyncIterator[str]:
+        """
+        답변을 토큰 단위로 스트리밍합니다.
+
+        clean_answer와 같은 정리를 StreamingAnswerCleaner로 점진적으로 적용합니다.
+
+        Args:
+            question: 사용자 질문
+            context: 컨텍스트 (None이면 일반 대화)
+            metrics: 모델 청크마다 토큰을 기록할 StreamMetrics
 
-        return answer
+        Yields:
+            정리된 답변 조각
+        """
+        prompt = self.build_prompt(question, context)
+        chat_model = self.llm.get_model()
+        cleaner = StreamingAnswerCleaner()
+
+        async for chunk in chat_model.astream(prompt):
+            text = chunk.content if isinstance(chunk.content, str) else chunk.text
+            if not text:
+                continue
+            if metrics is not None:
+                metrics.record_token()
+            cleaned = cleaner.feed(text)
+            if cleaned:
+                yield cleaned
+
+        remainder = cleaner.flush()
+        if remainder:
+            yield remainder
@@ -0,0 +1,104 @@
+"""
+스트리밍 지표
+
+스트리밍 응답의 첫 토큰 지연(TTFT)과 초당 토큰 수를 요청별로 기록합니다.
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Deque, Dict, List, Optional
+
+
+@dataclass
+class StreamMetrics:
+    """요청 하나의 스트리밍 지표"""
+
+    started_at: float = field(default_factory=time.perf_counter)
+    first_token_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    tokens: int = 0
+
+    def record_token(self) -> None:
+        """모델이 생성한 토큰(청크) 하나를 기록합니다."""
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+        self.tokens += 1
+
+    def finish(self) -> None:
+        """스트림 종료 시각을 기록합니다."""
+        self.finished_at = time.perf_counter()
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        """요청 시작부터 첫 토큰까지 걸린 시간(초)"""
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.started_at
+
+    @property
+    def tokens_per_second(self) -> Optional[float]:
+        """첫 토큰 이후의 생성 속도 (tokens/sec)"""
+        if self.first_token_at is None or self.finished_at is None:
+            return None
+        elapsed = self.finished_at - self.first_token_at
+        if elapsed <= 0:
+            return None
+        return self.tokens / elapsed
+
+    def to_dict(self) -> Dict[str, Optional[float]]:
+        """응답/로그에 쓸 수 있는 딕셔너리로 변환합니다."""
+        total = None
+        if self.finished_at is not None:
+            total = self.finished_at - self.started_at
+        return {
+            "time_to_first_token_ms": _to_ms(self.time_to_first_token),
+            "tokens": self.tokens,
+            "tokens_per_second": self.tokens_per_second,
+            "total_ms": _to_ms(total),
+        }
+
+
+def _to_ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else seconds * 1000
+
+
+class StreamMetricsRecorder:
+    """최근 요청들의 스트리밍 지표를 보관하는 기록기"""
+
+    def __init__(self, max_records: int = 1000):
+        """
+        기록기를 초기화합니다.
+
+        Args:
+            max_records: 보관할 최근 요청 수
+        """
+        self._records: Deque[Dict[str, Optional[float]]] = deque(maxlen=max_records)
+        self._lock = Lock()
+
+    def record(self, metrics: StreamMetrics) -> None:
+        """완료된 요청의 지표를 기록합니다."""
+        with self._lock:
+            self._records.append(metrics.to_dict())
+
+    def recent(self) -> List[Dict[str, Optional[float]]]:
+        """보관 중인 요청별 지표를 반환합니다."""
+        with self._lock:
+            return list(self._records)
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        """보관 중인 지표의 평균을 반환합니다."""
+        records = self.recent()
+
+        def mean(key: str) -> Optional[float]:
+            values = [r[key] for r in records if r[key] is not None]
+            return sum(values) / len(values) if values else None
+
+        return {
+            "requests": len(records),
+            "avg_time_to_first_token_ms": mean("time_to_first_token_ms"),
+            "avg_tokens_per_second": mean("tokens_per_second"),
+            "avg_total_ms": mean("total_ms"),
+        }
+
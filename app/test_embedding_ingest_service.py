@@ -0,0 +1,64 @@
+"""
+EmbeddingIngestService 테스트
+
+파일 하나의 청크가 batch_size보다 많아도, 바뀌지 않은 데이터를 다시
+인덱싱하면 아무것도 추가/삭제하지 않는지 확인합니다.
+"""
+import json
+from pathlib import Path
+
+from langchain_core.embeddings.fake import DeterministicFakeEmbedding
+from langchain_core.indexing import InMemoryRecordManager
+from langchain_core.vectorstores import InMemoryVectorStore
+
+from app.services.embedding_ingest_service import EmbeddingIngestService
+
+
+def test_rerun_on_unchanged_data_is_a_no_op(tmp_path: Path) -> None:
+    """리뷰 덤프 하나가 배치보다 커도 재실행 시 0 추가/0 삭제여야 합니다."""
+    reviews = [{"id": i, "review": f"리뷰 {i}번 내용입니다."} for i in range(41)]
+    (tmp_path / "reviews.json").write_text(
+        json.dumps(reviews, ensure_ascii=False), encoding="utf-8"
+    )
+    (tmp_path / "guide.md").write_text("## 안내\n\n짧은 문서입니다.", encoding="utf-8")
+
+    record_manager = InMemoryRecordManager(namespace="test")
+    record_manager.create_schema()
+    service = EmbeddingIngestService(
+        vector_store=InMemoryVectorStore(DeterministicFakeEmbedding(size=8)),
+        record_manager=record_manager,
+        batch_size=8,
+    )
+
+    first = service.ingest([tmp_path])
+    assert first.errors == []
+    assert first.num_added == first.chunks == 42
+
+    second = service.ingest([tmp_path])
+    assert second.errors == []
+    assert second.num_added == 0
+    assert second.num_deleted == 0
+    assert second.num_skipped == 42
+
+
+def test_appending_to_a_file_skips_unchanged_chunks(tmp_path: Path) -> None:
+    """파일 끝에 리뷰를 추가하면 기존 청크는 건너뛰고 새 청크만 추가해야 합니다."""
+    path = tmp_path / "reviews.json"
+    reviews = [{"id": i, "review": f"리뷰 {i}번 내용입니다."} for i in range(10)]
+    path.write_text(json.dumps(reviews, ensure_ascii=False), encoding="utf-8")
+
+    record_manager = InMemoryRecordManager(namespace="test")
+    record_manager.create_schema()
+    service = EmbeddingIngestService(
+        vector_store=InMemoryVectorStore(DeterministicFakeEmbedding(size=8)),
+        record_manager=record_manager,
+    )
+    assert service.ingest([path]).num_added == 10
+
+    reviews.append({"id": 10, "review": "새로 추가된 리뷰입니다."})
+    path.write_text(json.dumps(reviews, ensure_ascii=False), encoding="utf-8")
+    stats = service.ingest([path])
+    assert stats.errors == []
+    assert stats.num_skipped == 10
+    assert stats.num_added == 1
+    assert stats.num_deleted == 0
@@ -16,8 +16,10 @@ A cache is useful for two reasons:
 
 from __future__ import annotations
 
+import threading
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
+from concurrent.futures import Future
 from typing import Any
 
 from typing_extensions import override
@@ -233,3 +235,117 @@ class InMemoryCache(BaseCache):
     async def aclear(self, **kwargs: Any) -> None:
         """Async clear cache."""
         self.clear()
+
+
+class InFlightRequests:
+    """Registry of model calls currently running after a cache miss.
+
+    Concurrent identical requests (same prompt and `llm_string`) that all miss the
+    cache would otherwise each call the provider. Instead, the first caller becomes
+    the leader of the request and the others wait on its future, receiving the
+    same generations once the leader has written them to the cache.
+
+    If the leader raises an `Exception`, waiting callers raise it too. If the
+    leader is interrupted (e.g. its task is cancelled), waiting callers get `None`
+    and are expected to retry.
+
+    Chat models use the process-wide instance returned by
+    `get_in_flight_requests` whenever a cache is configured.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no request in flight."""
+        self._lock = threading.Lock()
+        self._futures: dict[tuple[str, str], Future[RETURN_VAL_TYPE | None]] = {}
+        self._num_calls = 0
+        self._num_suppressed = 0
+
+    @property
+    def num_calls(self) -> int:
+        """Number of requests that were sent to the model by a leader."""
+        return self._num_calls
+
+    @property
+    def num_suppressed(self) -> int:
+        """Number of duplicate requests that waited on a leader instead."""
+        return self._num_suppressed
+
+    def __len__(self) -> int:
+        """Number of requests currently in flight."""
+        return len(self._futures)
+
+    def join(
+        self, prompt: str, llm_string: str
+    ) -> tuple[Future[RETURN_VAL_TYPE | None], bool]:
+        """Join the in-flight request for `prompt` and `llm_string`.
+
+        Args:
+            prompt: A string representation of the prompt.
+            llm_string: A string representation of the LLM configuration.
+
+        Returns:
+            The future holding the request's generations, and whether the caller
+            is the leader. A leader must call `finish` with the same future once
+            it is done, whatever the outcome.
+        """
+        key = (prompt, llm_string)
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None:
+                future = self._futures[key] = Future()
+                self._num_calls += 1
+                return future, True
+            self._num_suppressed += 1
+            return future, False
+
+    def finish(
+        self,
+        prompt: str,
+        llm_string: str,
+        future: Future[RETURN_VAL_TYPE | None],
+        *,
+        result: RETURN_VAL_TYPE | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Complete a request led by the caller and wake up the waiting callers.
+
+        Args:
+            prompt: A string representation of the prompt.
+            llm_string: A string representation of the LLM configuration.
+            future: The future returned by `join`.
+            result: The generations produced by the model.
+            error: The error raised by the model call, if any. Errors that are not
+                `Exception` instances (e.g. cancellation) are not shared: waiting
+                callers get `None` and retry.
+        """
+        key = (prompt, llm_string)
+        with self._lock:
+            if self._futures.get(key) is future:
+                del self._futures[key]
+        if future.done():
+            return
+        if isinstance(error, Exception):
+            future.set_exception(error)
+        else:
+            future.set_result(None if error is not None else result)
+
+    def reset_stats(self) -> None:
+        """Reset the `num_calls` and `num_suppressed` counters."""
+        with self._lock:
+            self._num_calls = 0
+            self._num_suppressed = 0
+
+
+_IN_FLIGHT_REQUESTS = InFlightRequests()
+
+
+def get_in_flight_requests() -> InFlightRequests:
+    """Get the process-wide registry of in-flight cached model calls.
+
+    Its `num_calls` and `num_suppressed` counters show how many provider calls
+    were saved by coalescing identical concurrent requests.
+
+    Returns:
+        The shared `InFlightRequests` instance.
+    """
+    return _IN_FLIGHT_REQUESTS
@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import asyncio
 import atexit
+import collections
 import functools
 import logging
+import os
+import threading
 from abc import ABC, abstractmethod
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from contextlib import asynccontextmanager, contextmanager
-from contextvars import copy_context
+from contextvars import Context, ContextVar, copy_context
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 from uuid import UUID
 
@@ -315,26 +318,24 @@ def handle_event(
                 if handler.raise_error:
                     raise
     finally:
-        if coros:
-            try:
-                # Raises RuntimeError if there is no current event loop.
-                asyncio.get_running_loop()
-                loop_running = True
-            except RuntimeError:
-                loop_running = False
-
-            if loop_running:
-                # If we try to submit this coroutine to the running loop
-                # we end up in a deadlock, as we'd have gotten here from a
-                # running coroutine, which we cannot interrupt to run this one.
-                # The solution is to run the synchronous function on the globally shared
-                # thread pool executor to avoid blocking the main event loop.
+        dispatcher = _callback_dispatcher() if coros else _CALLBACK_DISPATCHER
+        if dispatcher is not None and dispatcher.in_loop_thread():
+            # A callback coroutine started a sync run: waiting on the dispatcher
+            # from its own thread would deadlock, so run the coroutines on the
+            # globally shared thread pool executor instead.
+            if coros:
                 _executor().submit(
                     cast("Callable", copy_context().run), _run_coros, coros
                 ).result()
-            else:
-                # If there's no running loop, we can run the coroutines directly.
-                _run_coros(coros)
+        elif dispatcher is not None:
+            run_id = kwargs.get("run_id")
+            if coros:
+                dispatcher.submit(coros, run_id)
+            # Runs start and end with all their callbacks handled: handlers
+            # such as the event stream look up the run in later events. Only the
+            # events of this run are waited for, not those of concurrent runs.
+            if event_name.endswith(("_start", "_end", "_error")):
+                dispatcher.flush(run_id)
 
 
 def _run_coros(coros: list[Coroutine[Any, Any, Any]]) -> None:
@@ -366,6 +367,182 @@ def _run_coros(coros: list[Coroutine[Any, Any, Any]]) -> None:
                 logger.warning("Error in callback coroutine: %s", repr(e))
 
 
+_EVENT_TASKS: ContextVar[set[asyncio.Task[Any]] | None] = ContextVar(
+    "_EVENT_TASKS", default=None
+)
+
+
+def _record_event_task(
+    loop: asyncio.AbstractEventLoop, coro: Any, **kwargs: Any
+) -> asyncio.Task[Any]:
+    """Task factory of the dispatcher loop recording the tasks of each event."""
+    task = asyncio.Task(coro, loop=loop, **kwargs)
+    if (tasks := _EVENT_TASKS.get()) is not None:
+        tasks.add(task)
+    return task
+
+
+class _AsyncCallbackDispatcher:
+    """Runs the coroutines of async callback handlers attached to sync runs.
+
+    Instead of creating an event loop for every event, which adds up quickly when
+    streaming tokens, the coroutines are queued to a long-lived event loop running
+    in a background thread. The events of a run are awaited one at a time, in
+    order, along with the tasks they schedule, while the events of different runs
+    are handled concurrently. Callers only wait for the events of their own run,
+    when it starts or ends (see `flush`), or when `max_pending` events of the run
+    are already queued.
+    """
+
+    def __init__(self, max_pending: int = 1000) -> None:
+        self._max_pending = max_pending
+        self._lock = threading.Lock()
+        # Futures of the events queued by each run, used by the callers' threads.
+        self._queued: dict[UUID | None, collections.deque[Future[None]]] = {}
+        # Task handling the last event of each run, used by the loop thread only.
+        self._tails: dict[UUID | None, asyncio.Task[None]] = {}
+        self._loop = asyncio.new_event_loop()
+        self._loop.set_task_factory(_record_event_task)
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="langchain-callbacks", daemon=True
+        )
+        self._thread.start()
+
+    def _schedule(
+        self,
+        run_id: UUID | None,
+        context: Context,
+        coros: list[Coroutine[Any, Any, Any]],
+        future: Future[None],
+    ) -> None:
+        previous = self._tails.get(run_id)
+        task = self._loop.create_task(self._handle(previous, context, coros, future))
+        self._tails[run_id] = task
+        task.add_done_callback(functools.partial(self._forget, run_id))
+
+    def _forget(self, run_id: UUID | None, task: asyncio.Task[None]) -> None:
+        if self._tails.get(run_id) is task:
+            del self._tails[run_id]
+
+    async def _handle(
+        self,
+        previous: asyncio.Task[None] | None,
+        context: Context,
+        coros: list[Coroutine[Any, Any, Any]],
+        future: Future[None],
+    ) -> None:
+        try:
+            if previous is not None:
+                await asyncio.wait([previous])
+            tasks: set[asyncio.Task[Any]] = set()
+            context.run(_EVENT_TASKS.set, tasks)
+            for coro in coros:
+                try:
+                    await context.run(self._loop.create_task, coro)
+                except Exception as e:
+                    logger.warning("Error in callback coroutine: %s", repr(e))
+            # Wait for the tasks scheduled by the coroutines, as these may be
+            # handling the event as well.
+            while pending := {task for task in tasks if not task.done()}:
+                await asyncio.wait(pending)
+        finally:
+            future.set_result(None)
+
+    def in_loop_thread(self) -> bool:
+        """Whether the caller runs in the dispatcher's thread."""
+        return threading.current_thread() is self._thread
+
+    def submit(
+        self, coros: list[Coroutine[Any, Any, Any]], run_id: UUID | None = None
+    ) -> Future[None]:
+        """Queue the coroutines handling one event of a run.
+
+        Blocks while `max_pending` events of the run are queued.
+
+        Returns:
+            A future resolved once the event has been handled.
+        """
+        with self._lock:
+            queued = self._queued.setdefault(run_id, collections.deque())
+            while queued and queued[0].done():
+                queued.popleft()
+            oldest = queued[0] if len(queued) >= self._max_pending else None
+        if oldest is not None:
+            oldest.result()
+        future: Future[None] = Future()
+        with self._lock:
+            self._queued.setdefault(run_id, collections.deque()).append(future)
+        self._loop.call_soon_threadsafe(
+            self._schedule,
+            run_id,
+            copy_context(),
+            coros,
+            future,
+            # Don't leak the caller's context into the loop's own tasks.
+            context=Context(),
+        )
+        return future
+
+    def flush(self, run_id: UUID | None = None, timeout: float | None = None) -> bool:
+        """Wait until every queued event of a run has been handled.
+
+        Returns:
+            `False` if the timeout expired first, `True` otherwise.
+        """
+        with self._lock:
+            futures = list(self._queued.get(run_id, ()))
+        _, not_done = wait(futures, timeout)
+        with self._lock:
+            queued = self._queued.get(run_id)
+            if queued is not None:
+                while queued and queued[0].done():
+                    queued.popleft()
+                if not queued:
+                    del self._queued[run_id]
+        return not not_done
+
+    def flush_all(self, timeout: float | None = None) -> bool:
+        """Wait until every queued event of every run has been handled.
+
+        Returns:
+            `False` if the timeout expired first, `True` otherwise.
+        """
+        with self._lock:
+            futures = [future for queued in self._queued.values() for future in queued]
+        _, not_done = wait(futures, timeout)
+        return not not_done
+
+
+_CALLBACK_DISPATCHER: _AsyncCallbackDispatcher | None = None
+_CALLBACK_DISPATCHER_LOCK = threading.Lock()
+
+
+def _callback_dispatcher() -> _AsyncCallbackDispatcher:
+    global _CALLBACK_DISPATCHER  # noqa: PLW0603
+    if _CALLBACK_DISPATCHER is None:
+        with _CALLBACK_DISPATCHER_LOCK:
+            if _CALLBACK_DISPATCHER is None:
+                _CALLBACK_DISPATCHER = _AsyncCallbackDispatcher()
+    return _CALLBACK_DISPATCHER
+
+
+def _flush_callback_dispatcher() -> None:
+    if _CALLBACK_DISPATCHER is not None:
+        _CALLBACK_DISPATCHER.flush_all(timeout=5)
+
+
+def _reset_callback_dispatcher() -> None:
+    # A forked child inherits the dispatcher but not its loop thread: start over.
+    global _CALLBACK_DISPATCHER, _CALLBACK_DISPATCHER_LOCK  # noqa: PLW0603
+    _CALLBACK_DISPATCHER = None
+    _CALLBACK_DISPATCHER_LOCK = threading.Lock()
+
+
+atexit.register(_flush_callback_dispatcher)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_callback_dispatcher)
+
+
 async def _ahandle_event_for_handler(
     handler: BaseCallbackHandler,
     event_name: str,
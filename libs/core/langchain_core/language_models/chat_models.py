@@ -5,6 +5,8 @@ from __future__ import annotations
 import asyncio
 import inspect
 import json
+import re
+import time
 import typing
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator, Callable, Iterator, Sequence
@@ -15,7 +17,7 @@ from typing import TYPE_CHECKING, Any, Literal, cast
 from pydantic import BaseModel, ConfigDict, Field
 from typing_extensions import override
 
-from langchain_core.caches import BaseCache
+from langchain_core.caches import BaseCache, get_in_flight_requests
 from langchain_core.callbacks import (
     AsyncCallbackManager,
     AsyncCallbackManagerForLLMRun,
@@ -48,6 +50,7 @@ from langchain_core.messages import content as types
 from langchain_core.messages.block_translators.openai import (
     convert_to_openai_image_block,
 )
+from langchain_core.messages.tool import tool_call_chunk as create_tool_call_chunk
 from langchain_core.output_parsers.openai_tools import (
     JsonOutputKeyToolsParser,
     PydanticToolsParser,
@@ -60,9 +63,13 @@ from langchain_core.outputs import (
     LLMResult,
     RunInfo,
 )
-from langchain_core.outputs.chat_generation import merge_chat_generation_chunks
+from langchain_core.outputs.chat_generation import ChatGenerationChunkBuilder
 from langchain_core.prompt_values import ChatPromptValue, PromptValue, StringPromptValue
-from langchain_core.rate_limiters import BaseRateLimiter
+from langchain_core.rate_limiters import (
+    BaseRateLimiter,
+    RateLimitReservation,
+    TokenRateLimiter,
+)
 from langchain_core.runnables import RunnableMap, RunnablePassthrough
 from langchain_core.runnables.config import ensure_config, run_in_executor
 from langchain_core.tracers._streaming import _StreamingCallbackHandler
@@ -192,9 +199,13 @@ def generate_from_stream(stream: Iterator[ChatGenerationChunk]) -> ChatResult:
         Chat result.
 
     """
-    generation = next(stream, None)
-    if generation:
-        generation += list(stream)
+    builder = ChatGenerationChunkBuilder()
+    for chunk in stream:
+        builder.add(chunk)
+    return _chat_result_from_chunk(builder.build())
+
+
+def _chat_result_from_chunk(generation: ChatGenerationChunk | None) -> ChatResult:
     if generation is None:
         msg = "No generations found in stream."
         raise ValueError(msg)
@@ -224,6 +235,107 @@ async def agenerate_from_stream(
     return await run_in_executor(None, generate_from_stream, iter(chunks))
 
 
+def _chunks_from_cached_generation(
+    generation: Generation,
+) -> list[ChatGenerationChunk]:
+    """Split a cached generation back into the chunks a live stream would yield.
+
+    Text content is split on word boundaries. Everything that is not content
+    (tool calls, usage, response metadata, generation info) rides on the final
+    chunk, so merging the chunks reproduces the cached message.
+
+    Args:
+        generation: The cached generation.
+
+    Returns:
+        The chunks to replay, the last one marked with `chunk_position="last"`.
+    """
+    message = (
+        generation.message
+        if isinstance(generation, ChatGeneration)
+        and isinstance(generation.message, AIMessage)
+        else AIMessage(content=generation.text)
+    )
+    content = message.content
+    if isinstance(content, str):
+        pieces: list[str | list] = re.findall(r"\S+\s*|\s+", content)
+        final_content: str | list = ""
+    else:
+        pieces = [content] if content else []
+        final_content = []
+
+    chunks = [
+        ChatGenerationChunk(message=AIMessageChunk(content=piece, id=message.id))
+        for piece in pieces
+    ]
+    tool_call_chunks = [
+        create_tool_call_chunk(
+            name=tool_call["name"],
+            args=json.dumps(tool_call["args"]),
+            id=tool_call["id"],
+            index=index,
+        )
+        for index, tool_call in enumerate(message.tool_calls)
+    ]
+    tool_call_chunks.extend(
+        create_tool_call_chunk(
+            name=invalid_tool_call["name"],
+            args=invalid_tool_call["args"],
+            id=invalid_tool_call["id"],
+            index=index,
+        )
+        for index, invalid_tool_call in enumerate(
+            message.invalid_tool_calls, start=len(tool_call_chunks)
+        )
+    )
+    # Cache hits zero out the cost even when no usage was reported, which leaves
+    # a partial usage dict that a chunk would reject.
+    usage_metadata = message.usage_metadata
+    if usage_metadata is not None and "total_tokens" not in usage_metadata:
+        usage_metadata = None
+    chunks.append(
+        ChatGenerationChunk(
+            message=AIMessageChunk(
+                content=final_content,
+                id=message.id,
+                additional_kwargs=message.additional_kwargs,
+                response_metadata=message.response_metadata,
+                tool_call_chunks=tool_call_chunks,
+                usage_metadata=usage_metadata,
+                chunk_position="last",
+            ),
+            generation_info=generation.generation_info,
+        )
+    )
+    return chunks
+
+
+def _replay_chunks(
+    chunks: list[ChatGenerationChunk], delay: float
+) -> Iterator[ChatGenerationChunk]:
+    for i, chunk in enumerate(chunks):
+        if delay and i:
+            time.sleep(delay)
+        yield chunk
+
+
+async def _areplay_chunks(
+    chunks: list[ChatGenerationChunk], delay: float
+) -> AsyncIterator[ChatGenerationChunk]:
+    for i, chunk in enumerate(chunks):
+        if delay and i:
+            await asyncio.sleep(delay)
+        yield chunk
+
+
+def _in_event_loop_thread() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
 def _format_ls_structured_output(ls_structured_output_format: dict | None) -> dict:
     if ls_structured_output_format:
         try:
@@ -296,6 +408,15 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
     rate_limiter: BaseRateLimiter | None = Field(default=None, exclude=True)
     "An optional rate limiter to use for limiting the number of requests."
 
+    cache_stream_delay: float = Field(default=0.0, exclude=True)
+    """Seconds to pause between chunks when `stream`/`astream` replay a cached
+    response.
+
+    Cached responses are replayed word by word so streaming consumers behave the
+    same on a cache hit. The default replays them as fast as they are consumed;
+    set a small delay to mimic the pacing of a live model.
+    """
+
     disable_streaming: bool | Literal["tool_calling"] = False
     """Whether to disable streaming for this model.
 
@@ -522,18 +643,36 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 batch_size=1,
             )
 
-            chunks: list[ChatGenerationChunk] = []
-
-            if self.rate_limiter:
-                self.rate_limiter.acquire(blocking=True)
+            builder = ChatGenerationChunkBuilder()
+            cached_chunks: list[ChatGenerationChunk] | None = None
+            reservation: RateLimitReservation | None = None
 
             try:
                 input_messages = _normalize_messages(messages)
                 run_id = "-".join((LC_ID_PREFIX, str(run_manager.run_id)))
+                llm_cache = self._get_llm_cache()
+                if llm_cache:
+                    llm_string = self._get_llm_string(stop=stop, **kwargs)
+                    prompt = dumps(input_messages)
+                    cached_chunks = self._cached_stream_chunks(
+                        llm_cache.lookup(prompt, llm_string)
+                    )
+
+                if cached_chunks is not None:
+                    chunk_stream = _replay_chunks(
+                        cached_chunks, self.cache_stream_delay
+                    )
+                else:
+                    # Rate limit API requests, but not cache hits.
+                    reservation = self._acquire_rate_limit(
+                        input_messages, stop=stop, **kwargs
+                    )
+                    chunk_stream = self._stream(input_messages, stop=stop, **kwargs)
+
                 yielded = False
                 index = -1
                 index_type = ""
-                for chunk in self._stream(input_messages, stop=stop, **kwargs):
+                for chunk in chunk_stream:
                     if chunk.message.id is None:
                         chunk.message.id = run_id
                     chunk.message.response_metadata = _gen_info_and_msg_metadata(chunk)
@@ -553,7 +692,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                     run_manager.on_llm_new_token(
                         cast("str", chunk.message.content), chunk=chunk
                     )
-                    chunks.append(chunk)
+                    builder.add(chunk)
                     yield cast("AIMessageChunk", chunk.message)
                     yielded = True
 
@@ -576,7 +715,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                     yield msg_chunk
             except BaseException as e:
                 generations_with_error_metadata = _generate_response_from_error(e)
-                chat_generation_chunk = merge_chat_generation_chunks(chunks)
+                chat_generation_chunk = builder.build()
                 if chat_generation_chunk:
                     generations = [
                         [chat_generation_chunk],
@@ -590,12 +729,17 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 )
                 raise
 
-            generation = merge_chat_generation_chunks(chunks)
+            generation = builder.build()
             if generation is None:
                 err = ValueError("No generation chunks were returned")
                 run_manager.on_llm_error(err, response=LLMResult(generations=[]))
                 raise err
 
+            _reconcile_rate_limit(reservation, [generation])
+            if llm_cache and cached_chunks is None:
+                llm_cache.update(
+                    prompt, llm_string, _chat_result_from_chunk(generation).generations
+                )
             run_manager.on_llm_end(LLMResult(generations=[[generation]]))
 
     @override
@@ -650,22 +794,34 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
             batch_size=1,
         )
 
-        if self.rate_limiter:
-            await self.rate_limiter.aacquire(blocking=True)
-
-        chunks: list[ChatGenerationChunk] = []
+        builder = ChatGenerationChunkBuilder()
+        cached_chunks: list[ChatGenerationChunk] | None = None
+        reservation: RateLimitReservation | None = None
 
         try:
             input_messages = _normalize_messages(messages)
             run_id = "-".join((LC_ID_PREFIX, str(run_manager.run_id)))
+            llm_cache = self._get_llm_cache()
+            if llm_cache:
+                llm_string = self._get_llm_string(stop=stop, **kwargs)
+                prompt = dumps(input_messages)
+                cached_chunks = self._cached_stream_chunks(
+                    await llm_cache.alookup(prompt, llm_string)
+                )
+
+            if cached_chunks is not None:
+                chunk_stream = _areplay_chunks(cached_chunks, self.cache_stream_delay)
+            else:
+                # Rate limit API requests, but not cache hits.
+                reservation = await self._aacquire_rate_limit(
+                    input_messages, stop=stop, **kwargs
+                )
+                chunk_stream = self._astream(input_messages, stop=stop, **kwargs)
+
             yielded = False
             index = -1
             index_type = ""
-            async for chunk in self._astream(
-                input_messages,
-                stop=stop,
-                **kwargs,
-            ):
+            async for chunk in chunk_stream:
                 if chunk.message.id is None:
                     chunk.message.id = run_id
                 chunk.message.response_metadata = _gen_info_and_msg_metadata(chunk)
@@ -685,7 +841,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 await run_manager.on_llm_new_token(
                     cast("str", chunk.message.content), chunk=chunk
                 )
-                chunks.append(chunk)
+                builder.add(chunk)
                 yield cast("AIMessageChunk", chunk.message)
                 yielded = True
 
@@ -707,7 +863,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 yield msg_chunk
         except BaseException as e:
             generations_with_error_metadata = _generate_response_from_error(e)
-            chat_generation_chunk = merge_chat_generation_chunks(chunks)
+            chat_generation_chunk = builder.build()
             if chat_generation_chunk:
                 generations = [[chat_generation_chunk], generations_with_error_metadata]
             else:
@@ -718,18 +874,83 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
             )
             raise
 
-        generation = merge_chat_generation_chunks(chunks)
+        generation = builder.build()
         if not generation:
             err = ValueError("No generation chunks were returned")
             await run_manager.on_llm_error(err, response=LLMResult(generations=[]))
             raise err
 
+        _reconcile_rate_limit(reservation, [generation])
+        if llm_cache and cached_chunks is None:
+            await llm_cache.aupdate(
+                prompt, llm_string, _chat_result_from_chunk(generation).generations
+            )
         await run_manager.on_llm_end(
             LLMResult(generations=[[generation]]),
         )
 
     # --- Custom methods ---
 
+    def _get_llm_cache(self) -> BaseCache | None:
+        """Return the cache to consult for a call, or `None` if caching is off.
+
+        Raises:
+            ValueError: If caching was requested but no global cache is set.
+        """
+        # We should check the cache unless it's explicitly set to False
+        # A None cache means we should use the default global cache
+        # if it's configured.
+        if self.cache is False:
+            return None
+        llm_cache = self.cache if isinstance(self.cache, BaseCache) else get_llm_cache()
+        if llm_cache:
+            return llm_cache
+        if self.cache is None:
+            return None
+        msg = "Asked to cache, but no cache found at `langchain.cache`."
+        raise ValueError(msg)
+
+    def _acquire_rate_limit(
+        self, messages: list[BaseMessage], **kwargs: Any
+    ) -> RateLimitReservation | None:
+        """Wait for the rate limiter before calling the model.
+
+        A `TokenRateLimiter` is charged the estimated tokens of the call and
+        returns a reservation to reconcile with the actual usage.
+        """
+        if isinstance(self.rate_limiter, TokenRateLimiter):
+            tokens = self.rate_limiter.estimate_tokens(
+                messages, max_tokens=self._max_tokens_param(**kwargs)
+            )
+            return self.rate_limiter.acquire_tokens(tokens)
+        if self.rate_limiter:
+            self.rate_limiter.acquire(blocking=True)
+        return None
+
+    async def _aacquire_rate_limit(
+        self, messages: list[BaseMessage], **kwargs: Any
+    ) -> RateLimitReservation | None:
+        """Wait for the rate limiter before calling the model. Async version."""
+        if isinstance(self.rate_limiter, TokenRateLimiter):
+            tokens = self.rate_limiter.estimate_tokens(
+                messages, max_tokens=self._max_tokens_param(**kwargs)
+            )
+            return await self.rate_limiter.aacquire_tokens(tokens)
+        if self.rate_limiter:
+            await self.rate_limiter.aacquire(blocking=True)
+        return None
+
+    def _max_tokens_param(self, **kwargs: Any) -> int | None:
+        max_tokens = kwargs.get("max_tokens", getattr(self, "max_tokens", None))
+        return max_tokens if isinstance(max_tokens, int) else None
+
+    def _cached_stream_chunks(self, cache_val: Any) -> list[ChatGenerationChunk] | None:
+        """Turn a cache lookup result into chunks to replay, or `None` on a miss."""
+        if not isinstance(cache_val, list) or not cache_val:
+            return None
+        generations = self._convert_cached_generations(cache_val)
+        return _chunks_from_cached_generation(generations[0])
+
     def _combine_llm_outputs(self, llm_outputs: list[dict | None]) -> dict:  # noqa: ARG002
         return {}
 
@@ -1155,11 +1376,56 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 msg = "Asked to cache, but no cache found at `langchain.cache`."
                 raise ValueError(msg)
 
+        if not (check_cache and llm_cache):
+            return self._generate_uncached(
+                messages, stop=stop, run_manager=run_manager, **kwargs
+            )
+
+        if _in_event_loop_thread():
+            # Don't wait on a leader from an event loop thread (e.g. a sync tool
+            # run by an async agent): the leader may need this very loop.
+            result = self._generate_uncached(
+                messages, stop=stop, run_manager=run_manager, **kwargs
+            )
+            llm_cache.update(prompt, llm_string, result.generations)
+            return result
+
+        # Identical requests that miss the cache at the same time share a single
+        # model call: the first one leads and the others wait for its result.
+        in_flight = get_in_flight_requests()
+        while True:
+            flight, is_leader = in_flight.join(prompt, llm_string)
+            if is_leader:
+                break
+            shared = flight.result()
+            if shared is not None:
+                return ChatResult(
+                    generations=self._convert_cached_generations(
+                        [generation.model_copy(deep=True) for generation in shared]
+                    )
+                )
+        try:
+            result = self._generate_uncached(
+                messages, stop=stop, run_manager=run_manager, **kwargs
+            )
+            llm_cache.update(prompt, llm_string, result.generations)
+        except BaseException as e:
+            in_flight.finish(prompt, llm_string, flight, error=e)
+            raise
+        in_flight.finish(prompt, llm_string, flight, result=result.generations)
+        return result
+
+    def _generate_uncached(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
         # Apply the rate limiter after checking the cache, since
         # we usually don't want to rate limit cache lookups, but
         # we do want to rate limit API requests.
-        if self.rate_limiter:
-            self.rate_limiter.acquire(blocking=True)
+        reservation = self._acquire_rate_limit(messages, stop=stop, **kwargs)
 
         # If stream is not explicitly set, check if implicitly requested by
         # astream_events() or astream_log(). Bail out if _stream not implemented
@@ -1168,7 +1434,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
             run_manager=run_manager,
             **kwargs,
         ):
-            chunks: list[ChatGenerationChunk] = []
+            builder = ChatGenerationChunkBuilder()
             run_id: str | None = (
                 f"{LC_ID_PREFIX}-{run_manager.run_id}" if run_manager else None
             )
@@ -1196,7 +1462,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                     run_manager.on_llm_new_token(
                         cast("str", chunk.message.content), chunk=chunk
                     )
-                chunks.append(chunk)
+                builder.add(chunk)
                 yielded = True
 
             # Yield a final empty chunk with chunk_position="last" if not yet yielded
@@ -1215,8 +1481,8 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 )
                 if run_manager:
                     run_manager.on_llm_new_token("", chunk=chunk)
-                chunks.append(chunk)
-            result = generate_from_stream(iter(chunks))
+                builder.add(chunk)
+            result = _chat_result_from_chunk(builder.build())
         elif inspect.signature(self._generate).parameters.get("run_manager"):
             result = self._generate(
                 messages, stop=stop, run_manager=run_manager, **kwargs
@@ -1243,8 +1509,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 **result.llm_output,
                 **result.generations[0].message.response_metadata,
             }
-        if check_cache and llm_cache:
-            llm_cache.update(prompt, llm_string, result.generations)
+        _reconcile_rate_limit(reservation, result.generations)
         return result
 
     async def _agenerate_with_cache(
@@ -1273,11 +1538,47 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 msg = "Asked to cache, but no cache found at `langchain.cache`."
                 raise ValueError(msg)
 
+        if not (check_cache and llm_cache):
+            return await self._agenerate_uncached(
+                messages, stop=stop, run_manager=run_manager, **kwargs
+            )
+
+        # Identical requests that miss the cache at the same time share a single
+        # model call: the first one leads and the others wait for its result.
+        in_flight = get_in_flight_requests()
+        while True:
+            flight, is_leader = in_flight.join(prompt, llm_string)
+            if is_leader:
+                break
+            shared = await asyncio.shield(asyncio.wrap_future(flight))
+            if shared is not None:
+                return ChatResult(
+                    generations=self._convert_cached_generations(
+                        [generation.model_copy(deep=True) for generation in shared]
+                    )
+                )
+        try:
+            result = await self._agenerate_uncached(
+                messages, stop=stop, run_manager=run_manager, **kwargs
+            )
+            await llm_cache.aupdate(prompt, llm_string, result.generations)
+        except BaseException as e:
+            in_flight.finish(prompt, llm_string, flight, error=e)
+            raise
+        in_flight.finish(prompt, llm_string, flight, result=result.generations)
+        return result
+
+    async def _agenerate_uncached(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
         # Apply the rate limiter after checking the cache, since
         # we usually don't want to rate limit cache lookups, but
         # we do want to rate limit API requests.
-        if self.rate_limiter:
-            await self.rate_limiter.aacquire(blocking=True)
+        reservation = await self._aacquire_rate_limit(messages, stop=stop, **kwargs)
 
         # If stream is not explicitly set, check if implicitly requested by
         # astream_events() or astream_log(). Bail out if _astream not implemented
@@ -1286,7 +1587,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
             run_manager=run_manager,
             **kwargs,
         ):
-            chunks: list[ChatGenerationChunk] = []
+            builder = ChatGenerationChunkBuilder()
             run_id: str | None = (
                 f"{LC_ID_PREFIX}-{run_manager.run_id}" if run_manager else None
             )
@@ -1314,7 +1615,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                     await run_manager.on_llm_new_token(
                         cast("str", chunk.message.content), chunk=chunk
                     )
-                chunks.append(chunk)
+                builder.add(chunk)
                 yielded = True
 
             # Yield a final empty chunk with chunk_position="last" if not yet yielded
@@ -1333,8 +1634,8 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 )
                 if run_manager:
                     await run_manager.on_llm_new_token("", chunk=chunk)
-                chunks.append(chunk)
-            result = generate_from_stream(iter(chunks))
+                builder.add(chunk)
+            result = _chat_result_from_chunk(builder.build())
         elif inspect.signature(self._agenerate).parameters.get("run_manager"):
             result = await self._agenerate(
                 messages, stop=stop, run_manager=run_manager, **kwargs
@@ -1361,8 +1662,7 @@ class BaseChatModel(BaseLanguageModel[AIMessage], ABC):
                 **result.llm_output,
                 **result.generations[0].message.response_metadata,
             }
-        if check_cache and llm_cache:
-            await llm_cache.aupdate(prompt, llm_string, result.generations)
+        _reconcile_rate_limit(reservation, result.generations)
         return result
 
     @abstractmethod
@@ -1763,6 +2063,22 @@ def _gen_info_and_msg_metadata(
 _MAX_CLEANUP_DEPTH = 100
 
 
+def _reconcile_rate_limit(
+    reservation: RateLimitReservation | None, generations: Sequence[ChatGeneration]
+) -> None:
+    """Reconcile a token reservation with the usage reported by the model."""
+    if reservation is None:
+        return
+    usages = [
+        generation.message.usage_metadata
+        for generation in generations
+        if isinstance(generation.message, AIMessage)
+        and generation.message.usage_metadata
+    ]
+    if usages:
+        reservation.reconcile(sum(usage["total_tokens"] for usage in usages))
+
+
 def _cleanup_llm_representation(serialized: Any, depth: int) -> None:
     """Remove non-serializable objects from a serialized object."""
     if depth > _MAX_CLEANUP_DEPTH:  # Don't cooperate for pathological cases
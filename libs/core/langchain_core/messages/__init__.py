@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from langchain_core.messages.ai import (
         AIMessage,
         AIMessageChunk,
+        AIMessageChunkBuilder,
         InputTokenDetails,
         OutputTokenDetails,
         UsageMetadata,
@@ -57,6 +58,7 @@ if TYPE_CHECKING:
     )
     from langchain_core.messages.utils import (
         AnyMessage,
+        CachedTokenCounter,
         MessageLikeRepresentation,
         _message_from_dict,
         convert_to_messages,
@@ -74,11 +76,13 @@ __all__ = (
     "LC_ID_PREFIX",
     "AIMessage",
     "AIMessageChunk",
+    "AIMessageChunkBuilder",
     "Annotation",
     "AnyMessage",
     "AudioContentBlock",
     "BaseMessage",
     "BaseMessageChunk",
+    "CachedTokenCounter",
     "ChatMessage",
     "ChatMessageChunk",
     "Citation",
@@ -132,6 +136,7 @@ __all__ = (
 _dynamic_imports = {
     "AIMessage": "ai",
     "AIMessageChunk": "ai",
+    "AIMessageChunkBuilder": "ai",
     "Annotation": "content",
     "AudioContentBlock": "content",
     "BaseMessage": "base",
@@ -171,6 +176,7 @@ _dynamic_imports = {
     "UsageMetadata": "ai",
     "VideoContentBlock": "content",
     "AnyMessage": "utils",
+    "CachedTokenCounter": "utils",
     "MessageLikeRepresentation": "utils",
     "_message_from_dict": "utils",
     "convert_to_messages": "utils",
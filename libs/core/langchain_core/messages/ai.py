@@ -690,6 +690,160 @@ def add_ai_message_chunks(
     )
 
 
+class AIMessageChunkBuilder:
+    """Accumulate a stream of `AIMessageChunk`s into a single chunk in linear time.
+
+    Adding chunks one at a time with `+` builds a new message for every chunk,
+    copying the content and the tool call arguments received so far each time.
+    The builder instead appends each chunk to buffers and merges them once, in
+    `build`, into the same message that `add_ai_message_chunks` would return.
+
+    Example:
+        ```python
+        from langchain_core.messages import AIMessageChunkBuilder
+
+        builder = AIMessageChunkBuilder()
+        for chunk in model.stream("Hello"):
+            builder.add(chunk)
+        message = builder.build()
+        ```
+    """
+
+    def __init__(self) -> None:
+        """Create an empty builder."""
+        self._cls: type[AIMessageChunk] | None = None
+        self._contents: list[str | list[str | dict]] = []
+        self._additional_kwargs: list[dict] = []
+        self._response_metadata: list[dict] = []
+        self._tool_call_chunks: list[dict[str, Any]] = []
+        self._tool_call_positions: dict[Any, int] = {}
+        self._usage_metadata: UsageMetadata | None = None
+        self._has_usage = False
+        # First provider-assigned id, first `lc_run-*` id and first id of any kind.
+        self._ids: list[str | None] = [None, None, None]
+        self._last = False
+
+    def __len__(self) -> int:
+        """Return the number of chunks added so far."""
+        return len(self._contents)
+
+    def add(self, chunk: AIMessageChunk) -> None:
+        """Append a chunk to the message being built.
+
+        Args:
+            chunk: The next chunk of the stream.
+        """
+        first = self._cls is None
+        if first:
+            self._cls = chunk.__class__
+        self._contents.append(chunk.content)
+        if chunk.additional_kwargs or first:
+            self._additional_kwargs.append(chunk.additional_kwargs)
+        if chunk.response_metadata or first:
+            self._response_metadata.append(chunk.response_metadata)
+        for tool_call_chunk in chunk.tool_call_chunks:
+            self._add_tool_call_chunk(tool_call_chunk, first=first)
+        if first:
+            self._usage_metadata = chunk.usage_metadata
+            self._has_usage = bool(chunk.usage_metadata)
+        else:
+            self._usage_metadata = add_usage(self._usage_metadata, chunk.usage_metadata)
+            self._has_usage = self._has_usage or chunk.usage_metadata is not None
+        if id_ := chunk.id:
+            if id_.startswith(LC_ID_PREFIX):
+                slot = 1
+            elif id_.startswith(LC_AUTO_PREFIX):
+                slot = 2
+            else:
+                slot = 0
+            for i in (slot, 2):
+                if self._ids[i] is None:
+                    self._ids[i] = id_
+        self._last = self._last or chunk.chunk_position == "last"
+
+    def _add_tool_call_chunk(
+        self, tool_call_chunk: ToolCallChunk, *, first: bool
+    ) -> None:
+        # Mirrors `merge_lists`: chunks are merged by index into the first chunk
+        # with the same index, except within the first message.
+        index = tool_call_chunk.get("index")
+        position = None
+        if not first and (
+            isinstance(index, int)
+            or (isinstance(index, str) and index.startswith("lc_"))
+        ):
+            position = self._tool_call_positions.get(index)
+        args = tool_call_chunk.get("args")
+        if position is None:
+            if index is not None:
+                self._tool_call_positions.setdefault(index, len(self._tool_call_chunks))
+            self._tool_call_chunks.append(
+                {
+                    "name": tool_call_chunk.get("name"),
+                    "args": None if args is None else [args],
+                    "id": tool_call_chunk.get("id"),
+                    "index": index,
+                }
+            )
+            return
+        merged = self._tool_call_chunks[position]
+        if (name := tool_call_chunk.get("name")) is not None:
+            merged["name"] = name if merged["name"] is None else merged["name"] + name
+        if (id_ := tool_call_chunk.get("id")) is not None and id_ != merged["id"]:
+            merged["id"] = id_ if merged["id"] is None else merged["id"] + id_
+        if args is not None:
+            if merged["args"] is None:
+                merged["args"] = [args]
+            else:
+                merged["args"].append(args)
+
+    def build(self) -> AIMessageChunk:
+        """Merge the chunks added so far into a single chunk.
+
+        The builder can keep accumulating chunks afterwards.
+
+        Returns:
+            The merged chunk.
+
+        Raises:
+            ValueError: If no chunk was added.
+        """
+        if self._cls is None:
+            msg = "No chunks were added to the builder."
+            raise ValueError(msg)
+        contents = self._contents
+        if all(isinstance(content, str) for content in contents):
+            content: str | list[str | dict] = "".join(cast("list[str]", contents))
+        else:
+            # Copy the first content: merge_content extends a list in place.
+            first = contents[0]
+            content = merge_content(
+                list(first) if isinstance(first, list) else first, *contents[1:]
+            )
+        tool_call_chunks = []
+        for merged in self._tool_call_chunks:
+            args = merged["args"]
+            if args is not None and len(args) > 1:
+                args[:] = ["".join(args)]
+            tool_call_chunks.append(
+                create_tool_call_chunk(
+                    name=merged["name"],
+                    args=None if args is None else args[0],
+                    index=merged["index"],
+                    id=merged["id"],
+                )
+            )
+        return self._cls(
+            content=content,
+            additional_kwargs=merge_dicts(*self._additional_kwargs),
+            tool_call_chunks=tool_call_chunks,
+            response_metadata=merge_dicts(*self._response_metadata),
+            usage_metadata=self._usage_metadata if self._has_usage else None,
+            id=next((id_ for id_ in self._ids if id_), None),
+            chunk_position="last" if self._last else None,
+        )
+
+
 def add_usage(left: UsageMetadata | None, right: UsageMetadata | None) -> UsageMetadata:
     """Recursively add two UsageMetadata objects.
 
@@ -10,12 +10,15 @@ Some examples of what you can do with these functions include:
 from __future__ import annotations
 
 import base64
+import bisect
 import inspect
 import json
 import logging
 import math
+import threading
 from collections.abc import Callable, Iterable, Sequence
 from functools import partial, wraps
+from itertools import accumulate
 from typing import (
     TYPE_CHECKING,
     Annotated,
@@ -768,7 +771,8 @@ def trim_messages(
                 counts.
 
                 This is recommended for using `trim_messages` on the hot path, where
-                exact token counting is not necessary.
+                exact token counting is not necessary. Wrap it in a
+                `CachedTokenCounter` to also reuse per-message counts across calls.
 
         strategy: Strategy for trimming.
             - `'first'`: Keep the first `<= n_count` tokens of the messages.
@@ -992,6 +996,17 @@ def trim_messages(
         raise ValueError(msg)
 
     messages = convert_to_messages(messages)
+    # Counters that count each message independently let us compute the totals of
+    # all prefixes in one pass instead of recounting slices of the messages.
+    message_token_counter: Callable[[BaseMessage], int] | None = None
+    if isinstance(token_counter, CachedTokenCounter):
+        message_token_counter = token_counter.count
+    elif _counts_messages_independently(token_counter):
+        message_token_counter = partial(
+            _count_message_tokens,
+            cast("Callable[[list[BaseMessage]], int]", token_counter),
+        )
+
     if hasattr(token_counter, "get_num_tokens_from_messages"):
         list_token_counter = token_counter.get_num_tokens_from_messages
     elif callable(token_counter):
@@ -1003,6 +1018,7 @@ def trim_messages(
             def list_token_counter(messages: Sequence[BaseMessage]) -> int:
                 return sum(token_counter(msg) for msg in messages)  # type: ignore[arg-type, misc]
 
+            message_token_counter = cast("Callable[[BaseMessage], int]", token_counter)
         else:
             list_token_counter = token_counter
     else:
@@ -1028,6 +1044,7 @@ def trim_messages(
             text_splitter=text_splitter_fn,
             partial_strategy="first" if allow_partial else None,
             end_on=end_on,
+            message_token_counter=message_token_counter,
         )
     if strategy == "last":
         return _last_max_tokens(
@@ -1039,6 +1056,7 @@ def trim_messages(
             start_on=start_on,
             end_on=end_on,
             text_splitter=text_splitter_fn,
+            message_token_counter=message_token_counter,
         )
     msg = f"Unrecognized {strategy=}. Supported strategies are 'last' and 'first'."
     raise ValueError(msg)
@@ -1430,13 +1448,27 @@ def _first_max_tokens(
     text_splitter: Callable[[str], list[str]],
     partial_strategy: Literal["first", "last"] | None = None,
     end_on: str | type[BaseMessage] | Sequence[str | type[BaseMessage]] | None = None,
+    message_token_counter: Callable[[BaseMessage], int] | None = None,
 ) -> list[BaseMessage]:
     messages = list(messages)
     if not messages:
         return messages
 
+    if message_token_counter is not None:
+        prefix_totals = list(
+            accumulate(map(message_token_counter, messages), initial=0)
+        )
+
+        def count_prefix(n: int) -> int:
+            return prefix_totals[n]
+
+    else:
+
+        def count_prefix(n: int) -> int:
+            return token_counter(cast("list[BaseMessage]", messages[:n]))
+
     # Check if all messages already fit within token limit
-    if token_counter(messages) <= max_tokens:
+    if count_prefix(len(messages)) <= max_tokens:
         # When all messages fit, only apply end_on filtering if needed
         if end_on:
             for _ in range(len(messages)):
@@ -1446,21 +1478,24 @@ def _first_max_tokens(
                     break
         return messages
 
-    # Use binary search to find the maximum number of messages within token limit
-    left, right = 0, len(messages)
-    max_iterations = len(messages).bit_length()
-    for _ in range(max_iterations):
-        if left >= right:
-            break
-        mid = (left + right + 1) // 2
-        if token_counter(messages[:mid]) <= max_tokens:
-            left = mid
-            idx = mid
-        else:
-            right = mid - 1
+    if message_token_counter is not None:
+        # Prefix totals never decrease, so bisect for the longest prefix that fits
+        idx = max(bisect.bisect_right(prefix_totals, max_tokens) - 1, 0)
+    else:
+        # Use binary search to find the maximum number of messages within token limit
+        left, right = 0, len(messages)
+        max_iterations = len(messages).bit_length()
+        for _ in range(max_iterations):
+            if left >= right:
+                break
+            mid = (left + right + 1) // 2
+            if count_prefix(mid) <= max_tokens:
+                left = mid
+            else:
+                right = mid - 1
 
-    # idx now contains the maximum number of complete messages we can include
-    idx = left
+        # idx now contains the maximum number of complete messages we can include
+        idx = left
 
     if partial_strategy and idx < len(messages):
         included_partial = False
@@ -1473,7 +1508,11 @@ def _first_max_tokens(
                 excluded.content = list(reversed(excluded.content))
             for _ in range(1, num_block):
                 excluded.content = excluded.content[:-1]
-                if token_counter([*messages[:idx], excluded]) <= max_tokens:
+                if message_token_counter is not None:
+                    excluded_count = count_prefix(idx) + token_counter([excluded])
+                else:
+                    excluded_count = token_counter([*messages[:idx], excluded])
+                if excluded_count <= max_tokens:
                     messages = [*messages[:idx], excluded]
                     idx += 1
                     included_partial = True
@@ -1503,7 +1542,7 @@ def _first_max_tokens(
                     excluded = excluded.model_copy(deep=True)
 
                 split_texts = text_splitter(text)
-                base_message_count = token_counter(messages[:idx])
+                base_message_count = count_prefix(idx)
                 if partial_strategy == "last":
                     split_texts = list(reversed(split_texts))
 
@@ -1548,6 +1587,7 @@ def _last_max_tokens(
     include_system: bool = False,
     start_on: str | type[BaseMessage] | Sequence[str | type[BaseMessage]] | None = None,
     end_on: str | type[BaseMessage] | Sequence[str | type[BaseMessage]] | None = None,
+    message_token_counter: Callable[[BaseMessage], int] | None = None,
 ) -> list[BaseMessage]:
     messages = list(messages)
     if len(messages) == 0:
@@ -1583,6 +1623,7 @@ def _last_max_tokens(
         text_splitter=text_splitter,
         partial_strategy="last" if allow_partial else None,
         end_on=start_on,
+        message_token_counter=message_token_counter,
     )
 
     # Re-reverse the messages and add back the system message if needed
@@ -1770,3 +1811,137 @@ def count_tokens_approximately(
 
     # round up once more time in case extra_tokens_per_message is a float
     return math.ceil(token_count)
+
+
+def _counts_messages_independently(token_counter: Any) -> bool:
+    """Whether `token_counter` is `count_tokens_approximately` with integral extras.
+
+    Such a counter returns the sum of the counts of the individual messages.
+    """
+    keywords: dict[str, Any] = {}
+    if isinstance(token_counter, partial):
+        if token_counter.args:
+            return False
+        keywords = token_counter.keywords
+        token_counter = token_counter.func
+    if token_counter is not count_tokens_approximately:
+        return False
+    return float(keywords.get("extra_tokens_per_message", 3.0)).is_integer()
+
+
+def _count_message_tokens(
+    token_counter: Callable[[list[BaseMessage]], int], message: BaseMessage
+) -> int:
+    return token_counter([message])
+
+
+def _message_fingerprint(message: BaseMessage) -> tuple[Any, ...]:
+    content = message.content
+    tool_calls = (
+        repr(message.tool_calls)
+        if isinstance(message, AIMessage) and message.tool_calls
+        else None
+    )
+    return (
+        type(message),
+        message.name,
+        content if isinstance(content, str) else repr(content),
+        tool_calls,
+        message.tool_call_id if isinstance(message, ToolMessage) else None,
+    )
+
+
+class CachedTokenCounter:
+    """Token counter that caches the token count of each message.
+
+    Wraps a token counter that counts every message independently, so that the count
+    of a list of messages is the sum of the counts of the individual messages, like
+    `count_tokens_approximately`. Counts are cached by message ID and content, so
+    counting a growing conversation again only counts the new and edited messages.
+
+    Passing a `CachedTokenCounter` to `trim_messages` also lets it find the longest
+    prefix or suffix of the messages within the token limit with a single pass over
+    the messages.
+
+    Example:
+        ```python
+        from langchain_core.messages.utils import (
+            CachedTokenCounter,
+            count_tokens_approximately,
+            trim_messages,
+        )
+
+        token_counter = CachedTokenCounter(count_tokens_approximately)
+        trim_messages(messages, max_tokens=1000, token_counter=token_counter)
+        ```
+    """
+
+    def __init__(
+        self,
+        token_counter: Callable[[list[BaseMessage]], int],
+        *,
+        max_size: int = 10_000,
+    ) -> None:
+        """Create a cached token counter.
+
+        Args:
+            token_counter: Function that counts the tokens in a list of messages.
+                Must return the sum of the counts of the individual messages.
+            max_size: Maximum number of messages to cache counts for. The least
+                recently counted messages are evicted first.
+        """
+        self.token_counter = token_counter
+        self.max_size = max_size
+        self._counts: dict[str, tuple[tuple[Any, ...], int]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, messages: Iterable[MessageLikeRepresentation]) -> int:
+        """Count the tokens in `messages`.
+
+        Args:
+            messages: The messages to count tokens for.
+
+        Returns:
+            The sum of the token counts of the messages.
+        """
+        return sum(map(self.count, convert_to_messages(messages)))
+
+    def count(self, message: BaseMessage) -> int:
+        """Count the tokens in a single message.
+
+        Messages without an ID are counted without being cached.
+
+        Args:
+            message: The message to count tokens for.
+
+        Returns:
+            The token count of the message.
+        """
+        if message.id is None:
+            return self.token_counter([message])
+        fingerprint = _message_fingerprint(message)
+        with self._lock:
+            cached = self._counts.pop(message.id, None)
+            if cached is not None and cached[0] == fingerprint:
+                self._counts[message.id] = cached
+                return cached[1]
+        count = self.token_counter([message])
+        with self._lock:
+            self._counts[message.id] = (fingerprint, count)
+            while len(self._counts) > self.max_size:
+                del self._counts[next(iter(self._counts))]
+        return count
+
+    def prefix_totals(self, messages: Sequence[BaseMessage]) -> list[int]:
+        """Count the tokens in every prefix of `messages`.
+
+        The token count of `messages[i:j]` is `totals[j] - totals[i]`.
+
+        Args:
+            messages: The messages to count tokens for.
+
+        Returns:
+            A list `totals` of length `len(messages) + 1`, where `totals[i]` is the
+            token count of `messages[:i]`.
+        """
+        return list(accumulate(map(self.count, messages), initial=0))
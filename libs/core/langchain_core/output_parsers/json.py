@@ -14,9 +14,14 @@ from typing_extensions import override
 
 from langchain_core.exceptions import OutputParserException
 from langchain_core.output_parsers.format_instructions import JSON_FORMAT_INSTRUCTIONS
-from langchain_core.output_parsers.transform import BaseCumulativeTransformOutputParser
-from langchain_core.outputs import Generation
+from langchain_core.output_parsers.transform import (
+    BaseCumulativeTransformOutputParser,
+    IncrementalParse,
+)
+from langchain_core.outputs import ChatGenerationChunk, Generation, GenerationChunk
 from langchain_core.utils.json import (
+    PartialJsonParser,
+    _json_strip_chars,
     parse_and_check_json_markdown,
     parse_json_markdown,
     parse_partial_json,
@@ -49,6 +54,17 @@ class JsonOutputParser(BaseCumulativeTransformOutputParser[Any]):
     def _diff(self, prev: Any | None, next: Any) -> Any:
         return jsonpatch.make_patch(prev, next).patch
 
+    @override
+    def _incremental_parse(self) -> IncrementalParse | None:
+        # Subclasses customizing parsing keep reparsing the accumulated output.
+        cls = type(self)
+        if (
+            cls.parse_result is not JsonOutputParser.parse_result
+            or cls._diff is not JsonOutputParser._diff
+        ):
+            return None
+        return _JsonTextParse()
+
     @staticmethod
     def _get_schema(pydantic_object: type[TBaseModel]) -> dict[str, Any]:
         if issubclass(pydantic_object, pydantic.BaseModel):
@@ -123,6 +139,56 @@ class JsonOutputParser(BaseCumulativeTransformOutputParser[Any]):
         return "simple_json_output_parser"
 
 
+class _JsonTextParse(IncrementalParse):
+    """Follow a streamed JSON document, optionally inside a Markdown code block.
+
+    Only documents that start right away, or right after an opening code fence,
+    are followed incrementally; other texts are left to `parse_json_markdown`.
+    """
+
+    def __init__(self) -> None:
+        self._head = ""
+        self._parser: PartialJsonParser | None = None
+
+    def feed(self, chunk: GenerationChunk | ChatGenerationChunk) -> bool:
+        text = chunk.text
+        if self._parser is None:
+            self._head += text
+            start = _find_json_start(self._head)
+            if start is None:
+                return False
+            text = self._head[start:]
+            self._parser = PartialJsonParser(strip_chars=_json_strip_chars)
+        return self._parser.feed(text)
+
+    def value(self) -> Any:
+        return self._parser.value() if self._parser is not None else None
+
+    def patch(self) -> Any:
+        return self._parser.patch() if self._parser is not None else []
+
+
+def _find_json_start(text: str) -> int | None:
+    """Return where the JSON document starts, or `None` if it is too early to tell.
+
+    Raises:
+        ValueError: If the text does not start with a JSON object or array.
+    """
+    body = text.lstrip(" \n\r\t")
+    if body.startswith("```"):
+        body = body[3:]
+        if len(body) < len("json") and "json".startswith(body):
+            return None
+        body = body.removeprefix("json")
+    body = body.lstrip(_json_strip_chars)
+    if not body:
+        return None
+    if body[0] not in "{[":
+        msg = "Text does not start with a JSON object or array."
+        raise ValueError(msg)
+    return len(text) - len(body)
+
+
 # For backwards compatibility
 SimpleJsonOutputParser = JsonOutputParser
 
@@ -6,15 +6,25 @@ import logging
 from json import JSONDecodeError
 from typing import Annotated, Any
 
+import jsonpatch  # type: ignore[import-untyped]
 from pydantic import SkipValidation, ValidationError
+from typing_extensions import override
 
 from langchain_core.exceptions import OutputParserException
-from langchain_core.messages import AIMessage, InvalidToolCall
+from langchain_core.messages import AIMessage, AIMessageChunk, InvalidToolCall
 from langchain_core.messages.tool import invalid_tool_call
 from langchain_core.messages.tool import tool_call as create_tool_call
-from langchain_core.output_parsers.transform import BaseCumulativeTransformOutputParser
-from langchain_core.outputs import ChatGeneration, Generation
-from langchain_core.utils.json import parse_partial_json
+from langchain_core.output_parsers.transform import (
+    BaseCumulativeTransformOutputParser,
+    IncrementalParse,
+)
+from langchain_core.outputs import (
+    ChatGeneration,
+    ChatGenerationChunk,
+    Generation,
+    GenerationChunk,
+)
+from langchain_core.utils.json import PartialJsonParser, parse_partial_json
 from langchain_core.utils.pydantic import (
     TypeBaseModel,
     is_pydantic_v1_subclass,
@@ -137,8 +147,132 @@ def parse_tool_calls(
     return final_tools
 
 
+class _StreamedToolCall:
+    """A tool call being assembled from `tool_call_chunks`."""
+
+    __slots__ = ("args", "id", "name")
+
+    def __init__(self) -> None:
+        self.name = ""
+        self.id: str | None = None
+        self.args = PartialJsonParser()
+
+    def to_dict(self, *, return_id: bool) -> dict[str, Any]:
+        tool_call: dict[str, Any] = {
+            "args": self.args.value() if self.args.started else {}
+        }
+        if return_id:
+            tool_call["id"] = self.id
+        tool_call["type"] = self.name
+        return tool_call
+
+
+class _ToolCallsParse(IncrementalParse):
+    """Follow the tool calls of a stream of `AIMessageChunk`s incrementally.
+
+    The arguments of each tool call are parsed as their chunks arrive instead of
+    reparsing the arguments accumulated so far. Streams this cannot mirror
+    exactly (chunks without an index, legacy `additional_kwargs` tool calls,
+    arguments that are not a JSON object) are left to `parse_result`.
+    """
+
+    def __init__(self, *, return_id: bool, first_tool_only: bool) -> None:
+        self.return_id = return_id
+        self.first_tool_only = first_tool_only
+        self._calls: list[_StreamedToolCall] = []
+        self._positions: dict[int, int] = {}
+        self._emitted = False
+        self._patch: list[dict[str, Any]] = []
+
+    def feed(self, chunk: GenerationChunk | ChatGenerationChunk) -> bool:
+        message = chunk.message if isinstance(chunk, ChatGenerationChunk) else None
+        if not isinstance(message, AIMessageChunk):
+            msg = "Only AIMessageChunk streams are parsed incrementally."
+            raise ValueError(msg)  # noqa: TRY004
+        self._patch = []
+        seen: set[int] = set()
+        for tool_call_chunk in message.tool_call_chunks:
+            index = tool_call_chunk["index"]
+            if not isinstance(index, int) or index in seen:
+                msg = "Tool call chunks must have distinct integer indexes."
+                raise ValueError(msg)
+            seen.add(index)
+            self._feed_tool_call(index, tool_call_chunk)
+        if not self._calls and "tool_calls" in message.additional_kwargs:
+            msg = "Legacy tool calls are not parsed incrementally."
+            raise ValueError(msg)
+        if self._emitted:
+            return bool(self._patch)
+        self._emitted = True
+        self._patch = [{"op": "replace", "path": "", "value": self.value()}]
+        return True
+
+    def _feed_tool_call(self, index: int, tool_call_chunk: Any) -> None:
+        position = self._positions.get(index)
+        if position is None:
+            position = self._positions[index] = len(self._calls)
+            call = _StreamedToolCall()
+            self._calls.append(call)
+            added = True
+        else:
+            call = self._calls[position]
+            added = False
+        if self.first_tool_only and position:
+            # Only the first tool call is output; keep the others valid.
+            prefix = None
+        elif self.first_tool_only:
+            prefix = ""
+        else:
+            prefix = f"/{position}"
+        ops: list[dict[str, Any]] = []
+        if name := tool_call_chunk["name"]:
+            call.name += name
+            ops.append({"op": "replace", "path": "/type", "value": call.name})
+        if (id_ := tool_call_chunk["id"]) is not None and id_ != call.id:
+            call.id = id_ if call.id is None else call.id + id_
+            if self.return_id:
+                ops.append({"op": "replace", "path": "/id", "value": call.id})
+        if args := tool_call_chunk["args"]:
+            if not call.args.started:
+                # Arguments start as `{}`, which is what an opening brace parses to.
+                if not args.startswith("{"):
+                    msg = "Tool call arguments are not a JSON object."
+                    raise ValueError(msg)
+                call.args.feed("{")
+                args = args[1:]
+            if call.args.feed(args):
+                ops.extend(
+                    {**op, "path": "/args" + op["path"]} for op in call.args.patch()
+                )
+            if call.args.extra:
+                msg = "Tool call arguments have extra data after the JSON object."
+                raise ValueError(msg)
+        if prefix is None or not self._emitted:
+            return
+        if added:
+            value = call.to_dict(return_id=self.return_id)
+            op = "replace" if self.first_tool_only else "add"
+            self._patch.append({"op": op, "path": prefix, "value": value})
+        else:
+            self._patch.extend({**op, "path": prefix + op["path"]} for op in ops)
+
+    def value(self) -> Any:
+        # Like `parse_result`, a message without tool calls parses to `[]` even
+        # when only the first tool call is requested.
+        if self.first_tool_only and self._calls:
+            return self._calls[0].to_dict(return_id=self.return_id)
+        return [call.to_dict(return_id=self.return_id) for call in self._calls]
+
+    def patch(self) -> Any:
+        return self._patch
+
+
 class JsonOutputToolsParser(BaseCumulativeTransformOutputParser[Any]):
-    """Parse tools from OpenAI response."""
+    """Parse tools from OpenAI response.
+
+    In streaming, if `diff` is set to `True`, yields JSONPatch operations describing the
+    difference between the previous and the current tool calls.
+    """
 
     strict: bool = False
     """Whether to allow non-JSON-compliant strings.
@@ -160,6 +294,23 @@ class JsonOutputToolsParser(BaseCumulativeTransformOutputParser[Any]):
     If no tool calls are found, None will be returned.
     """
 
+    @override
+    def _diff(self, prev: Any | None, next: Any) -> Any:
+        return jsonpatch.make_patch(prev, next).patch
+
+    @override
+    def _incremental_parse(self) -> IncrementalParse | None:
+        # Subclasses customizing parsing keep reparsing the accumulated output.
+        cls = type(self)
+        if (
+            cls.parse_result is not JsonOutputToolsParser.parse_result
+            or cls._diff is not JsonOutputToolsParser._diff
+        ):
+            return None
+        return _ToolCallsParse(
+            return_id=self.return_id, first_tool_only=self.first_tool_only
+        )
+
     def parse_result(self, result: list[Generation], *, partial: bool = False) -> Any:
         """Parse the result of an LLM call to a list of tool calls.
 
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import functools
+import operator
+from abc import ABC, abstractmethod
 from typing import (
     TYPE_CHECKING,
     Any,
+    cast,
 )
 
 from typing_extensions import override
@@ -17,6 +21,7 @@ from langchain_core.outputs import (
     Generation,
     GenerationChunk,
 )
+from langchain_core.outputs.chat_generation import merge_chat_generation_chunks
 from langchain_core.runnables.config import run_in_executor
 
 if TYPE_CHECKING:
@@ -96,6 +101,47 @@ class BaseTransformOutputParser(BaseOutputParser[T]):
             yield chunk
 
 
+def _merge_chunks(
+    chunks: list[GenerationChunk | ChatGenerationChunk],
+) -> GenerationChunk | ChatGenerationChunk | None:
+    if not chunks:
+        return None
+    if all(isinstance(chunk, ChatGenerationChunk) for chunk in chunks):
+        return merge_chat_generation_chunks(cast("list[ChatGenerationChunk]", chunks))
+    return functools.reduce(operator.add, chunks)
+
+
+class IncrementalParse(ABC):
+    """State of a cumulative parser following a single stream incrementally.
+
+    Instead of reparsing everything accumulated so far on each chunk, the state
+    only looks at the new chunk, which keeps streaming linear in the output size.
+    """
+
+    @abstractmethod
+    def feed(self, chunk: GenerationChunk | ChatGenerationChunk) -> bool:
+        """Consume the next chunk of the stream.
+
+        Args:
+            chunk: The new chunk.
+
+        Returns:
+            Whether the parsed output changed.
+
+        Raises:
+            ValueError: If the stream cannot be followed incrementally. The output
+                parser then falls back to reparsing the accumulated output.
+        """
+
+    @abstractmethod
+    def value(self) -> Any:
+        """Return the current parsed output."""
+
+    @abstractmethod
+    def patch(self) -> Any:
+        """Return the diff between the previous and the current parsed output."""
+
+
 class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
     """Base class for an output parser that can handle streaming input."""
 
@@ -122,10 +168,19 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
         """
         raise NotImplementedError
 
+    def _incremental_parse(self) -> IncrementalParse | None:
+        """Return the state to parse one stream incrementally, if supported.
+
+        Parsers returning `None` reparse the whole accumulated output on each chunk.
+        """
+        return None
+
     @override
     def _transform(self, input: Iterator[str | BaseMessage]) -> Iterator[Any]:
         prev_parsed = None
         acc_gen: GenerationChunk | ChatGenerationChunk | None = None
+        incremental = self._incremental_parse()
+        streamed: list[GenerationChunk | ChatGenerationChunk] = []
         for chunk in input:
             chunk_gen: GenerationChunk | ChatGenerationChunk
             if isinstance(chunk, BaseMessageChunk):
@@ -137,6 +192,22 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
             else:
                 chunk_gen = GenerationChunk(text=chunk)
 
+            if incremental is not None:
+                try:
+                    changed = incremental.feed(chunk_gen)
+                except ValueError:
+                    # Fall back to reparsing the accumulated output from now on.
+                    incremental = None
+                    acc_gen = _merge_chunks(streamed)
+                    if acc_gen is not None:
+                        prev_parsed = self.parse_result([acc_gen], partial=True)
+                else:
+                    # Only merge the chunks if we ever need to fall back.
+                    streamed.append(chunk_gen)
+                    if changed:
+                        yield incremental.patch() if self.diff else incremental.value()
+                    continue
+
             acc_gen = chunk_gen if acc_gen is None else acc_gen + chunk_gen  # type: ignore[operator]
 
             parsed = self.parse_result([acc_gen], partial=True)
@@ -153,6 +224,8 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
     ) -> AsyncIterator[T]:
         prev_parsed = None
         acc_gen: GenerationChunk | ChatGenerationChunk | None = None
+        incremental = self._incremental_parse()
+        streamed: list[GenerationChunk | ChatGenerationChunk] = []
         async for chunk in input:
             chunk_gen: GenerationChunk | ChatGenerationChunk
             if isinstance(chunk, BaseMessageChunk):
@@ -164,6 +237,22 @@ class BaseCumulativeTransformOutputParser(BaseTransformOutputParser[T]):
             else:
                 chunk_gen = GenerationChunk(text=chunk)
 
+            if incremental is not None:
+                try:
+                    changed = incremental.feed(chunk_gen)
+                except ValueError:
+                    # Fall back to reparsing the accumulated output from now on.
+                    incremental = None
+                    acc_gen = _merge_chunks(streamed)
+                    if acc_gen is not None:
+                        prev_parsed = await self.aparse_result([acc_gen], partial=True)
+                else:
+                    # Only merge the chunks if we ever need to fall back.
+                    streamed.append(chunk_gen)
+                    if changed:
+                        yield incremental.patch() if self.diff else incremental.value()
+                    continue
+
             acc_gen = chunk_gen if acc_gen is None else acc_gen + chunk_gen  # type: ignore[operator]
 
             parsed = await self.aparse_result([acc_gen], partial=True)
@@ -28,6 +28,7 @@ if TYPE_CHECKING:
     from langchain_core.outputs.chat_generation import (
         ChatGeneration,
         ChatGenerationChunk,
+        ChatGenerationChunkBuilder,
     )
     from langchain_core.outputs.chat_result import ChatResult
     from langchain_core.outputs.generation import Generation, GenerationChunk
@@ -37,6 +38,7 @@ if TYPE_CHECKING:
 __all__ = (
     "ChatGeneration",
     "ChatGenerationChunk",
+    "ChatGenerationChunkBuilder",
     "ChatResult",
     "Generation",
     "GenerationChunk",
@@ -47,6 +49,7 @@ __all__ = (
 _dynamic_imports = {
     "ChatGeneration": "chat_generation",
     "ChatGenerationChunk": "chat_generation",
+    "ChatGenerationChunkBuilder": "chat_generation",
     "ChatResult": "chat_result",
     "Generation": "generation",
     "GenerationChunk": "generation",
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Literal
 from pydantic import model_validator
 
 from langchain_core.messages import BaseMessage, BaseMessageChunk
+from langchain_core.messages.ai import AIMessageChunk, AIMessageChunkBuilder
 from langchain_core.outputs.generation import Generation
 from langchain_core.utils._merge import merge_dicts
 
@@ -123,6 +124,69 @@ class ChatGenerationChunk(ChatGeneration):
         raise TypeError(msg)
 
 
+class ChatGenerationChunkBuilder:
+    """Accumulate a stream of `ChatGenerationChunk`s into a single chunk.
+
+    Streams of `AIMessageChunk`s are merged in linear time with an
+    `AIMessageChunkBuilder`; other message chunks are added together once, when
+    the result is built.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty builder."""
+        self._first: ChatGenerationChunk | None = None
+        self._count = 0
+        self._builder: AIMessageChunkBuilder | None = AIMessageChunkBuilder()
+        self._messages: list[BaseMessageChunk] = []
+        self._generation_info: list[dict] = []
+
+    def __len__(self) -> int:
+        """Return the number of chunks added so far."""
+        return self._count
+
+    def add(self, chunk: ChatGenerationChunk) -> None:
+        """Append a chunk to the generation being built.
+
+        Args:
+            chunk: The next chunk of the stream.
+        """
+        if self._first is None:
+            self._first = chunk
+        self._count += 1
+        if chunk.generation_info:
+            self._generation_info.append(chunk.generation_info)
+        if self._builder is not None:
+            if isinstance(chunk.message, AIMessageChunk):
+                self._builder.add(chunk.message)
+                return
+            # Not a stream of AI messages: fall back to adding the messages.
+            if len(self._builder):
+                self._messages.append(self._builder.build())
+            self._builder = None
+        self._messages.append(chunk.message)
+
+    def build(self) -> ChatGenerationChunk | None:
+        """Merge the chunks added so far into a single chunk.
+
+        The builder can keep accumulating chunks afterwards.
+
+        Returns:
+            The merged chunk, or `None` if no chunk was added.
+        """
+        if self._first is None:
+            return None
+        if self._count == 1:
+            return self._first
+        if self._builder is not None:
+            message: BaseMessageChunk = self._builder.build()
+        else:
+            message = self._messages[0] + self._messages[1:]
+        return ChatGenerationChunk(
+            message=message,
+            generation_info=merge_dicts({}, *self._generation_info) or None,
+        )
+
+
 def merge_chat_generation_chunks(
     chunks: list[ChatGenerationChunk],
 ) -> ChatGenerationChunk | None:
@@ -134,10 +198,7 @@ def merge_chat_generation_chunks(
     Returns:
         A merged `ChatGenerationChunk`, or None if the input list is empty.
     """
-    if not chunks:
-        return None
-
-    if len(chunks) == 1:
-        return chunks[0]
-
-    return chunks[0] + chunks[1:]
+    builder = ChatGenerationChunkBuilder()
+    for chunk in chunks:
+        builder.add(chunk)
+    return builder.build()
@@ -6,6 +6,11 @@ import abc
 import asyncio
 import threading
 import time
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
 
 
 class BaseRateLimiter(abc.ABC):
@@ -244,7 +249,368 @@ class InMemoryRateLimiter(BaseRateLimiter):
         return True
 
 
+# A single lock guards every budget so that a limiter charging several budgets
+# reserves them atomically, in a single FIFO order across the process.
+_BUDGETS_LOCK = threading.Lock()
+_BUDGETS: dict[str, RateLimitBudget] = {}
+
+
+class RateLimitBudget:
+    """A token bucket allowing `limit` units per `period` seconds.
+
+    The unit is either one request or one LLM token. The bucket refills
+    continuously and may go into debt: an acquisition that cannot be covered is
+    charged right away and told how long to wait until the debt is paid back.
+    Since later acquisitions only add to the debt, callers are served in FIFO
+    order and each one sleeps exactly as long as needed, without polling.
+
+    Budgets created through `get_rate_limit_budget` are shared by every limiter
+    that refers to them by name, e.g. all the models using the same provider
+    account.
+    """
+
+    def __init__(
+        self,
+        limit: float,
+        *,
+        period: float = 60.0,
+        unit: Literal["requests", "tokens"] = "requests",
+        max_burst: float | None = None,
+    ) -> None:
+        """Create a budget.
+
+        Args:
+            limit: The number of units allowed per `period`.
+            period: The length of the period in seconds.
+            unit: Whether the budget counts requests or LLM tokens.
+            max_burst: The maximum number of units that can be used at once.
+                Defaults to `limit`, i.e. a full period's worth.
+
+        Raises:
+            ValueError: If `limit` or `period` is not positive.
+        """
+        if limit <= 0 or period <= 0:
+            msg = "limit and period must be greater than 0"
+            raise ValueError(msg)
+        self.limit = limit
+        self.period = period
+        self.unit = unit
+        self.capacity = limit if max_burst is None else max_burst
+        # Units that can be used right away; negative when in debt.
+        self.available = self.capacity
+        self.last: float | None = None
+
+    @property
+    def rate(self) -> float:
+        """Number of units added to the bucket per second."""
+        return self.limit / self.period
+
+    def refill(self, now: float) -> None:
+        """Add the units accrued since the last refill.
+
+        Not thread safe on its own: limiters call it under a shared lock.
+
+        Args:
+            now: The current `time.monotonic()` time.
+        """
+        if self.last is not None:
+            self.available = min(
+                self.capacity, self.available + (now - self.last) * self.rate
+            )
+        self.last = now
+
+    def credit(self, amount: float) -> None:
+        """Give `amount` units back to the budget, or charge them if negative.
+
+        Args:
+            amount: The number of units.
+        """
+        with _BUDGETS_LOCK:
+            self.refill(time.monotonic())
+            self.available = min(self.capacity, self.available + amount)
+
+
+def get_rate_limit_budget(
+    name: str,
+    limit: float,
+    *,
+    period: float = 60.0,
+    unit: Literal["requests", "tokens"] = "requests",
+    max_burst: float | None = None,
+) -> RateLimitBudget:
+    """Get the process-wide budget called `name`, creating it on first use.
+
+    Args:
+        name: The name of the budget.
+        limit: The number of units allowed per `period`.
+        period: The length of the period in seconds.
+        unit: Whether the budget counts requests or LLM tokens.
+        max_burst: The maximum number of units that can be used at once.
+
+    Returns:
+        The shared budget.
+
+    Raises:
+        ValueError: If a budget with this name exists with a different configuration.
+    """
+    with _BUDGETS_LOCK:
+        budget = _BUDGETS.get(name)
+        if budget is None:
+            budget = _BUDGETS[name] = RateLimitBudget(
+                limit, period=period, unit=unit, max_burst=max_burst
+            )
+            return budget
+    capacity = limit if max_burst is None else max_burst
+    if (budget.limit, budget.period, budget.unit, budget.capacity) != (
+        limit,
+        period,
+        unit,
+        capacity,
+    ):
+        msg = f"Rate limit budget {name!r} already exists with a different setup."
+        raise ValueError(msg)
+    return budget
+
+
+class RateLimitReservation:
+    """Units charged to a set of budgets by one acquisition."""
+
+    def __init__(
+        self, charges: list[tuple[RateLimitBudget, float]], tokens: float, wait: float
+    ) -> None:
+        """Record a reservation.
+
+        Args:
+            charges: The budgets charged and the units charged to each.
+            tokens: The estimated number of LLM tokens charged.
+            wait: The time in seconds until the reservation is covered.
+        """
+        self.charges = charges
+        self.tokens = tokens
+        self.wait = wait
+
+    def reconcile(self, actual_tokens: float) -> None:
+        """Replace the token estimate with the number of tokens actually used.
+
+        Tokens overestimated are given back to the token budgets, tokens
+        underestimated are charged on top and delay later callers.
+
+        Args:
+            actual_tokens: The number of tokens used, e.g. from `usage_metadata`.
+        """
+        delta = self.tokens - actual_tokens
+        if not delta:
+            return
+        for budget, _ in self.charges:
+            if budget.unit == "tokens":
+                budget.credit(delta)
+        self.tokens = actual_tokens
+
+    def release(self) -> None:
+        """Give back every unit charged, e.g. when the request was not made."""
+        for budget, units in self.charges:
+            budget.credit(self.tokens if budget.unit == "tokens" else units)
+        self.charges = []
+
+
+class TokenRateLimiter(BaseRateLimiter):
+    """A rate limiter charging both requests and estimated LLM tokens.
+
+    Providers typically enforce a number of requests per minute (RPM) as well as
+    a number of tokens per minute (TPM). This limiter charges every call one
+    request and its estimated prompt plus completion tokens against a set of
+    `RateLimitBudget`s. When a chat model gets the response, the estimate is
+    reconciled against the actual `usage_metadata`.
+
+    Waiting callers are served in FIFO order: each acquisition reserves its units
+    immediately and sleeps exactly until they are covered, instead of polling.
+
+    Giving a `name` shares the RPM and TPM budgets with every other limiter of the
+    same name in the process, so that all models hitting the same account draw
+    from the same budgets.
+
+    Example:
+        ```python
+        from langchain_core.rate_limiters import TokenRateLimiter
+
+        rate_limiter = TokenRateLimiter(
+            name="openai",
+            requests_per_minute=500,
+            tokens_per_minute=200_000,
+        )
+
+        from langchain_openai import ChatOpenAI
+
+        model = ChatOpenAI(model="gpt-4o-mini", rate_limiter=rate_limiter)
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        name: str | None = None,
+        budgets: Sequence[RateLimitBudget] = (),
+        chars_per_token: float = 4.0,
+        default_completion_tokens: int = 256,
+    ) -> None:
+        """Create a token rate limiter.
+
+        Args:
+            requests_per_minute: The number of requests allowed per minute.
+            tokens_per_minute: The number of LLM tokens allowed per minute.
+            name: If given, the requests and tokens budgets are the process-wide
+                budgets named `"{name}:requests"` and `"{name}:tokens"`.
+            budgets: Additional budgets to charge.
+            chars_per_token: Number of characters per token used to estimate the
+                prompt tokens.
+            default_completion_tokens: Number of completion tokens charged when
+                the model does not set `max_tokens`.
+
+        Raises:
+            ValueError: If no budget is configured.
+        """
+        self.budgets = list(budgets)
+        for limit, unit in (
+            (requests_per_minute, "requests"),
+            (tokens_per_minute, "tokens"),
+        ):
+            if limit is None:
+                continue
+            budget = (
+                get_rate_limit_budget(f"{name}:{unit}", limit, unit=unit)  # type: ignore[arg-type]
+                if name is not None
+                else RateLimitBudget(limit, unit=unit)  # type: ignore[arg-type]
+            )
+            self.budgets.append(budget)
+        if not self.budgets:
+            msg = "TokenRateLimiter needs at least one budget."
+            raise ValueError(msg)
+        self.chars_per_token = chars_per_token
+        self.default_completion_tokens = default_completion_tokens
+
+    def estimate_tokens(
+        self, messages: Sequence[BaseMessage], *, max_tokens: int | None = None
+    ) -> int:
+        """Estimate the prompt plus completion tokens of a call.
+
+        Args:
+            messages: The prompt messages.
+            max_tokens: The maximum number of completion tokens, if known.
+
+        Returns:
+            The estimated number of tokens.
+        """
+        from langchain_core.messages.utils import (  # noqa: PLC0415
+            count_tokens_approximately,
+        )
+
+        prompt_tokens = count_tokens_approximately(
+            messages, chars_per_token=self.chars_per_token
+        )
+        return prompt_tokens + (max_tokens or self.default_completion_tokens)
+
+    def _reserve(self, tokens: float, *, blocking: bool) -> RateLimitReservation | None:
+        charges = [
+            (budget, tokens if budget.unit == "tokens" else 1.0)
+            for budget in self.budgets
+        ]
+        with _BUDGETS_LOCK:
+            now = time.monotonic()
+            for budget, _ in charges:
+                budget.refill(now)
+            if not blocking and any(
+                budget.available < units for budget, units in charges
+            ):
+                return None
+            wait = 0.0
+            for budget, units in charges:
+                budget.available -= units
+                if budget.available < 0:
+                    wait = max(wait, -budget.available / budget.rate)
+        return RateLimitReservation(charges, tokens, wait)
+
+    def acquire_tokens(
+        self, tokens: float, *, blocking: bool = True
+    ) -> RateLimitReservation | None:
+        """Charge one request and `tokens` LLM tokens.
+
+        Args:
+            tokens: The estimated number of tokens of the call.
+            blocking: If `True`, wait until the budgets cover the charge. If
+                `False`, only charge if they already do.
+
+        Returns:
+            The reservation, to reconcile once the actual usage is known, or
+            `None` if `blocking` is `False` and the budgets are exhausted.
+        """
+        reservation = self._reserve(tokens, blocking=blocking)
+        if reservation is not None and reservation.wait > 0:
+            try:
+                time.sleep(reservation.wait)
+            except BaseException:
+                reservation.release()
+                raise
+        return reservation
+
+    async def aacquire_tokens(
+        self, tokens: float, *, blocking: bool = True
+    ) -> RateLimitReservation | None:
+        """Charge one request and `tokens` LLM tokens. Async version.
+
+        Args:
+            tokens: The estimated number of tokens of the call.
+            blocking: If `True`, wait until the budgets cover the charge. If
+                `False`, only charge if they already do.
+
+        Returns:
+            The reservation, to reconcile once the actual usage is known, or
+            `None` if `blocking` is `False` and the budgets are exhausted.
+        """
+        reservation = self._reserve(tokens, blocking=blocking)
+        if reservation is not None and reservation.wait > 0:
+            try:
+                await asyncio.sleep(reservation.wait)
+            except BaseException:
+                reservation.release()
+                raise
+        return reservation
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        """Charge one request and `default_completion_tokens` tokens.
+
+        Args:
+            blocking: If `True`, the method will block until the tokens are available.
+                If `False`, the method will return immediately with the result of
+                the attempt.
+
+        Returns:
+            `True` if the tokens were successfully acquired, `False` otherwise.
+        """
+        tokens = self.default_completion_tokens
+        return self.acquire_tokens(tokens, blocking=blocking) is not None
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        """Charge one request and `default_completion_tokens` tokens. Async version.
+
+        Args:
+            blocking: If `True`, the method will block until the tokens are available.
+                If `False`, the method will return immediately with the result of
+                the attempt.
+
+        Returns:
+            `True` if the tokens were successfully acquired, `False` otherwise.
+        """
+        tokens = self.default_completion_tokens
+        return await self.aacquire_tokens(tokens, blocking=blocking) is not None
+
+
 __all__ = [
     "BaseRateLimiter",
     "InMemoryRateLimiter",
+    "RateLimitBudget",
+    "RateLimitReservation",
+    "TokenRateLimiter",
+    "get_rate_limit_budget",
 ]
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 import uuid
 import warnings
+from collections import deque
 from collections.abc import Awaitable, Callable, Generator, Iterable, Iterator, Sequence
 from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from concurrent.futures import wait as futures_wait
 from contextlib import contextmanager
 from contextvars import Context, ContextVar, Token, copy_context
+from dataclasses import dataclass
 from functools import partial
 from typing import (
     TYPE_CHECKING,
@@ -79,7 +83,13 @@ class RunnableConfig(TypedDict, total=False):
     max_concurrency: int | None
     """Maximum number of parallel calls to make.
 
-    If not provided, defaults to `ThreadPoolExecutor`'s default.
+    If not provided, calls are only limited by the size of the executor.
+    """
+
+    executor_name: str
+    """Name of the shared executor running parallel calls, see `register_executor`.
+
+    If not provided, defaults to `'default'`.
     """
 
     recursion_limit: int
@@ -109,6 +119,7 @@ CONFIG_KEYS = [
     "callbacks",
     "run_name",
     "max_concurrency",
+    "executor_name",
     "recursion_limit",
     "configurable",
     "run_id",
@@ -557,12 +568,308 @@ class ContextThreadPoolExecutor(ThreadPoolExecutor):
         )
 
 
+@dataclass(frozen=True)
+class ExecutorStats:
+    """Snapshot of the activity of a `SharedThreadPoolExecutor`."""
+
+    max_workers: int
+    """Number of threads of the executor."""
+    running: int
+    """Number of tasks currently running on the executor's threads."""
+    queued: int
+    """Number of tasks waiting for a thread or for their `max_concurrency` slot."""
+    submitted: int
+    """Total number of tasks submitted."""
+    inlined: int
+    """Total number of nested tasks run by the submitting thread itself because the
+    executor was saturated."""
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the executor's threads currently running a task."""
+        return self.running / self.max_workers
+
+
+# The shared executor whose task the current thread is running, if any.
+_current_worker = threading.local()
+
+
+class SharedThreadPoolExecutor(Executor):
+    """Long-lived thread pool shared by every `Runnable` batch using it.
+
+    Creating a thread pool for each `batch` or `RunnableParallel` call spends more
+    time starting threads than running small fan-outs, and nested parallel runnables
+    multiply the number of threads. Instead, named executors are created once per
+    process (see `register_executor`) and `get_executor_for_config` hands out views
+    of them that enforce `max_concurrency` by queueing tasks rather than by sizing
+    a pool.
+
+    Like `ContextThreadPoolExecutor`, the context is copied to the thread running
+    each task. When a task running on this executor submits more tasks while every
+    thread is busy or reserved, those run in the submitting thread instead, so that
+    nested parallelism cannot deadlock the pool.
+    """
+
+    def __init__(self, max_workers: int, *, thread_name_prefix: str = "") -> None:
+        """Create a shared executor.
+
+        Args:
+            max_workers: The number of threads of the executor.
+            thread_name_prefix: The prefix of the threads' names.
+
+        Raises:
+            ValueError: If `max_workers` is not positive.
+        """
+        if max_workers <= 0:
+            msg = "max_workers must be greater than 0"
+            raise ValueError(msg)
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+        self._lock = threading.Lock()
+        self._running = 0
+        self._queued = 0
+        self._deferred = 0
+        self._submitted = 0
+        self._inlined = 0
+
+    def submit(  # type: ignore[override]
+        self,
+        func: Callable[P, T],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[T]:
+        """Submit a function to the executor.
+
+        Args:
+            func: The function to submit.
+            *args: The positional arguments to the function.
+            **kwargs: The keyword arguments to the function.
+
+        Returns:
+            The future for the function.
+        """
+        call = cast(
+            "Callable[[], T]", partial(copy_context().run, func, *args, **kwargs)
+        )
+        with self._lock:
+            self._submitted += 1
+            # Every queued task has a thread to run on, so a nested task may only be
+            # queued if one is left; otherwise its parent could wait for it forever.
+            inline = (
+                getattr(_current_worker, "executor", None) is self
+                and self._running + self._queued >= self.max_workers
+            )
+            if inline:
+                self._inlined += 1
+            else:
+                self._queued += 1
+        if inline:
+            future: Future[T] = Future()
+            future.set_running_or_notify_cancel()
+            try:
+                result = call()
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+            return future
+        try:
+            future = self._pool.submit(self._run, call)
+        except BaseException:
+            with self._lock:
+                self._queued -= 1
+            raise
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _run(self, call: Callable[[], T]) -> T:
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        _current_worker.executor = self
+        try:
+            return call()
+        finally:
+            _current_worker.executor = None
+            with self._lock:
+                self._running -= 1
+
+    def _on_done(self, future: Future) -> None:
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+
+    def stats(self) -> ExecutorStats:
+        """Return a snapshot of the executor's activity."""
+        with self._lock:
+            return ExecutorStats(
+                max_workers=self.max_workers,
+                running=self._running,
+                queued=self._queued + self._deferred,
+                submitted=self._submitted,
+                inlined=self._inlined,
+            )
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:  # noqa: FBT001, FBT002
+        """Shut down the executor's threads.
+
+        Args:
+            wait: Whether to wait for the running tasks to finish.
+            cancel_futures: Whether to cancel the tasks that have not started.
+        """
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+class _LimitedExecutor(Executor):
+    """View of a shared executor running at most `max_concurrency` tasks at once.
+
+    Tasks over the limit wait in the view's own queue instead of blocking the
+    submitting thread. Leaving the view waits for its tasks, like shutting down a
+    `ThreadPoolExecutor`.
+    """
+
+    def __init__(
+        self, executor: SharedThreadPoolExecutor, max_concurrency: int | None
+    ) -> None:
+        self._executor = executor
+        self._max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._active = 0
+        self._pending: deque[tuple[Future, Callable[[], Any]]] = deque()
+        self._futures: list[Future] = []
+
+    def submit(  # type: ignore[override]
+        self,
+        func: Callable[P, T],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> Future[T]:
+        if self._max_concurrency is None:
+            future = self._executor.submit(func, *args, **kwargs)
+            self._futures.append(future)
+            return future
+        outer: Future[T] = Future()
+        call = partial(copy_context().run, func, *args, **kwargs)
+        with self._lock:
+            self._futures.append(outer)
+            if self._active >= self._max_concurrency:
+                self._pending.append((outer, call))
+                with self._executor._lock:  # noqa: SLF001
+                    self._executor._deferred += 1  # noqa: SLF001
+                return outer
+            self._active += 1
+        self._launch(outer, call)
+        return outer
+
+    def _launch(self, outer: Future, call: Callable[[], Any]) -> None:
+        if not outer.set_running_or_notify_cancel():
+            self._release()
+            return
+        try:
+            inner = self._executor.submit(call)
+        except BaseException as e:
+            outer.set_exception(e)
+            self._release()
+            return
+
+        def done(inner: Future) -> None:
+            try:
+                exception = inner.exception()
+            except BaseException as e:  # cancelled by an executor shutdown
+                exception = e
+            if exception is None:
+                outer.set_result(inner.result())
+            else:
+                outer.set_exception(exception)
+            self._release()
+
+        inner.add_done_callback(done)
+
+    def _release(self) -> None:
+        with self._lock:
+            if not self._pending:
+                self._active -= 1
+                return
+            outer, call = self._pending.popleft()
+            with self._executor._lock:  # noqa: SLF001
+                self._executor._deferred -= 1  # noqa: SLF001
+        self._launch(outer, call)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:  # noqa: FBT001, FBT002
+        if cancel_futures:
+            for future in self._futures:
+                future.cancel()
+        if wait:
+            futures_wait(self._futures)
+
+
+_EXECUTORS_LOCK = threading.Lock()
+_EXECUTORS: dict[str, SharedThreadPoolExecutor] = {}
+DEFAULT_EXECUTOR_NAME = "default"
+_DEFAULT_MAX_WORKERS = 64
+
+
+def register_executor(name: str, *, max_workers: int) -> SharedThreadPoolExecutor:
+    """Create a named shared executor, selectable with the `executor_name` config key.
+
+    If an executor with this name already exists, it is shut down once its running
+    tasks complete and replaced.
+
+    Args:
+        name: The name of the executor.
+        max_workers: The number of threads of the executor.
+
+    Returns:
+        The new executor.
+    """
+    executor = SharedThreadPoolExecutor(
+        max_workers, thread_name_prefix=f"langchain-{name}"
+    )
+    with _EXECUTORS_LOCK:
+        previous = _EXECUTORS.get(name)
+        _EXECUTORS[name] = executor
+    if previous is not None:
+        previous.shutdown(wait=False)
+    return executor
+
+
+def get_executor(name: str = DEFAULT_EXECUTOR_NAME) -> SharedThreadPoolExecutor:
+    """Get a shared executor by name.
+
+    The default executor is created on first use with 64 threads.
+
+    Args:
+        name: The name of the executor.
+
+    Returns:
+        The executor.
+
+    Raises:
+        ValueError: If no executor with this name was registered.
+    """
+    with _EXECUTORS_LOCK:
+        executor = _EXECUTORS.get(name)
+        if executor is None:
+            if name != DEFAULT_EXECUTOR_NAME:
+                msg = f"No executor named {name!r}, see register_executor()."
+                raise ValueError(msg)
+            executor = _EXECUTORS[name] = SharedThreadPoolExecutor(
+                _DEFAULT_MAX_WORKERS, thread_name_prefix="langchain-default"
+            )
+        return executor
+
+
 @contextmanager
 def get_executor_for_config(
     config: RunnableConfig | None,
 ) -> Generator[Executor, None, None]:
     """Get an executor for a config.
 
+    The executor runs tasks on the shared executor named by `executor_name`, at most
+    `max_concurrency` at a time. Exiting the context waits for the submitted tasks.
+
     Args:
         config: The config.
 
@@ -570,10 +877,9 @@ def get_executor_for_config(
         The executor.
     """
     config = config or {}
-    with ContextThreadPoolExecutor(
-        max_workers=config.get("max_concurrency")
-    ) as executor:
-        yield executor
+    executor = get_executor(config.get("executor_name") or DEFAULT_EXECUTOR_NAME)
+    with _LimitedExecutor(executor, config.get("max_concurrency")) as limited:
+        yield limited
 
 
 async def run_in_executor(
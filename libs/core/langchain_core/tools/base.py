@@ -5,6 +5,7 @@ from __future__ import annotations
 import functools
 import inspect
 import json
+import operator
 import typing
 import warnings
 from abc import ABC, abstractmethod
@@ -387,6 +388,7 @@ class ToolException(Exception):  # noqa: N818
 ArgsSchema = TypeBaseModel | dict[str, Any]
 
 _EMPTY_SET: frozenset[str] = frozenset()
+_T = TypeVar("_T")
 
 
 class BaseTool(RunnableSerializable[str | dict | ToolCall, Any]):
@@ -560,8 +562,10 @@ class ChildTool(BaseTool):
         elif self.args_schema and issubclass(self.args_schema, BaseModelV1):
             json_schema = self.args_schema.schema()
         else:
-            input_schema = self.get_input_schema()
-            json_schema = input_schema.model_json_schema()
+            json_schema = self._cached_schema(
+                "input_json_schema",
+                lambda: self.get_input_schema().model_json_schema(),
+            )
         return json_schema["properties"]
 
     @property
@@ -580,6 +584,9 @@ class ChildTool(BaseTool):
 
             return self.args_schema
 
+        return self._cached_schema("tool_call_schema", self._create_tool_call_schema)
+
+    def _create_tool_call_schema(self) -> ArgsSchema:
         full_schema = self.get_input_schema()
         fields = []
         for name, type_ in get_all_basemodel_annotations(full_schema).items():
@@ -594,6 +601,33 @@ class ChildTool(BaseTool):
         # base implementation doesn't manage injected args
         return _EMPTY_SET
 
+    @functools.cached_property
+    def _schema_cache(self) -> dict[str, tuple[tuple[Any, ...], Any]]:
+        return {}
+
+    def _cached_schema(self, key: str, build: Callable[[], _T]) -> _T:
+        """Return the schema cached under `key`, building it on first use.
+
+        Schemas are compiled once per version of the tool: an entry is reused as
+        long as none of the tool's fields has been reassigned since it was built.
+        Fields mutated in place (e.g. a JSON schema `args_schema`) are not
+        detected. Cached values are shared, so callers must not mutate them.
+
+        Args:
+            key: The kind of schema, e.g. `'tool_call_schema'`.
+            build: Builds the schema on a cache miss.
+
+        Returns:
+            The cached or newly built schema.
+        """
+        version = tuple(self.__dict__.get(name) for name in type(self).model_fields)
+        cached = self._schema_cache.get(key)
+        if cached is not None and all(map(operator.is_, cached[0], version)):
+            return cast("_T", cached[1])
+        schema = build()
+        self._schema_cache[key] = (version, schema)
+        return schema
+
     # --- Runnable ---
 
     @override
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import collections
+import copy
 import inspect
 import logging
 import types
@@ -398,7 +399,16 @@ def convert_to_openai_function(
             "dict", _convert_typed_dict_to_openai_function(cast("type", function))
         )
     elif isinstance(function, langchain_core.tools.base.BaseTool):
-        oai_function = cast("dict", _format_tool_to_openai_function(function))
+        # Formatting a tool compiles its JSON schema, so cache it on the tool.
+        tool = function
+        return copy.deepcopy(
+            tool._cached_schema(  # noqa: SLF001
+                f"openai_function:{strict}",
+                lambda: _set_strict(
+                    cast("dict", _format_tool_to_openai_function(tool)), strict
+                ),
+            )
+        )
     elif callable(function):
         oai_function = cast(
             "dict", _convert_python_function_to_openai_function(function)
@@ -411,7 +421,10 @@ def convert_to_openai_function(
             " 'title' and 'description' keys."
         )
         raise ValueError(msg)
+    return _set_strict(oai_function, strict)
+
 
+def _set_strict(oai_function: dict[str, Any], strict: bool | None) -> dict[str, Any]:  # noqa: FBT001
     if strict is not None:
         if "strict" in oai_function and oai_function["strict"] != strict:
             msg = (
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import copy
 import json
 import re
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NoReturn
 
 from langchain_core.exceptions import OutputParserException
 
@@ -207,3 +208,426 @@ def parse_and_check_json_markdown(text: str, expected_keys: list[str]) -> dict:
             )
             raise OutputParserException(msg)
     return json_obj
+
+
+_WHITESPACE = frozenset(" \t\n\r")
+_STRING_RUN = re.compile(r'[^"\\]+')
+_NUMBER_RUN = re.compile(r"[0-9eE+\-.]+")
+_LITERAL_RUN = re.compile(r"[a-z]+")
+_LITERALS = {"true": True, "false": False, "null": None}
+# A trailing escape sequence that has not been fully received yet.
+_PARTIAL_ESCAPE = re.compile(r"(?<!\\)(?:\\\\)*(\\|\\u[0-9a-fA-F]{0,3})\Z")
+_MISSING = object()
+
+# Scanner states.
+_VALUE = 0  # Expecting a value.
+_FIRST_VALUE = 1  # Expecting a value or the end of an empty list.
+_KEY = 2  # Expecting a key.
+_FIRST_KEY = 3  # Expecting a key or the end of an empty object.
+_COLON = 4  # Expecting the colon after a key.
+_AFTER_VALUE = 5  # Expecting a comma or the end of the container.
+_STRING = 6
+_NUMBER = 7
+_LITERAL = 8
+_DONE = 9
+
+
+class _Frame:
+    """An open container and the slot of the value being parsed inside it."""
+
+    __slots__ = ("container", "slot", "slot_in_parent")
+
+    def __init__(self, container: dict | list, slot_in_parent: str | int | None):
+        self.container = container
+        self.slot_in_parent = slot_in_parent
+        self.slot: str | int | None = None
+
+
+class PartialJsonParser:
+    r"""Parse a JSON value incrementally as it is being streamed.
+
+    Unlike `parse_partial_json`, which rescans the whole buffer every time, this
+    parser keeps its state between calls to `feed` and only looks at the new
+    characters, so following a stream of `n` characters costs `O(n)` in total.
+
+    The current value mirrors what `parse_partial_json` returns for everything fed
+    so far: unfinished strings and numbers are included as far as they go, while
+    dangling keys and incomplete literals are left out. A trailing backslash is
+    dropped from an unfinished string, but a string cut inside a `\uXXXX` escape
+    is left out along with its key, until the escape is complete. Anything after
+    the end of the top-level value is ignored.
+
+    Example:
+        ```python
+        parser = PartialJsonParser()
+        parser.feed('{"name": "Jo')
+        parser.value()  # {'name': 'Jo'}
+        parser.feed('hn", "tags": [')
+        parser.patch()
+        # [{'op': 'replace', 'path': '/name', 'value': 'John'},
+        #  {'op': 'add', 'path': '/tags', 'value': []}]
+        ```
+    """
+
+    def __init__(self, *, strict: bool = False, strip_chars: str = "") -> None:
+        """Create a parser.
+
+        Args:
+            strict: Whether to disallow control characters inside strings.
+            strip_chars: Characters stripped from the end of an unfinished string,
+                to mirror callers that strip the whole buffer before parsing it.
+        """
+        self.strict = strict
+        self.strip_chars = strip_chars
+        self._root: Any = _MISSING
+        self._stack: list[_Frame] = []
+        self._state = _VALUE
+        self._buffer: list[str] = []
+        self._is_key = False
+        self._escaped = False
+        self._error: json.JSONDecodeError | None = None
+        self._extra = False
+        self._changes: dict[tuple[str | int, ...], str] = {}
+
+    @property
+    def started(self) -> bool:
+        """Whether the top-level value has started."""
+        return self._root is not _MISSING
+
+    @property
+    def done(self) -> bool:
+        """Whether the top-level value is complete."""
+        return self._state == _DONE
+
+    @property
+    def extra(self) -> bool:
+        """Whether anything but whitespace followed the top-level value."""
+        return self._extra
+
+    def feed(self, text: str) -> bool:
+        """Consume the next piece of the JSON document.
+
+        Args:
+            text: The new characters.
+
+        Returns:
+            Whether the parsed value changed.
+
+        Raises:
+            json.JSONDecodeError: If the text is not a prefix of a JSON document.
+                The parser cannot be used any further afterwards.
+        """
+        if self._error is not None:
+            raise self._error
+        self._changes = {}
+        try:
+            self._scan(text)
+            if self._state == _STRING and not self._is_key:
+                string = self._decode_string(partial=True, text=text)
+                if string is _MISSING:
+                    self._unset()
+                else:
+                    self._set(string)
+            elif self._state == _NUMBER:
+                number = self._partial_number()
+                if number is not _MISSING:
+                    self._set(number)
+            elif self._state == _LITERAL:
+                literal = "".join(self._buffer)
+                if literal in _LITERALS:
+                    self._set(_LITERALS[literal])
+        except json.JSONDecodeError as e:
+            self._error = e
+            raise
+        return bool(self._changes)
+
+    def value(self) -> Any:
+        """Return a copy of the value parsed so far, or `None` if it has not started.
+
+        Containers that are still open are copied; completed values are shared
+        with the parser, which never modifies them again.
+        """
+        if self._root is _MISSING:
+            return None
+        if not self._stack:
+            return self._root
+        return self._copy_open(0)
+
+    def patch(self) -> list[dict[str, Any]]:
+        """Describe the changes made by the last `feed` as JSON patch operations.
+
+        The operations are compatible with those produced by `jsonpatch.make_patch`
+        between the previous and the current value.
+        """
+        ops: list[dict[str, Any]] = []
+        added: list[tuple[str | int, ...]] = []
+        for path, op in self._changes.items():
+            if any(path[: len(prefix)] == prefix for prefix in added):
+                continue
+            if op == "remove":
+                ops.append({"op": op, "path": _json_pointer(path)})
+                continue
+            ops.append(
+                {"op": op, "path": _json_pointer(path), "value": self._value_at(path)}
+            )
+            if op == "add" or not path:
+                added.append(path)
+        return ops
+
+    def _fail(self, message: str, index: int, text: str) -> NoReturn:
+        raise json.JSONDecodeError(message, text, index)
+
+    def _scan(self, text: str) -> None:
+        i = 0
+        n = len(text)
+        while i < n:
+            state = self._state
+            if state == _STRING:
+                i = self._scan_string(text, i)
+                continue
+            if state == _NUMBER:
+                match = _NUMBER_RUN.match(text, i)
+                if match:
+                    self._buffer.append(match.group())
+                    i = match.end()
+                    continue
+                self._end_number(text, i)
+                continue
+            if state == _LITERAL:
+                match = _LITERAL_RUN.match(text, i)
+                if match:
+                    self._buffer.append(match.group())
+                    i = match.end()
+                    continue
+                self._end_literal(text, i)
+                continue
+            if state == _DONE:
+                self._extra = self._extra or bool(text[i:].strip())
+                return
+            char = text[i]
+            i += 1
+            if char in _WHITESPACE:
+                continue
+            if state in {_VALUE, _FIRST_VALUE}:
+                if char == "]" and state == _FIRST_VALUE:
+                    self._close(list)
+                else:
+                    self._start_value(char, text, i - 1)
+            elif state in {_KEY, _FIRST_KEY}:
+                if char == '"':
+                    self._state = _STRING
+                    self._is_key = True
+                    self._buffer = []
+                    self._escaped = False
+                elif char == "}" and state == _FIRST_KEY:
+                    self._close(dict)
+                else:
+                    self._fail("Expecting property name", i - 1, text)
+            elif state == _COLON:
+                if char != ":":
+                    self._fail("Expecting ':' delimiter", i - 1, text)
+                self._state = _VALUE
+            elif char == ",":
+                frame = self._stack[-1]
+                frame.slot = None
+                self._state = _KEY if isinstance(frame.container, dict) else _VALUE
+            elif char in "}]":
+                self._close(dict if char == "}" else list, text, i - 1)
+            else:
+                self._fail("Expecting ',' delimiter", i - 1, text)
+
+    def _start_value(self, char: str, text: str, index: int) -> None:
+        if self._stack:
+            frame = self._stack[-1]
+            if isinstance(frame.container, list):
+                frame.slot = len(frame.container)
+        if char == '"':
+            self._state = _STRING
+            self._is_key = False
+            self._buffer = []
+            self._escaped = False
+            self._set("")
+        elif char in "{[":
+            container: dict | list = {} if char == "{" else []
+            slot = self._stack[-1].slot if self._stack else None
+            self._set(container)
+            self._stack.append(_Frame(container, slot))
+            self._state = _FIRST_KEY if char == "{" else _FIRST_VALUE
+        elif char == "-" or char.isdigit():
+            self._state = _NUMBER
+            self._buffer = [char]
+        elif char in "tfn":
+            self._state = _LITERAL
+            self._buffer = [char]
+        else:
+            self._fail("Expecting value", index, text)
+
+    def _scan_string(self, text: str, i: int) -> int:
+        n = len(text)
+        buffer = self._buffer
+        while i < n:
+            if self._escaped:
+                buffer.append(text[i])
+                self._escaped = False
+                i += 1
+                continue
+            match = _STRING_RUN.match(text, i)
+            if match:
+                buffer.append(match.group())
+                i = match.end()
+                if i == n:
+                    break
+            char = text[i]
+            i += 1
+            if char == "\\":
+                buffer.append(char)
+                self._escaped = True
+                continue
+            # Closing quote.
+            value = self._decode_string(partial=False, text=text, index=i - 1)
+            if self._is_key:
+                self._stack[-1].slot = value
+                self._state = _COLON
+            else:
+                self._set(value)
+                self._end_value()
+            break
+        return i
+
+    def _decode_string(self, *, partial: bool, text: str = "", index: int = 0) -> Any:
+        r"""Decode the buffered string.
+
+        Returns:
+            The string, or `_MISSING` if a partial string ends inside a `\uXXXX`
+            escape: `parse_partial_json` then drops the string and its key.
+        """
+        raw = "".join(self._buffer)
+        self._buffer = [raw]
+        if partial:
+            if self.strip_chars:
+                raw = raw.rstrip(self.strip_chars)
+            if match := _PARTIAL_ESCAPE.search(raw):
+                if match.group(1) != "\\":
+                    return _MISSING
+                raw = raw[: match.start(1)]
+        try:
+            return json.loads(f'"{raw}"', strict=self.strict)
+        except json.JSONDecodeError:
+            self._fail("Invalid string", index, text)
+
+    def _partial_number(self) -> Any:
+        number = "".join(self._buffer)
+        self._buffer = [number]
+        while number:
+            try:
+                return json.loads(number)
+            except json.JSONDecodeError:
+                number = number[:-1]
+        return _MISSING
+
+    def _end_number(self, text: str, index: int) -> None:
+        try:
+            value = json.loads("".join(self._buffer))
+        except json.JSONDecodeError:
+            self._fail("Invalid number", index, text)
+        self._set(value)
+        self._end_value()
+
+    def _end_literal(self, text: str, index: int) -> None:
+        literal = "".join(self._buffer)
+        if literal not in _LITERALS:
+            self._fail("Expecting value", index, text)
+        self._set(_LITERALS[literal])
+        self._end_value()
+
+    def _end_value(self) -> None:
+        self._state = _AFTER_VALUE if self._stack else _DONE
+
+    def _close(self, kind: type[dict | list], text: str = "", index: int = 0) -> None:
+        frame = self._stack[-1]
+        if not isinstance(frame.container, kind):
+            self._fail("Mismatched closing bracket", index, text)
+        self._stack.pop()
+        self._end_value()
+
+    def _set(self, value: Any) -> None:
+        """Store the value being parsed and record the change, if any.
+
+        A number that grows from `1` into `1.0` is stored but not reported, as
+        the two compare equal.
+        """
+        if not self._stack:
+            changed = self._root is _MISSING or self._root != value
+            self._root = value
+            if changed:
+                self._changes.setdefault((), "replace")
+            return
+        frame = self._stack[-1]
+        container = frame.container
+        slot = frame.slot
+        if isinstance(container, list) and slot == len(container):
+            op = "add"
+            container.append(value)
+        elif isinstance(container, dict) and slot not in container:
+            op = "add"
+            container[slot] = value
+        else:
+            op = "replace"
+            changed = container[slot] != value  # type: ignore[index]
+            container[slot] = value  # type: ignore[index]
+            if not changed:
+                return
+        path = tuple(f.slot for f in self._stack)
+        self._changes.setdefault(path, op)  # type: ignore[arg-type]
+
+    def _unset(self) -> None:
+        """Remove the value being parsed and record the change, if any."""
+        if not self._stack:
+            if self._root is not _MISSING:
+                self._root = _MISSING
+                self._changes[()] = "replace"
+            return
+        frame = self._stack[-1]
+        container = frame.container
+        slot = frame.slot
+        if isinstance(container, list):
+            if slot != len(container) - 1:
+                return
+            container.pop()
+        elif slot in container:
+            del container[slot]
+        else:
+            return
+        path = tuple(f.slot for f in self._stack)
+        if self._changes.get(path) == "add":  # type: ignore[arg-type]
+            # Added by this very feed: nothing changed after all.
+            del self._changes[path]  # type: ignore[arg-type]
+        else:
+            self._changes[path] = "remove"  # type: ignore[index]
+
+    def _copy_open(self, depth: int) -> Any:
+        frames = self._stack[depth:]
+        top = copy.copy(frames[0].container)
+        parent = top
+        for frame in frames[1:]:
+            child = copy.copy(frame.container)
+            parent[frame.slot_in_parent] = child  # type: ignore[index]
+            parent = child
+        return top
+
+    def _value_at(self, path: tuple[str | int, ...]) -> Any:
+        if self._root is _MISSING:
+            return None
+        node = self._root
+        for key in path:
+            node = node[key]
+        depth = len(path)
+        if depth < len(self._stack) and self._stack[depth].container is node:
+            return self._copy_open(depth)
+        return node
+
+
+def _json_pointer(path: tuple[str | int, ...]) -> str:
+    return "".join(
+        "/" + str(part).replace("~", "~0").replace("/", "~1") for part in path
+    )
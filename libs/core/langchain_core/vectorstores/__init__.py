@@ -5,12 +5,15 @@ from typing import TYPE_CHECKING
 from langchain_core._import_utils import import_attr
 
 if TYPE_CHECKING:
+    from langchain_core.vectorstores.ann import IVFIndex, VectorIndex
     from langchain_core.vectorstores.base import VST, VectorStore, VectorStoreRetriever
     from langchain_core.vectorstores.in_memory import InMemoryVectorStore
 
 __all__ = (
     "VST",
+    "IVFIndex",
     "InMemoryVectorStore",
+    "VectorIndex",
     "VectorStore",
     "VectorStoreRetriever",
 )
@@ -20,6 +23,8 @@ _dynamic_imports = {
     "VST": "base",
     "VectorStoreRetriever": "base",
     "InMemoryVectorStore": "in_memory",
+    "IVFIndex": "ann",
+    "VectorIndex": "ann",
 }
 
 
@@ -0,0 +1,434 @@
+"""Dense vector storage backing `InMemoryVectorStore`.
+
+This is a private API, and users should not use it directly as it can change
+without notice.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from langchain_core.vectorstores.ann import VectorIndex
+
+_INITIAL_CAPACITY = 64
+
+
+def _require_numpy() -> None:
+    if not _HAS_NUMPY:
+        msg = (
+            "numpy must be installed to search InMemoryVectorStore. "
+            "Please install numpy with `pip install numpy`."
+        )
+        raise ImportError(msg)
+
+
+def normalize(vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """L2-normalize the rows of a float32 matrix.
+
+    Zero rows are left as zeros so they score 0 against every query.
+
+    Returns:
+        The normalized matrix and the original row norms.
+    """
+    norms = np.linalg.norm(vectors, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        normalized = vectors / norms[:, None]
+    normalized[~np.isfinite(normalized)] = 0.0
+    return normalized, norms.astype(np.float32)
+
+
+class VectorMatrix:
+    """Row-oriented store of documents and their embeddings.
+
+    Vectors live in one contiguous, pre-normalized float32 matrix so cosine
+    similarity against every row is a single matrix product. Each row also
+    keeps the document id, text and metadata.
+
+    Deleted rows are tombstoned and reclaimed by `compact` once they make up
+    `compact_ratio` of the matrix. Upserting an existing id overwrites its row
+    in place, so row order always matches insertion order.
+
+    numpy is only required to search: without it, vectors are kept as plain
+    lists so documents can still be added, fetched, deleted and dumped.
+    """
+
+    def __init__(
+        self, *, compact_ratio: float = 0.25, min_compact_rows: int = 1024
+    ) -> None:
+        """Create an empty matrix.
+
+        Args:
+            compact_ratio: Fraction of tombstoned rows that triggers compaction.
+            min_compact_rows: Minimum number of tombstoned rows before compacting.
+        """
+        self.compact_ratio = compact_ratio
+        self.min_compact_rows = min_compact_rows
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove every row and release the matrix."""
+        self._data: np.ndarray | None = None
+        self._norms: np.ndarray | None = None
+        self._alive: np.ndarray | None = None
+        # Vectors of each row when numpy is not installed.
+        self._lists: list[list[float] | None] = []
+        self._size = 0
+        self._n_dead = 0
+        self.ids: list[str | None] = []
+        self.texts: list[str | None] = []
+        self.metadatas: list[dict | None] = []
+        self.id_to_row: dict[str, int] = {}
+
+    def attach(
+        self,
+        vectors: np.ndarray,
+        norms: np.ndarray,
+        ids: Sequence[str],
+        texts: Sequence[str],
+        metadatas: Sequence[dict],
+    ) -> None:
+        """Replace the contents with existing normalized vectors, without copying.
+
+        `vectors` may be a read-only or copy-on-write `np.memmap`; it is only
+        copied into memory once the matrix has to grow.
+
+        Args:
+            vectors: Normalized vectors, shape `(len(ids), dim)`.
+            norms: Original norm of each vector.
+            ids: Document ids, one per row.
+            texts: Document texts, one per row.
+            metadatas: Document metadata, one per row.
+        """
+        self.clear()
+        if not ids:
+            return
+        self._data = vectors
+        self._norms = norms
+        self._alive = np.ones(len(ids), dtype=bool)
+        self._size = len(ids)
+        self.ids = list(ids)
+        self.texts = list(texts)
+        self.metadatas = list(metadatas)
+        self.id_to_row = {id_: row for row, id_ in enumerate(ids)}
+
+    def __len__(self) -> int:
+        return len(self.id_to_row)
+
+    def __contains__(self, id_: object) -> bool:
+        return id_ in self.id_to_row
+
+    @property
+    def dim(self) -> int | None:
+        """Vector dimension, or `None` while the matrix is empty."""
+        return None if self._data is None else self._data.shape[1]
+
+    @property
+    def size(self) -> int:
+        """Number of allocated rows, tombstones included."""
+        return self._size
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """Normalized vectors for all allocated rows, tombstones included."""
+        if self._data is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return self._data[: self._size]
+
+    @property
+    def norms(self) -> np.ndarray:
+        """Original vector norms for all allocated rows, tombstones included."""
+        if self._norms is None:
+            return np.empty(0, dtype=np.float32)
+        return self._norms[: self._size]
+
+    @property
+    def alive(self) -> np.ndarray:
+        """Boolean mask of live rows over all allocated rows."""
+        if self._alive is None:
+            return np.empty(0, dtype=bool)
+        return self._alive[: self._size]
+
+    def iter_ids(self) -> Iterator[str]:
+        """Iterate over live ids in row order."""
+        return (id_ for id_ in self.ids if id_ is not None)
+
+    def _live_rows(self) -> list[int]:
+        return [row for row, id_ in enumerate(self.ids) if id_ is not None]
+
+    def rows(self) -> np.ndarray:
+        """Indices of live rows in row order."""
+        return np.flatnonzero(self.alive)
+
+    def record(self, row: int) -> dict[str, Any]:
+        """Return a copy of the row as a `{"id", "vector", "text", "metadata"}` dict."""
+        metadata = self.metadatas[row]
+        return {
+            "id": self.ids[row],
+            "vector": self.vector(row),
+            "text": self.texts[row],
+            # A copy, as the metadata indexes don't see in-place changes.
+            "metadata": None if metadata is None else dict(metadata),
+        }
+
+    def vector(self, row: int) -> list[float]:
+        """Return the original (un-normalized) vector stored at `row`."""
+        if not _HAS_NUMPY:
+            return list(self._lists[row])  # type: ignore[arg-type]
+        return (self._data[row] * self._norms[row]).tolist()  # type: ignore[index]
+
+    def _reserve(self, n_rows: int, dim: int) -> None:
+        if self._data is None:
+            capacity = max(_INITIAL_CAPACITY, n_rows)
+            self._data = np.zeros((capacity, dim), dtype=np.float32)
+            self._norms = np.zeros(capacity, dtype=np.float32)
+            self._alive = np.zeros(capacity, dtype=bool)
+            return
+        if dim != self._data.shape[1]:
+            msg = (
+                f"Vector dimension mismatch: store holds {self._data.shape[1]}-d "
+                f"vectors but got {dim}-d vectors."
+            )
+            raise ValueError(msg)
+        required = self._size + n_rows
+        capacity = self._data.shape[0]
+        if required <= capacity:
+            return
+        capacity = max(capacity, _INITIAL_CAPACITY)
+        while capacity < required:
+            capacity *= 2
+        data = np.zeros((capacity, dim), dtype=np.float32)
+        data[: self._size] = self._data[: self._size]
+        norms = np.zeros(capacity, dtype=np.float32)
+        norms[: self._size] = self._norms[: self._size]  # type: ignore[index]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[: self._size] = self._alive[: self._size]  # type: ignore[index]
+        self._data, self._norms, self._alive = data, norms, alive
+
+    def upsert(
+        self,
+        ids: Sequence[str],
+        vectors: Sequence[Sequence[float]] | np.ndarray,
+        texts: Sequence[str],
+        metadatas: Sequence[dict],
+    ) -> list[int]:
+        """Insert new rows or overwrite the rows of existing ids.
+
+        Returns:
+            The row index assigned to each input, in input order.
+        """
+        if not ids:
+            return []
+        if not _HAS_NUMPY:
+            return self._upsert_lists(ids, vectors, texts, metadatas)
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[0] != len(ids):  # noqa: PLR2004
+            msg = f"Expected {len(ids)} vectors, got array of shape {matrix.shape}."
+            raise ValueError(msg)
+        self._reserve(len(ids), matrix.shape[1])
+
+        rows = []
+        for id_, text, metadata in zip(ids, texts, metadatas, strict=True):
+            row = self.id_to_row.get(id_)
+            if row is None:
+                row = self._size
+                self._size += 1
+                self.id_to_row[id_] = row
+                self.ids.append(id_)
+                self.texts.append(text)
+                self.metadatas.append(metadata)
+            else:
+                self.texts[row] = text
+                self.metadatas[row] = metadata
+            rows.append(row)
+
+        normalized, norms = normalize(matrix)
+        self._data[rows] = normalized  # type: ignore[index]
+        self._norms[rows] = norms  # type: ignore[index]
+        self._alive[rows] = True  # type: ignore[index]
+        return rows
+
+    def _upsert_lists(
+        self,
+        ids: Sequence[str],
+        vectors: Sequence[Sequence[float]] | np.ndarray,
+        texts: Sequence[str],
+        metadatas: Sequence[dict],
+    ) -> list[int]:
+        if len(vectors) != len(ids):
+            msg = f"Expected {len(ids)} vectors, got {len(vectors)}."
+            raise ValueError(msg)
+        rows = []
+        for id_, vector, text, metadata in zip(
+            ids, vectors, texts, metadatas, strict=True
+        ):
+            row = self.id_to_row.get(id_)
+            if row is None:
+                row = self._size
+                self._size += 1
+                self.id_to_row[id_] = row
+                self.ids.append(id_)
+                self.texts.append(text)
+                self.metadatas.append(metadata)
+                self._lists.append([float(x) for x in vector])
+            else:
+                self.texts[row] = text
+                self.metadatas[row] = metadata
+                self._lists[row] = [float(x) for x in vector]
+            rows.append(row)
+        return rows
+
+    def delete(self, ids: Sequence[str]) -> list[int]:
+        """Tombstone the rows of the given ids, ignoring unknown ids.
+
+        Returns:
+            The tombstoned row indices (before any compaction).
+        """
+        rows = []
+        for id_ in ids:
+            row = self.id_to_row.pop(id_, None)
+            if row is None:
+                continue
+            self.ids[row] = None
+            self.texts[row] = None
+            self.metadatas[row] = None
+            if self._alive is not None:
+                self._alive[row] = False
+            else:
+                self._lists[row] = None
+            rows.append(row)
+        self._n_dead += len(rows)
+        return rows
+
+    def needs_compaction(self) -> bool:
+        """Whether enough rows are tombstoned to make compaction worthwhile."""
+        return (
+            self._n_dead >= self.min_compact_rows
+            and self._n_dead >= self.compact_ratio * self._size
+        )
+
+    def compact(self) -> np.ndarray | list[int]:
+        """Drop tombstoned rows, preserving the order of live rows.
+
+        Returns:
+            The old row index of every row in the compacted matrix.
+        """
+        if not _HAS_NUMPY:
+            keep: np.ndarray | list[int] = self._live_rows()
+            self._lists = [self._lists[row] for row in keep]
+        else:
+            keep = self.rows()
+        if self._data is not None:
+            n = len(keep)
+            self._data[:n] = self._data[keep]
+            self._norms[:n] = self._norms[keep]  # type: ignore[index]
+            self._alive[:n] = True  # type: ignore[index]
+            self._alive[n : self._size] = False  # type: ignore[index]
+        self.ids = [self.ids[row] for row in keep]
+        self.texts = [self.texts[row] for row in keep]
+        self.metadatas = [self.metadatas[row] for row in keep]
+        self.id_to_row = {id_: row for row, id_ in enumerate(self.ids)}  # type: ignore[misc]
+        self._size = len(keep)
+        self._n_dead = 0
+        return keep
+
+    def search(
+        self,
+        queries: Sequence[Sequence[float]] | np.ndarray,
+        k: int,
+        rows: np.ndarray | None = None,
+        index: VectorIndex | None = None,
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Top-k cosine search for a batch of queries.
+
+        Args:
+            queries: Query vectors, shape `(n_queries, dim)`.
+            k: Number of results per query.
+            rows: Restrict the search to these live rows. Defaults to all live rows.
+            index: Search through this index instead of scanning every row.
+
+        Returns:
+            For each query, the matched row indices and their cosine similarity,
+            ordered from most to least similar.
+        """
+        _require_numpy()
+        query_matrix = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        if self._data is None or k <= 0 or len(self) == 0:
+            return [_empty_hits()] * query_matrix.shape[0]
+        normalized, _ = normalize(query_matrix)
+        if index is not None:
+            return index.search(normalized, self.vectors, self.alive, k, rows)
+        return exact_search(normalized, self.vectors, self.alive, k, rows)
+
+
+def _empty_hits() -> tuple[np.ndarray, np.ndarray]:
+    return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+
+
+def exact_search(
+    queries: np.ndarray,
+    vectors: np.ndarray,
+    alive: np.ndarray,
+    k: int,
+    rows: np.ndarray | None = None,
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Brute-force top-k search of normalized queries against normalized rows.
+
+    Args:
+        queries: Normalized query vectors, shape `(n_queries, dim)`.
+        vectors: Normalized row vectors, shape `(n_rows, dim)`.
+        alive: Boolean mask of live rows, shape `(n_rows,)`.
+        k: Number of results per query.
+        rows: Restrict the search to these live rows. Defaults to all live rows.
+
+    Returns:
+        For each query, the matched row indices and their scores, best first.
+    """
+    if rows is None:
+        candidates = vectors
+        n_valid = int(np.count_nonzero(alive))
+    else:
+        candidates = vectors[rows]
+        n_valid = len(rows)
+    if n_valid == 0 or k <= 0:
+        return [_empty_hits()] * queries.shape[0]
+
+    scores = queries @ candidates.T
+    if rows is None and n_valid < len(alive):
+        scores[:, ~alive] = -np.inf
+    return top_k(scores, min(k, n_valid), rows)
+
+
+def top_k(
+    scores: np.ndarray, k: int, rows: np.ndarray | None = None
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """Select the `k` best columns of each score row, best first.
+
+    Args:
+        scores: Score matrix, shape `(n_queries, n_candidates)`.
+        k: Number of columns to keep, at most `n_candidates`.
+        rows: Row index of each candidate column. Defaults to the column index.
+
+    Returns:
+        For each query, the selected row indices and their scores.
+    """
+    if k < scores.shape[1]:
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        top = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    order = np.argsort(-top_scores, axis=1, kind="stable")
+    top = np.take_along_axis(top, order, axis=1)
+    top_scores = np.take_along_axis(top_scores, order, axis=1)
+    if rows is not None:
+        top = rows[top]
+    return list(zip(top, top_scores, strict=True))
@@ -0,0 +1,220 @@
+"""Inverted metadata indexes backing `InMemoryVectorStore` structured filters.
+
+This is a private API, and users should not use it directly as it can change
+without notice.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Mapping
+from typing import TYPE_CHECKING, Any
+
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+if TYPE_CHECKING:
+    from langchain_core.vectorstores._matrix import VectorMatrix
+
+_COMPARISON_OPERATORS = {"$gt", "$gte", "$lt", "$lte"}
+_OPERATORS = {"$eq", "$ne", "$in", "$nin", *_COMPARISON_OPERATORS}
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _value_key(value: Hashable) -> tuple[bool, Hashable]:
+    # `True == 1` and `hash(True) == hash(1)`: tag booleans so that they don't
+    # share an entry with the numbers 0 and 1.
+    return isinstance(value, bool), value
+
+
+class _KeyIndex:
+    """Inverted index of a single metadata key.
+
+    Maps each hashable value to the rows holding it, booleans apart from
+    numbers. Rows whose value is not hashable (lists, dicts, ...) are kept aside
+    and compared one by one.
+    """
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self.n_indexed = 0
+        self.values: dict[tuple[bool, Hashable], list[int]] = {}
+        self.unhashable: list[int] = []
+        self._sorted: dict[type, tuple[np.ndarray, np.ndarray]] = {}
+
+    def extend(self, matrix: VectorMatrix) -> None:
+        """Index the rows appended to the matrix since the last call."""
+        if self.n_indexed >= matrix.size:
+            return
+        key = self.key
+        missing = object()
+        for row in range(self.n_indexed, matrix.size):
+            metadata = matrix.metadatas[row]
+            if metadata is None:
+                continue
+            value = metadata.get(key, missing)
+            if value is missing:
+                continue
+            if isinstance(value, Hashable):
+                self.values.setdefault(_value_key(value), []).append(row)
+            else:
+                self.unhashable.append(row)
+        self.n_indexed = matrix.size
+        self._sorted.clear()
+
+    def eq(self, value: Any, matrix: VectorMatrix, mask: np.ndarray) -> None:
+        """Set `mask` on every row whose value equals `value`."""
+        if isinstance(value, Hashable):
+            rows = self.values.get(_value_key(value))
+            if rows:
+                mask[rows] = True
+        key = self.key
+        for row in self.unhashable:
+            metadata = matrix.metadatas[row]
+            if metadata is not None and metadata.get(key) == value:
+                mask[row] = True
+
+    def _sorted_values(self, family: type) -> tuple[np.ndarray, np.ndarray]:
+        """Values of one type family in ascending order, with their rows."""
+        if family not in self._sorted:
+            pairs = sorted(
+                (value, row)
+                for (_, value), rows in self.values.items()
+                if (_is_number(value) if family is float else isinstance(value, str))
+                for row in rows
+            )
+            values = np.array([value for value, _ in pairs])
+            rows_ = np.array([row for _, row in pairs], dtype=np.intp)
+            self._sorted[family] = (values, rows_)
+        return self._sorted[family]
+
+    def compare(self, operator: str, value: Any, mask: np.ndarray) -> None:
+        """Set `mask` on every row whose value satisfies `operator value`."""
+        if _is_number(value):
+            values, rows = self._sorted_values(float)
+        elif isinstance(value, str):
+            values, rows = self._sorted_values(str)
+        else:
+            msg = (
+                f"Operator {operator} on metadata key {self.key!r} only supports "
+                f"numbers and strings, got {type(value).__name__}."
+            )
+            raise ValueError(msg)
+        if len(values) == 0:
+            return
+        if operator == "$gt":
+            mask[rows[np.searchsorted(values, value, side="right") :]] = True
+        elif operator == "$gte":
+            mask[rows[np.searchsorted(values, value, side="left") :]] = True
+        elif operator == "$lt":
+            mask[rows[: np.searchsorted(values, value, side="left")]] = True
+        else:
+            mask[rows[: np.searchsorted(values, value, side="right")]] = True
+
+
+class MetadataIndex:
+    """Lazily built inverted indexes over the metadata of a `VectorMatrix`.
+
+    A key is indexed the first time a filter refers to it. Appended rows are
+    indexed incrementally on the next filtered query and deleted rows are
+    excluded through the matrix's liveness mask; anything that rewrites
+    existing rows must call `invalidate`.
+
+    Filters are dicts mapping metadata keys to conditions, combined with AND:
+
+    ```python
+    {
+        "genre": "drama",  # shorthand for {"$eq": "drama"}
+        "year": {"$gte": 2000, "$lt": 2010},
+        "lang": {"$in": ["en", "ko"]},
+        "$or": [{"rating": {"$gte": 8}}, {"featured": True}],
+    }
+    ```
+
+    Supported operators are `$eq`, `$ne`, `$in`, `$nin`, `$gt`, `$gte`, `$lt`
+    and `$lte`, plus `$and` / `$or` over lists of filters. Booleans only equal
+    booleans, and comparison operators only match numbers against numbers and
+    strings against strings.
+    """
+
+    def __init__(self) -> None:
+        self._keys: dict[str, _KeyIndex] = {}
+
+    def invalidate(self) -> None:
+        """Drop every index; they are rebuilt on the next filtered query."""
+        self._keys.clear()
+
+    def select(self, filter: Mapping[str, Any], matrix: VectorMatrix) -> np.ndarray:  # noqa: A002
+        """Return the live rows matching `filter`, in row order.
+
+        Raises:
+            ValueError: If the filter uses an unknown operator or is malformed.
+        """
+        mask = self._mask(filter, matrix)
+        mask &= matrix.alive
+        return np.flatnonzero(mask)
+
+    def _key_index(self, key: str, matrix: VectorMatrix) -> _KeyIndex:
+        index = self._keys.get(key)
+        if index is None:
+            index = self._keys[key] = _KeyIndex(key)
+        index.extend(matrix)
+        return index
+
+    def _mask(self, filter: Mapping[str, Any], matrix: VectorMatrix) -> np.ndarray:  # noqa: A002
+        if not isinstance(filter, Mapping):
+            msg = f"Metadata filter must be a dict, got {type(filter).__name__}."
+            raise ValueError(msg)  # noqa: TRY004
+        mask = np.ones(matrix.size, dtype=bool)
+        for key, condition in filter.items():
+            if key in {"$and", "$or"}:
+                if not isinstance(condition, list) or not condition:
+                    msg = f"{key} expects a non-empty list of filters."
+                    raise ValueError(msg)
+                masks = [self._mask(sub_filter, matrix) for sub_filter in condition]
+                combine = np.logical_and if key == "$and" else np.logical_or
+                mask &= combine.reduce(masks)
+            elif key.startswith("$"):
+                msg = f"Unknown logical operator {key!r} in metadata filter."
+                raise ValueError(msg)
+            else:
+                mask &= self._condition_mask(key, condition, matrix)
+        return mask
+
+    def _condition_mask(
+        self, key: str, condition: Any, matrix: VectorMatrix
+    ) -> np.ndarray:
+        if not (
+            isinstance(condition, Mapping)
+            and condition
+            and all(isinstance(op, str) and op.startswith("$") for op in condition)
+        ):
+            condition = {"$eq": condition}
+        index = self._key_index(key, matrix)
+        mask = np.ones(matrix.size, dtype=bool)
+        for operator, value in condition.items():
+            if operator not in _OPERATORS:
+                msg = f"Unknown operator {operator!r} for metadata key {key!r}."
+                raise ValueError(msg)
+            matched = np.zeros(matrix.size, dtype=bool)
+            if operator in {"$eq", "$ne"}:
+                index.eq(value, matrix, matched)
+            elif operator in {"$in", "$nin"}:
+                if not isinstance(value, (list, tuple, set, frozenset)):
+                    msg = f"{operator} for metadata key {key!r} expects a list."
+                    raise ValueError(msg)
+                for item in value:
+                    index.eq(item, matrix, matched)
+            else:
+                index.compare(operator, value, matched)
+            if operator in {"$ne", "$nin"}:
+                mask &= ~matched
+            else:
+                mask &= matched
+        return mask
@@ -0,0 +1,369 @@
+"""Approximate nearest-neighbour indexes for `InMemoryVectorStore`.
+
+An index sits on top of the store's normalized vector matrix and narrows each
+query to a subset of rows before the exact cosine scoring, trading a little
+recall for much lower latency on large stores.
+
+```python
+from langchain_core.vectorstores import InMemoryVectorStore
+from langchain_core.vectorstores.ann import IVFIndex
+
+vector_store = InMemoryVectorStore(embeddings, index=IVFIndex(nprobe=16))
+```
+"""
+
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from typing_extensions import override
+
+from langchain_core.vectorstores._matrix import exact_search, normalize, top_k
+
+try:
+    import numpy as np
+
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+class VectorIndex(ABC):
+    """Interface for a search index over `InMemoryVectorStore` rows.
+
+    The store owns the vectors; an index only keeps whatever auxiliary structure
+    it needs, keyed by row number. The store notifies the index when rows are
+    written or compacted, and hands it the current vector matrix on every search.
+
+    All vectors passed to an index are L2-normalized float32 rows, so the inner
+    product is the cosine similarity.
+    """
+
+    kind: ClassVar[str]
+    """Name the index is persisted under. Must be unique among subclasses."""
+
+    _registry: ClassVar[dict[str, type[VectorIndex]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Register subclasses that define `kind` so they can be loaded by name."""
+        super().__init_subclass__(**kwargs)
+        if "kind" in cls.__dict__:
+            VectorIndex._registry[cls.kind] = cls
+
+    @abstractmethod
+    def fit(self, vectors: np.ndarray, alive: np.ndarray) -> None:
+        """Build the index from scratch.
+
+        Args:
+            vectors: Normalized row vectors, shape `(n_rows, dim)`.
+            alive: Boolean mask of live rows, shape `(n_rows,)`.
+        """
+
+    @abstractmethod
+    def add(self, rows: np.ndarray, vectors: np.ndarray) -> None:
+        """Index rows that were just inserted or overwritten.
+
+        Args:
+            rows: Row numbers that were written.
+            vectors: Their normalized vectors, shape `(len(rows), dim)`.
+        """
+
+    @abstractmethod
+    def compact(self, keep: np.ndarray) -> None:
+        """Renumber rows after the store dropped its tombstones.
+
+        Args:
+            keep: Old row number of every row that survived, in new row order.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Forget every row."""
+
+    @abstractmethod
+    def search(
+        self,
+        queries: np.ndarray,
+        vectors: np.ndarray,
+        alive: np.ndarray,
+        k: int,
+        rows: np.ndarray | None = None,
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """Find the top-k rows for each query.
+
+        Args:
+            queries: Normalized query vectors, shape `(n_queries, dim)`.
+            vectors: Normalized row vectors, shape `(n_rows, dim)`.
+            alive: Boolean mask of live rows, shape `(n_rows,)`.
+            k: Number of results per query.
+            rows: Restrict the search to these live rows.
+
+        Returns:
+            For each query, the matched row numbers and their cosine similarity,
+            ordered from most to least similar.
+        """
+
+    @abstractmethod
+    def get_state(self, keep: np.ndarray) -> dict[str, Any]:
+        """Return the index state as a flat dict of numpy arrays and scalars.
+
+        Args:
+            keep: Rows that will be persisted, in order. Per-row state must be
+                restricted to these rows and renumbered accordingly.
+        """
+
+    @classmethod
+    @abstractmethod
+    def from_state(cls, state: Mapping[str, Any]) -> VectorIndex:
+        """Restore an index from the output of `get_state`."""
+
+    def dump_state(self, keep: np.ndarray) -> dict[str, Any]:
+        """Return `get_state` tagged with the index `kind`."""
+        return {"kind": np.array(self.kind), **self.get_state(keep)}
+
+    @staticmethod
+    def load_state(state: Mapping[str, Any]) -> VectorIndex:
+        """Restore an index of any registered kind from `dump_state` output.
+
+        Raises:
+            ValueError: If the persisted index kind is not known.
+        """
+        kind = str(state["kind"])
+        try:
+            index_cls = VectorIndex._registry[kind]
+        except KeyError:
+            msg = f"Unknown vector index kind {kind!r}."
+            raise ValueError(msg) from None
+        return index_cls.from_state(state)
+
+
+class IVFIndex(VectorIndex):
+    """Inverted-file index with a spherical k-means coarse quantizer.
+
+    Rows are clustered into `n_lists` cells around k-means centroids. A query
+    only scores the rows of its `nprobe` closest cells, so search cost drops
+    from `O(N·d)` to roughly `O(N·d·nprobe / n_lists)`.
+
+    The quantizer is trained lazily on the first search once the store holds at
+    least `min_train_size` rows; smaller stores are searched exactly. Rows added
+    later are assigned to their nearest existing centroid. Call
+    `InMemoryVectorStore.rebuild_index` to retrain after the data has drifted.
+
+    Tuning:
+        - Raise `nprobe` for better recall, lower it for lower latency.
+        - `n_lists` defaults to `sqrt(N)` at training time.
+    """
+
+    kind: ClassVar[str] = "ivf"
+
+    def __init__(
+        self,
+        n_lists: int | None = None,
+        nprobe: int = 8,
+        *,
+        n_iter: int = 20,
+        max_train_points_per_list: int = 256,
+        min_train_size: int = 1024,
+        seed: int = 0,
+    ) -> None:
+        """Create an untrained IVF index.
+
+        Args:
+            n_lists: Number of k-means cells. Defaults to `sqrt(N)` at training.
+            nprobe: Number of closest cells scanned per query.
+            n_iter: Number of k-means iterations.
+            max_train_points_per_list: Training sample size per cell.
+            min_train_size: Stores with fewer rows are searched exactly.
+            seed: Seed for the k-means initialization and sampling.
+        """
+        if not _HAS_NUMPY:
+            msg = (
+                "numpy must be installed to use IVFIndex. "
+                "Please install numpy with `pip install numpy`."
+            )
+            raise ImportError(msg)
+        self.n_lists = n_lists
+        self.nprobe = nprobe
+        self.n_iter = n_iter
+        self.max_train_points_per_list = max_train_points_per_list
+        self.min_train_size = min_train_size
+        self.seed = seed
+        self.centroids: np.ndarray | None = None
+        self._assignments = np.empty(0, dtype=np.int32)
+        self._order: np.ndarray | None = None
+        self._offsets: np.ndarray | None = None
+
+    @property
+    def is_trained(self) -> bool:
+        """Whether the coarse quantizer has been trained."""
+        return self.centroids is not None
+
+    @staticmethod
+    def _assign(
+        vectors: np.ndarray, centroids: np.ndarray, chunk_size: int = 16384
+    ) -> np.ndarray:
+        """Return the closest centroid of each vector, in bounded-memory chunks."""
+        assignments = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), chunk_size):
+            chunk = vectors[start : start + chunk_size]
+            assignments[start : start + chunk_size] = np.argmax(
+                chunk @ centroids.T, axis=1
+            )
+        return assignments
+
+    def _train(self, sample: np.ndarray, n_lists: int) -> np.ndarray:
+        rng = np.random.default_rng(self.seed)
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+        for _ in range(self.n_iter):
+            labels = self._assign(sample, centroids)
+            order = np.argsort(labels, kind="stable")
+            counts = np.bincount(labels, minlength=n_lists)
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            non_empty = counts > 0
+            sums = np.add.reduceat(sample[order], starts[non_empty], axis=0)
+            centroids = centroids.copy()
+            centroids[non_empty] = sums
+            # Re-seed empty cells from random points so every list stays useful.
+            n_empty = int(np.count_nonzero(~non_empty))
+            if n_empty:
+                centroids[~non_empty] = sample[rng.choice(len(sample), n_empty)]
+            centroids, _ = normalize(centroids)
+        return centroids
+
+    @override
+    def fit(self, vectors: np.ndarray, alive: np.ndarray) -> None:
+        live_rows = np.flatnonzero(alive)
+        if len(live_rows) == 0:
+            self.clear()
+            return
+        n_lists = self.n_lists or round(math.sqrt(len(live_rows)))
+        n_lists = max(1, min(n_lists, len(live_rows)))
+        rng = np.random.default_rng(self.seed)
+        n_train = min(len(live_rows), n_lists * self.max_train_points_per_list)
+        sample_rows = np.sort(rng.choice(live_rows, n_train, replace=False))
+        self.centroids = self._train(vectors[sample_rows], n_lists)
+
+        self._assignments = np.full(len(vectors), -1, dtype=np.int32)
+        self._assignments[live_rows] = self._assign(vectors[live_rows], self.centroids)
+        self._invalidate()
+
+    @override
+    def add(self, rows: np.ndarray, vectors: np.ndarray) -> None:
+        if not self.is_trained or len(rows) == 0:
+            return
+        rows = np.asarray(rows, dtype=np.intp)
+        required = int(rows.max()) + 1
+        if required > len(self._assignments):
+            grown = np.full(max(required, 2 * len(self._assignments)), -1, np.int32)
+            grown[: len(self._assignments)] = self._assignments
+            self._assignments = grown
+        self._assignments[rows] = self._assign(vectors, self.centroids)  # type: ignore[arg-type]
+        self._invalidate()
+
+    @override
+    def compact(self, keep: np.ndarray) -> None:
+        if self.is_trained:
+            keep = keep[keep < len(self._assignments)]
+            self._assignments = self._assignments[keep]
+            self._invalidate()
+
+    @override
+    def clear(self) -> None:
+        self.centroids = None
+        self._assignments = np.empty(0, dtype=np.int32)
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._order = None
+        self._offsets = None
+
+    def _inverted_lists(self) -> tuple[np.ndarray, np.ndarray]:
+        """Rows grouped by cell, and the start offset of each cell."""
+        if self._order is None or self._offsets is None:
+            # Unassigned rows (-1) sort first and fall outside every cell.
+            self._order = np.argsort(self._assignments, kind="stable")
+            self._offsets = np.searchsorted(
+                self._assignments[self._order],
+                np.arange(len(self.centroids) + 1),  # type: ignore[arg-type]
+            )
+        return self._order, self._offsets
+
+    @override
+    def search(
+        self,
+        queries: np.ndarray,
+        vectors: np.ndarray,
+        alive: np.ndarray,
+        k: int,
+        rows: np.ndarray | None = None,
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        if not self.is_trained:
+            if np.count_nonzero(alive) < self.min_train_size:
+                return exact_search(queries, vectors, alive, k, rows)
+            self.fit(vectors, alive)
+
+        order, offsets = self._inverted_lists()
+        n_lists = len(self.centroids)  # type: ignore[arg-type]
+        nprobe = max(1, min(self.nprobe, n_lists))
+        cell_scores = queries @ self.centroids.T  # type: ignore[union-attr]
+        probes = np.argpartition(-cell_scores, nprobe - 1, axis=1)[:, :nprobe]
+        if rows is None:
+            allowed = alive
+        else:
+            allowed = np.zeros(len(alive), dtype=bool)
+            allowed[rows] = True
+
+        results = []
+        for query, cells in zip(queries, probes, strict=True):
+            candidates = np.concatenate(
+                [order[offsets[cell] : offsets[cell + 1]] for cell in cells]
+            )
+            candidates = candidates[allowed[candidates]]
+            if len(candidates) < k:
+                # Too few rows in the probed cells (e.g. a selective filter):
+                # fall back to an exact scan so results are never short.
+                results.extend(exact_search(query[None], vectors, alive, k, rows))
+                continue
+            scores = vectors[candidates] @ query
+            results.extend(top_k(scores[None], k, candidates))
+        return results
+
+    @override
+    def get_state(self, keep: np.ndarray) -> dict[str, Any]:
+        state: dict[str, Any] = {
+            "nprobe": np.array(self.nprobe),
+            "n_iter": np.array(self.n_iter),
+            "max_train_points_per_list": np.array(self.max_train_points_per_list),
+            "min_train_size": np.array(self.min_train_size),
+            "seed": np.array(self.seed),
+        }
+        if self.n_lists is not None:
+            state["n_lists"] = np.array(self.n_lists)
+        if self.is_trained:
+            assignments = np.full(len(keep), -1, dtype=np.int32)
+            known = keep < len(self._assignments)
+            assignments[known] = self._assignments[keep[known]]
+            state["centroids"] = self.centroids
+            state["assignments"] = assignments
+        return state
+
+    @classmethod
+    @override
+    def from_state(cls, state: Mapping[str, Any]) -> IVFIndex:
+        index = cls(
+            n_lists=int(state["n_lists"]) if "n_lists" in state else None,
+            nprobe=int(state["nprobe"]),
+            n_iter=int(state["n_iter"]),
+            max_train_points_per_list=int(state["max_train_points_per_list"]),
+            min_train_size=int(state["min_train_size"]),
+            seed=int(state["seed"]),
+        )
+        if "centroids" in state:
+            index.centroids = np.asarray(state["centroids"], dtype=np.float32)
+            index._assignments = np.asarray(state["assignments"], dtype=np.int32)
+        return index
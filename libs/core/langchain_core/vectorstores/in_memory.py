@@ -4,18 +4,23 @@ from __future__ import annotations
 
 import json
 import uuid
+from collections.abc import Mapping, MutableMapping
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    BinaryIO,
+    Literal,
 )
 
 from typing_extensions import override
 
 from langchain_core.documents import Document
-from langchain_core.load import dumpd, load
+from langchain_core.load import dumpd, dumps, load
 from langchain_core.vectorstores import VectorStore
-from langchain_core.vectorstores.utils import _cosine_similarity as cosine_similarity
+from langchain_core.vectorstores._matrix import VectorMatrix
+from langchain_core.vectorstores._metadata_index import MetadataIndex
+from langchain_core.vectorstores.ann import VectorIndex
 from langchain_core.vectorstores.utils import maximal_marginal_relevance
 
 if TYPE_CHECKING:
@@ -31,10 +36,49 @@ except ImportError:
     _HAS_NUMPY = False
 
 
+class _StoreView(MutableMapping[str, dict[str, Any]]):
+    """Dict-like view of an `InMemoryVectorStore`'s records.
+
+    Keeps the historical `store[id] -> {"id", "vector", "text", "metadata"}`
+    interface working on top of the matrix-backed storage. Records are built on
+    access, so mutating a returned dict does not change the store.
+    """
+
+    def __init__(self, vectorstore: InMemoryVectorStore) -> None:
+        self._vectorstore = vectorstore
+
+    def __getitem__(self, key: str) -> dict[str, Any]:
+        matrix = self._vectorstore._matrix  # noqa: SLF001
+        return matrix.record(matrix.id_to_row[key])
+
+    def __setitem__(self, key: str, value: Mapping[str, Any]) -> None:
+        self._vectorstore._upsert(  # noqa: SLF001
+            [key], [value["vector"]], [value["text"]], [value["metadata"]]
+        )
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self._vectorstore._matrix:  # noqa: SLF001
+            raise KeyError(key)
+        self._vectorstore.delete([key])
+
+    def __iter__(self) -> Iterator[str]:
+        return self._vectorstore._matrix.iter_ids()  # noqa: SLF001
+
+    def __len__(self) -> int:
+        return len(self._vectorstore._matrix)  # noqa: SLF001
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._vectorstore._matrix  # noqa: SLF001
+
+
 class InMemoryVectorStore(VectorStore):
     """In-memory vector store implementation.
 
-    Uses a dictionary, and computes cosine similarity for search using numpy.
+    Keeps every vector in a contiguous, pre-normalized float32 numpy matrix, so
+    cosine similarity against the whole store is a single matrix product and
+    top-k selection uses `argpartition` rather than a full sort. Deleted rows
+    are tombstoned and compacted away once they make up a sizeable share of
+    the matrix.
 
     Setup:
         Install `langchain-core`.
@@ -46,6 +90,11 @@ class InMemoryVectorStore(VectorStore):
     Key init args — indexing params:
         embedding_function: Embeddings
             Embedding function to use.
+        compact_ratio: float
+            Share of deleted rows that triggers compaction of the matrix.
+        index: VectorIndex | None
+            Approximate nearest-neighbour index to search through. Exact search
+            is used when not set.
 
     Instantiate:
         ```python
@@ -111,6 +160,24 @@ class InMemoryVectorStore(VectorStore):
         * thud [{'bar': 'baz'}]
         ```
 
+    Search with metadata filter:
+        ```python
+        results = vector_store.similarity_search(
+            query="thud", k=1, filter={"bar": {"$in": ["baz", "qux"]}}
+        )
+        for doc in results:
+            print(f"* {doc.page_content} [{doc.metadata}]")
+        ```
+
+        ```txt
+        * thud [{'bar': 'baz'}]
+        ```
+
+        Dict filters are answered from inverted metadata indexes before any
+        vector math. They support `$eq`, `$ne`, `$in`, `$nin`, `$gt`, `$gte`,
+        `$lt`, `$lte`, and `$and` / `$or` over lists of filters; a bare value
+        means `$eq`.
+
     Search with score:
         ```python
         results = vector_store.similarity_search_with_score(query="qux", k=1)
@@ -122,6 +189,29 @@ class InMemoryVectorStore(VectorStore):
         * [SIM=0.832268] foo [{'baz': 'bar'}]
         ```
 
+    Batch search by vector:
+        ```python
+        queries = [embeddings.embed_query(q) for q in ["thud", "foo"]]
+        results = vector_store.similarity_search_with_score_by_vectors(queries, k=1)
+        for hits in results:
+            print([doc.page_content for doc, _ in hits])
+        ```
+
+        ```txt
+        ['thud']
+        ['foo']
+        ```
+
+    Approximate search:
+        ```python
+        from langchain_core.vectorstores.ann import IVFIndex
+
+        vector_store = InMemoryVectorStore(embeddings, index=IVFIndex(nprobe=16))
+
+        # trade latency for recall at any time
+        vector_store.index.nprobe = 32
+        ```
+
     Async:
         ```python
         # add documents
@@ -143,6 +233,17 @@ class InMemoryVectorStore(VectorStore):
         * [SIM=0.832268] foo [{'baz': 'bar'}]
         ```
 
+    Persist:
+        ```python
+        # single JSON file
+        vector_store.dump("store.json")
+        vector_store = InMemoryVectorStore.load("store.json", embeddings)
+
+        # binary directory, memory-mapped on load
+        vector_store.dump("store", format="binary")
+        vector_store = InMemoryVectorStore.load("store", embeddings)
+        ```
+
     Use as Retriever:
         ```python
         retriever = vector_store.as_retriever(
@@ -157,27 +258,88 @@ class InMemoryVectorStore(VectorStore):
         ```
     """
 
-    def __init__(self, embedding: Embeddings) -> None:
+    def __init__(
+        self,
+        embedding: Embeddings,
+        *,
+        compact_ratio: float = 0.25,
+        index: VectorIndex | None = None,
+    ) -> None:
         """Initialize with the given embedding function.
 
         Args:
             embedding: embedding function to use.
+            compact_ratio: Share of deleted rows that triggers compaction of the
+                vector matrix.
+            index: Approximate nearest-neighbour index to search through.
+                Exact search is used when not set.
         """
-        # TODO: would be nice to change to
-        # dict[str, Document] at some point (will be a breaking change)
-        self.store: dict[str, dict[str, Any]] = {}
+        self._matrix = VectorMatrix(compact_ratio=compact_ratio)
+        self._metadata_index = MetadataIndex()
         self.embedding = embedding
+        self.index = index
+
+    @property
+    def store(self) -> MutableMapping[str, dict[str, Any]]:
+        """Mapping of document id to its `id`, `vector`, `text` and `metadata`."""
+        return _StoreView(self)
+
+    @store.setter
+    def store(self, records: Mapping[str, Mapping[str, Any]]) -> None:
+        self._matrix.clear()
+        self._metadata_index.invalidate()
+        if self.index is not None:
+            self.index.clear()
+        if records:
+            values = list(records.values())
+            self._upsert(
+                list(records.keys()),
+                [record["vector"] for record in values],
+                [record["text"] for record in values],
+                [record["metadata"] for record in values],
+            )
 
     @property
     @override
     def embeddings(self) -> Embeddings:
         return self.embedding
 
+    def _upsert(
+        self,
+        ids: Sequence[str],
+        vectors: Sequence[Sequence[float]],
+        texts: Sequence[str],
+        metadatas: Sequence[dict],
+    ) -> None:
+        size = self._matrix.size
+        rows = self._matrix.upsert(ids, vectors, texts, metadatas)
+        if any(row < size for row in rows):
+            # Existing rows were rewritten; appended rows are indexed lazily.
+            self._metadata_index.invalidate()
+        if self.index is not None:
+            self.index.add(np.asarray(rows), self._matrix.vectors[rows])
+
+    def _compact(self) -> None:
+        keep = self._matrix.compact()
+        self._metadata_index.invalidate()
+        if self.index is not None:
+            self.index.compact(np.asarray(keep))
+
+    def rebuild_index(self) -> None:
+        """Rebuild the approximate nearest-neighbour index from scratch.
+
+        Useful after many inserts or updates, when the index structure no longer
+        reflects the data well. Does nothing when no index is configured.
+        """
+        if self.index is not None:
+            self.index.fit(self._matrix.vectors, self._matrix.alive)
+
     @override
     def delete(self, ids: Sequence[str] | None = None, **kwargs: Any) -> None:
         if ids:
-            for _id in ids:
-                self.store.pop(_id, None)
+            self._matrix.delete(ids)
+            if self._matrix.needs_compaction():
+                self._compact()
 
     @override
     async def adelete(self, ids: Sequence[str] | None = None, **kwargs: Any) -> None:
@@ -200,24 +362,7 @@ class InMemoryVectorStore(VectorStore):
             )
             raise ValueError(msg)
 
-        id_iterator: Iterator[str | None] = (
-            iter(ids) if ids else iter(doc.id for doc in documents)
-        )
-
-        ids_ = []
-
-        for doc, vector in zip(documents, vectors, strict=False):
-            doc_id = next(id_iterator)
-            doc_id_ = doc_id or str(uuid.uuid4())
-            ids_.append(doc_id_)
-            self.store[doc_id_] = {
-                "id": doc_id_,
-                "vector": vector,
-                "text": doc.page_content,
-                "metadata": doc.metadata,
-            }
-
-        return ids_
+        return self._add_vectors(documents, vectors, ids)
 
     @override
     async def aadd_documents(
@@ -233,22 +378,25 @@ class InMemoryVectorStore(VectorStore):
             )
             raise ValueError(msg)
 
+        return self._add_vectors(documents, vectors, ids)
+
+    def _add_vectors(
+        self,
+        documents: list[Document],
+        vectors: list[list[float]],
+        ids: list[str] | None,
+    ) -> list[str]:
         id_iterator: Iterator[str | None] = (
             iter(ids) if ids else iter(doc.id for doc in documents)
         )
-        ids_: list[str] = []
-
-        for doc, vector in zip(documents, vectors, strict=False):
-            doc_id = next(id_iterator)
-            doc_id_ = doc_id or str(uuid.uuid4())
-            ids_.append(doc_id_)
-            self.store[doc_id_] = {
-                "id": doc_id_,
-                "vector": vector,
-                "text": doc.page_content,
-                "metadata": doc.metadata,
-            }
-
+        pairs = list(zip(documents, vectors, strict=False))
+        ids_ = [next(id_iterator) or str(uuid.uuid4()) for _ in pairs]
+        self._upsert(
+            ids_,
+            [vector for _, vector in pairs],
+            [doc.page_content for doc, _ in pairs],
+            [doc.metadata for doc, _ in pairs],
+        )
         return ids_
 
     @override
@@ -261,19 +409,11 @@ class InMemoryVectorStore(VectorStore):
         Returns:
             A list of `Document` objects.
         """
-        documents = []
-
-        for doc_id in ids:
-            doc = self.store.get(doc_id)
-            if doc:
-                documents.append(
-                    Document(
-                        id=doc["id"],
-                        page_content=doc["text"],
-                        metadata=doc["metadata"],
-                    )
-                )
-        return documents
+        return [
+            self._document(row)
+            for doc_id in ids
+            if (row := self._matrix.id_to_row.get(doc_id)) is not None
+        ]
 
     @override
     async def aget_by_ids(self, ids: Sequence[str], /) -> list[Document]:
@@ -287,54 +427,64 @@ class InMemoryVectorStore(VectorStore):
         """
         return self.get_by_ids(ids)
 
-    def _similarity_search_with_score_by_vector(
-        self,
-        embedding: list[float],
-        k: int = 4,
-        filter: Callable[[Document], bool] | None = None,  # noqa: A002
-    ) -> list[tuple[Document, float, list[float]]]:
-        # get all docs with fixed order in list
-        docs = list(self.store.values())
-
-        if filter is not None:
-            docs = [
-                doc
-                for doc in docs
-                if filter(
-                    Document(
-                        id=doc["id"], page_content=doc["text"], metadata=doc["metadata"]
-                    )
-                )
-            ]
-
-        if not docs:
-            return []
+    def _document(self, row: int) -> Document:
+        return Document(
+            id=self._matrix.ids[row],
+            page_content=self._matrix.texts[row],  # type: ignore[arg-type]
+            metadata=self._matrix.metadatas[row],
+        )
 
-        similarity = cosine_similarity([embedding], [doc["vector"] for doc in docs])[0]
+    def _filter_rows(self, filter: Callable[[Document], bool]) -> np.ndarray:  # noqa: A002
+        return np.array(
+            [row for row in self._matrix.rows() if filter(self._document(row))],
+            dtype=np.intp,
+        )
 
-        # get the indices ordered by similarity score
-        top_k_idx = similarity.argsort()[::-1][:k]
+    def _similarity_search_with_score_by_vectors(
+        self,
+        embeddings: Sequence[Sequence[float]],
+        k: int = 4,
+        filter: Callable[[Document], bool] | dict[str, Any] | None = None,  # noqa: A002
+    ) -> list[list[tuple[Document, float, list[float]]]]:
+        if not _HAS_NUMPY:
+            msg = (
+                "numpy must be installed to search InMemoryVectorStore. "
+                "Please install numpy with `pip install numpy`."
+            )
+            raise ImportError(msg)
 
+        if filter is None:
+            rows = None
+        elif isinstance(filter, Mapping):
+            rows = self._metadata_index.select(filter, self._matrix)
+        else:
+            rows = self._filter_rows(filter)
+        hits = self._matrix.search(embeddings, k, rows, index=self.index)
         return [
-            (
-                Document(
-                    id=doc_dict["id"],
-                    page_content=doc_dict["text"],
-                    metadata=doc_dict["metadata"],
-                ),
-                float(similarity[idx].item()),
-                doc_dict["vector"],
-            )
-            for idx in top_k_idx
-            # Assign using walrus operator to avoid multiple lookups
-            if (doc_dict := docs[idx])
+            [
+                (self._document(row), float(score), self._matrix.vector(row))
+                for row, score in zip(
+                    top_rows.tolist(), top_scores.tolist(), strict=True
+                )
+            ]
+            for top_rows, top_scores in hits
         ]
 
+    def _similarity_search_with_score_by_vector(
+        self,
+        embedding: list[float],
+        k: int = 4,
+        filter: Callable[[Document], bool] | dict[str, Any] | None = None,  # noqa: A002
+    ) -> list[tuple[Document, float, list[float]]]:
+        return self._similarity_search_with_score_by_vectors(
+            [embedding], k=k, filter=filter
+        )[0]
+
     def similarity_search_with_score_by_vector(
         self,
         embedding: list[float],
         k: int = 4,
-        filter: Callable[[Document], bool] | None = None,  # noqa: A002
+        filter: Callable[[Document], bool] | dict[str, Any] | None = None,  # noqa: A002
         **_kwargs: Any,
     ) -> list[tuple[Document, float]]:
         """Search for the most similar documents to the given embedding.
@@ -342,7 +492,8 @@ class InMemoryVectorStore(VectorStore):
         Args:
             embedding: The embedding to search for.
             k: The number of documents to return.
-            filter: A function to filter the documents.
+            filter: A function to filter the documents, or a dict of metadata
+                conditions.
 
         Returns:
             A list of tuples of Document objects and their similarity scores.
@@ -354,6 +505,58 @@ class InMemoryVectorStore(VectorStore):
             )
         ]
 
+    def similarity_search_with_score_by_vectors(
+        self,
+        embeddings: Sequence[Sequence[float]],
+        k: int = 4,
+        filter: Callable[[Document], bool] | dict[str, Any] | None = None,  # noqa: A002
+        **_kwargs: Any,
+    ) -> list[list[tuple[Document, float]]]:
+        """Search for the most similar documents to each of several embeddings.
+
+        All queries are scored against the store in a single matrix product,
+        which is considerably faster than searching them one by one.
+
+        Args:
+            embeddings: The embeddings to search for.
+            k: The number of documents to return per embedding.
+            filter: A function to filter the documents, or a dict of metadata
+                conditions.
+
+        Returns:
+            For each embedding, a list of tuples of Document objects and their
+            similarity scores.
+        """
+        return [
+            [(doc, similarity) for doc, similarity, _ in hits]
+            for hits in self._similarity_search_with_score_by_vectors(
+                embeddings, k=k, filter=filter
+            )
+        ]
+
+    def similarity_search_by_vectors(
+        self,
+        embeddings: Sequence[Sequence[float]],
+        k: int = 4,
+        **kwargs: Any,
+    ) -> list[list[Document]]:
+        """Return the documents most similar to each of several embeddings.
+
+        Args:
+            embeddings: The embeddings to search for.
+            k: The number of documents to return per embedding.
+            **kwargs: Passed to `similarity_search_with_score_by_vectors`.
+
+        Returns:
+            For each embedding, a list of Document objects.
+        """
+        return [
+            [doc for doc, _ in hits]
+            for hits in self.similarity_search_with_score_by_vectors(
+                embeddings, k, **kwargs
+            )
+        ]
+
     @override
     def similarity_search_with_score(
         self,
@@ -422,7 +625,7 @@ class InMemoryVectorStore(VectorStore):
         fetch_k: int = 20,
         lambda_mult: float = 0.5,
         *,
-        filter: Callable[[Document], bool] | None = None,
+        filter: Callable[[Document], bool] | dict[str, Any] | None = None,
         **kwargs: Any,
     ) -> list[Document]:
         prefetch_hits = self._similarity_search_with_score_by_vector(
@@ -514,32 +717,139 @@ class InMemoryVectorStore(VectorStore):
 
     @classmethod
     def load(
-        cls, path: str, embedding: Embeddings, **kwargs: Any
+        cls, path: str, embedding: Embeddings, *, mmap: bool = True, **kwargs: Any
     ) -> InMemoryVectorStore:
-        """Load a vector store from a file.
+        """Load a vector store from a file or a binary store directory.
+
+        A directory written by `dump(path, format="binary")` is opened lazily:
+        vectors are memory-mapped copy-on-write, so they are paged in from disk
+        on demand and never copied unless the store is modified.
+
+        If the store was dumped with an approximate nearest-neighbour index, the
+        index is restored as well instead of being rebuilt, unless an `index` is
+        passed explicitly.
 
         Args:
             path: The path to load the vector store from.
             embedding: The embedding to use.
+            mmap: Whether to memory-map the vectors of a binary store. If
+                `False`, they are read into memory up front.
             **kwargs: Additional arguments to pass to the constructor.
 
         Returns:
             A VectorStore object.
         """
         path_: Path = Path(path)
-        with path_.open("r", encoding="utf-8") as f:
-            store = load(json.load(f))
         vectorstore = cls(embedding=embedding, **kwargs)
-        vectorstore.store = store
+        if path_.is_dir():
+            vectorstore._load_binary(path_, mmap=mmap)
+            index_path = path_ / _BINARY_INDEX
+        else:
+            with path_.open("r", encoding="utf-8") as f:
+                vectorstore.store = load(json.load(f))
+            index_path = _index_path(path_)
+
+        if "index" not in kwargs and index_path.exists():
+            with np.load(index_path, allow_pickle=False) as state:
+                vectorstore.index = VectorIndex.load_state(state)
         return vectorstore
 
-    def dump(self, path: str) -> None:
-        """Dump the vector store to a file.
+    def _load_binary(self, path: Path, *, mmap: bool) -> None:
+        with (path / _BINARY_DOCUMENTS).open("r", encoding="utf-8") as f:
+            documents = load(json.load(f))
+        if documents.get("version") != _BINARY_FORMAT_VERSION:
+            msg = (
+                f"Unsupported InMemoryVectorStore binary format version "
+                f"{documents.get('version')!r} in {path}."
+            )
+            raise ValueError(msg)
+        mmap_mode: Literal["c"] | None = "c" if mmap else None
+        self._matrix.attach(
+            np.load(path / _BINARY_VECTORS, mmap_mode=mmap_mode, allow_pickle=False),
+            np.load(path / _BINARY_NORMS, allow_pickle=False),
+            documents["ids"],
+            documents["texts"],
+            documents["metadatas"],
+        )
+        self._metadata_index.invalidate()
+        if self.index is not None:
+            self.index.clear()
+
+    def dump(
+        self,
+        path: str,
+        *,
+        format: Literal["json", "binary"] = "json",  # noqa: A002
+    ) -> None:
+        """Dump the vector store to a file or a binary store directory.
+
+        The `"json"` format writes a single JSON file. The approximate
+        nearest-neighbour index, if any, is written next to it as
+        `<path>.index.npz`.
+
+        The `"binary"` format writes a directory holding the raw float32 vectors
+        (`vectors.npy`), their norms (`norms.npy`), a JSON sidecar with the ids,
+        texts and metadata (`documents.json`) and the index (`index.npz`). It is
+        much faster to load and can be memory-mapped; see `load`.
 
         Args:
             path: The path to dump the vector store to.
+            format: The on-disk format to use.
         """
         path_: Path = Path(path)
-        path_.parent.mkdir(exist_ok=True, parents=True)
-        with path_.open("w", encoding="utf-8") as f:
-            json.dump(dumpd(self.store), f, indent=2)
+        if format == "binary":
+            self._dump_binary(path_)
+            index_path = path_ / _BINARY_INDEX
+        else:
+            path_.parent.mkdir(exist_ok=True, parents=True)
+            with path_.open("w", encoding="utf-8") as f:
+                json.dump(dumpd(dict(self.store)), f, indent=2)
+            index_path = _index_path(path_)
+
+        if self.index is None:
+            index_path.unlink(missing_ok=True)
+        else:
+            _atomic_save(
+                index_path,
+                lambda f: np.savez(f, **self.index.dump_state(self._matrix.rows())),  # type: ignore[union-attr]
+            )
+
+    def _dump_binary(self, path: Path) -> None:
+        path.mkdir(exist_ok=True, parents=True)
+        matrix = self._matrix
+        rows = matrix.rows()
+        vectors, norms = matrix.vectors, matrix.norms
+        if len(rows) < matrix.size:
+            vectors, norms = vectors[rows], norms[rows]
+        # Files are replaced atomically: the store being dumped may itself be
+        # memory-mapped from this very directory.
+        _atomic_save(path / _BINARY_VECTORS, lambda f: np.save(f, vectors))
+        _atomic_save(path / _BINARY_NORMS, lambda f: np.save(f, norms))
+        documents = {
+            "version": _BINARY_FORMAT_VERSION,
+            "ids": [matrix.ids[row] for row in rows],
+            "texts": [matrix.texts[row] for row in rows],
+            "metadatas": [matrix.metadatas[row] for row in rows],
+        }
+        _atomic_save(
+            path / _BINARY_DOCUMENTS,
+            lambda f: f.write(dumps(documents).encode("utf-8")),
+        )
+
+
+_BINARY_FORMAT_VERSION = 1
+_BINARY_VECTORS = "vectors.npy"
+_BINARY_NORMS = "norms.npy"
+_BINARY_DOCUMENTS = "documents.json"
+_BINARY_INDEX = "index.npz"
+
+
+def _index_path(path: Path) -> Path:
+    return path.with_name(path.name + ".index.npz")
+
+
+def _atomic_save(path: Path, write: Callable[[BinaryIO], Any]) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("wb") as f:
+        write(f)
+    tmp_path.replace(path)
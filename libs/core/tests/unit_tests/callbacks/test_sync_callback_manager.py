@@ -1,6 +1,21 @@
+import asyncio
+import os
+import signal
+import threading
+import time
+from typing import Any
+
 import pytest
+from blockbuster import BlockBuster
+from typing_extensions import override
 
-from langchain_core.callbacks.base import BaseCallbackHandler, BaseCallbackManager
+from langchain_core.callbacks import manager
+from langchain_core.callbacks.base import (
+    AsyncCallbackHandler,
+    BaseCallbackHandler,
+    BaseCallbackManager,
+)
+from langchain_core.language_models import GenericFakeChatModel
 
 
 def test_remove_handler() -> None:
@@ -41,3 +56,136 @@ def test_merge_preserves_handler_distinction() -> None:
 
     assert set(merged.handlers) == {h1, h2}
     assert set(merged.inheritable_handlers) == {ih1, ih2}
+
+
+class RecordingAsyncHandler(AsyncCallbackHandler):
+    def __init__(self) -> None:
+        self.tokens: list[str] = []
+        self.loops: set[int] = set()
+        self.threads: set[int] = set()
+        self.ended = False
+
+    @override
+    async def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        await asyncio.sleep(0)
+        self.tokens.append(token)
+        self.loops.add(id(asyncio.get_running_loop()))
+        self.threads.add(threading.get_ident())
+
+    @override
+    async def on_llm_end(self, *args: Any, **kwargs: Any) -> None:
+        self.ended = True
+
+
+def test_async_handler_in_sync_run_uses_one_loop() -> None:
+    handler = RecordingAsyncHandler()
+    model = GenericFakeChatModel(messages=iter(["a b c d e f g h"] * 2))
+    chunks = [
+        chunk.content for chunk in model.stream("hi", config={"callbacks": [handler]})
+    ]
+    # The run end waits for every queued callback, which ran in order.
+    assert handler.ended
+    assert handler.tokens == chunks
+    assert len(handler.loops) == 1
+    assert threading.get_ident() not in handler.threads
+
+
+async def test_async_handler_in_sync_run_with_running_loop(
+    blockbuster: BlockBuster,
+) -> None:
+    # The sync run blocks the running loop on purpose.
+    blockbuster.deactivate()
+    handler = RecordingAsyncHandler()
+    model = GenericFakeChatModel(messages=iter(["a b c"]))
+    chunks = [
+        chunk.content for chunk in model.stream("hi", config={"callbacks": [handler]})
+    ]
+    assert handler.ended
+    assert handler.tokens == chunks
+
+
+def test_callback_dispatcher_backpressure() -> None:
+    dispatcher = manager._AsyncCallbackDispatcher(max_pending=2)
+    release = threading.Event()
+    done: list[int] = []
+
+    async def wait(i: int) -> None:
+        await asyncio.to_thread(release.wait)
+        done.append(i)
+
+    dispatcher.submit([wait(0)])
+    dispatcher.submit([wait(1)])
+    third = threading.Thread(target=dispatcher.submit, args=([wait(2)],))
+    third.start()
+    third.join(timeout=0.05)
+    # The third event waits for a free slot.
+    assert third.is_alive()
+    assert not dispatcher.flush(timeout=0.01)
+    release.set()
+    third.join()
+    assert dispatcher.flush(timeout=5)
+    assert done == [0, 1, 2]
+
+
+class BlockingAsyncHandler(AsyncCallbackHandler):
+    def __init__(self, release: threading.Event) -> None:
+        self.started = threading.Event()
+        self.release = release
+
+    @override
+    async def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        self.started.set()
+        await asyncio.to_thread(self.release.wait)
+
+
+def test_async_handlers_of_concurrent_sync_runs_do_not_wait_on_each_other() -> None:
+    release = threading.Event()
+    blocking = BlockingAsyncHandler(release)
+    slow_model = GenericFakeChatModel(messages=iter(["a b c"]))
+    slow = threading.Thread(
+        target=lambda: list(slow_model.stream("hi", config={"callbacks": [blocking]}))
+    )
+    slow.start()
+    try:
+        assert blocking.started.wait(timeout=5)
+        handler = RecordingAsyncHandler()
+        model = GenericFakeChatModel(messages=iter(["d"]))
+        fast = threading.Thread(
+            target=model.invoke,
+            args=("hi",),
+            kwargs={"config": {"callbacks": [handler]}},
+        )
+        fast.start()
+        fast.join(timeout=5)
+        # The fast run ended with its own callbacks handled, while the slow run
+        # still waits for its callbacks.
+        assert not fast.is_alive()
+        assert handler.ended
+        assert slow.is_alive()
+    finally:
+        release.set()
+    slow.join()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_async_handler_in_sync_run_after_fork() -> None:
+    # Start the dispatcher in the parent, then run again in a forked child.
+    model = GenericFakeChatModel(messages=iter(["a b", "c d"]))
+    model.invoke("hi", config={"callbacks": [RecordingAsyncHandler()]})
+
+    pid = os.fork()
+    if pid == 0:
+        handler = RecordingAsyncHandler()
+        try:
+            model.invoke("hi", config={"callbacks": [handler]})
+        finally:
+            os._exit(0 if handler.ended else 1)
+
+    deadline = time.monotonic() + 10
+    while (waited := os.waitpid(pid, os.WNOHANG))[0] == 0:
+        if time.monotonic() > deadline:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            pytest.fail("The forked child hung waiting for its callbacks.")
+        time.sleep(0.01)
+    assert os.waitstatus_to_exitcode(waited[1]) == 0
@@ -1,19 +1,31 @@
 """Module tests interaction of chat model with caching abstraction.."""
 
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import pytest
+from blockbuster import BlockBuster
 from typing_extensions import override
 
-from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache, get_in_flight_requests
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
 from langchain_core.globals import set_llm_cache
-from langchain_core.language_models.chat_models import _cleanup_llm_representation
+from langchain_core.language_models.chat_models import (
+    BaseChatModel,
+    _cleanup_llm_representation,
+)
 from langchain_core.language_models.fake_chat_models import (
     FakeListChatModel,
     GenericFakeChatModel,
 )
 from langchain_core.load import dumps
-from langchain_core.messages import AIMessage
+from langchain_core.messages import AIMessage, BaseMessage
 from langchain_core.outputs import ChatGeneration, Generation
 from langchain_core.outputs.chat_result import ChatResult
 
@@ -249,7 +261,6 @@ def test_global_cache_batch() -> None:
         set_llm_cache(None)
 
 
-@pytest.mark.xfail(reason="Abstraction does not support caching for streaming yet.")
 def test_global_cache_stream() -> None:
     """Test streaming."""
     global_cache = InMemoryCache()
@@ -264,10 +275,61 @@ def test_global_cache_stream() -> None:
         assert len(chunks) == 3
         # Assert that streaming information gets cached
         assert global_cache._cache != {}
+
+        # A repeated prompt is replayed from the cache as a stream
+        cached_chunks = list(model.stream("some input"))
+        assert len(cached_chunks) > 1
+        assert "".join(str(chunk.content) for chunk in cached_chunks) == "hello world"
+        assert cached_chunks[-1].chunk_position == "last"
+        # ... and so is invoke, regardless of which entry point filled the cache
+        assert model.invoke("some input").content == "hello world"
+        assert model.invoke("other input").content == "goodbye world"
     finally:
         set_llm_cache(None)
 
 
+async def test_local_cache_astream() -> None:
+    local_cache = InMemoryCache()
+    messages = [AIMessage(content="hello world"), AIMessage(content="goodbye")]
+    model = GenericFakeChatModel(messages=iter(messages), cache=local_cache)
+
+    # invoke fills the cache, astream replays it
+    assert (await model.ainvoke("some input")).content == "hello world"
+    chunks = [chunk async for chunk in model.astream("some input")]
+    assert [chunk.content for chunk in chunks] == ["hello ", "world", ""]
+    assert chunks[-1].chunk_position == "last"
+    assert len(local_cache._cache) == 1
+
+    chunks = [chunk async for chunk in model.astream("other input")]
+    assert "".join(str(chunk.content) for chunk in chunks) == "goodbye"
+    assert len(local_cache._cache) == 2
+
+
+def test_cache_stream_replays_full_message() -> None:
+    """Test tool calls, usage and metadata survive a streamed cache replay."""
+    local_cache = InMemoryCache()
+    message = AIMessage(
+        content="let me check",
+        tool_calls=[{"name": "search", "args": {"q": "weather"}, "id": "call_1"}],
+        usage_metadata={"input_tokens": 5, "output_tokens": 10, "total_tokens": 15},
+        response_metadata={"model_name": "fake"},
+    )
+    model = GenericFakeChatModel(
+        messages=iter([message]), cache=local_cache, cache_stream_delay=0.001
+    )
+    first = model.invoke("Hello")
+
+    chunks = list(model.stream("Hello"))
+    merged = chunks[0]
+    for chunk in chunks[1:]:
+        merged += chunk
+    assert merged.content == first.content
+    assert merged.tool_calls == first.tool_calls
+    assert merged.response_metadata["model_name"] == "fake"
+    assert merged.usage_metadata
+    assert merged.usage_metadata["total_cost"] == 0  # type: ignore[typeddict-item]
+
+
 class CustomChat(GenericFakeChatModel):
     @classmethod
     def is_lc_serializable(cls) -> bool:
@@ -475,3 +537,126 @@ def test_token_costs_are_zeroed_out() -> None:
     assert isinstance(second_response, AIMessage)
     assert second_response.usage_metadata
     assert second_response.usage_metadata["total_cost"] == 0  # type: ignore[typeddict-item]
+
+
+class SlowCountingChatModel(BaseChatModel):
+    """Chat model that takes a while to answer and counts its calls."""
+
+    delay: float = 0.1
+    fail: bool = False
+    calls: int = 0
+
+    @override
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: CallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        self.calls += 1
+        time.sleep(self.delay)
+        return self._result()
+
+    @override
+    async def _agenerate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: AsyncCallbackManagerForLLMRun | None = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self._result()
+
+    def _result(self) -> ChatResult:
+        if self.fail:
+            msg = "provider error"
+            raise ValueError(msg)
+        message = AIMessage(content=f"answer {self.calls}")
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    @property
+    def _llm_type(self) -> str:
+        return "slow-counting"
+
+
+async def test_concurrent_identical_requests_are_coalesced_async() -> None:
+    in_flight = get_in_flight_requests()
+    in_flight.reset_stats()
+    model = SlowCountingChatModel(cache=InMemoryCache())
+    results = await asyncio.gather(*(model.ainvoke("popular") for _ in range(5)))
+    assert model.calls == 1
+    assert {result.content for result in results} == {"answer 1"}
+    # Every caller gets its own copy of the message.
+    assert len({id(result) for result in results}) == 5
+    assert in_flight.num_calls == 1
+    assert in_flight.num_suppressed == 4
+    assert len(in_flight) == 0
+
+    # Different prompts are not coalesced.
+    await asyncio.gather(model.ainvoke("a"), model.ainvoke("b"))
+    assert model.calls == 3
+
+
+def test_concurrent_identical_requests_are_coalesced_sync() -> None:
+    in_flight = get_in_flight_requests()
+    in_flight.reset_stats()
+    model = SlowCountingChatModel(cache=InMemoryCache())
+    barrier = threading.Barrier(4)
+
+    def call(_: int) -> Any:
+        barrier.wait()
+        return model.invoke("popular").content
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        contents = list(executor.map(call, range(4)))
+    assert model.calls == 1
+    assert contents == ["answer 1"] * 4
+    assert in_flight.num_calls == 1
+    assert in_flight.num_suppressed == 3
+
+
+async def test_coalesced_requests_share_errors() -> None:
+    model = SlowCountingChatModel(cache=InMemoryCache(), fail=True)
+    results = await asyncio.gather(
+        *(model.ainvoke("popular") for _ in range(3)), return_exceptions=True
+    )
+    assert model.calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(get_in_flight_requests()) == 0
+
+
+async def test_coalesced_requests_retry_after_cancelled_leader() -> None:
+    model = SlowCountingChatModel(cache=InMemoryCache())
+    leader = asyncio.create_task(model.ainvoke("popular"))
+    await asyncio.sleep(0.01)
+    follower = asyncio.create_task(model.ainvoke("popular"))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert (await follower).content == "answer 2"
+    assert model.calls == 2
+
+
+async def test_no_coalescing_without_cache() -> None:
+    model = SlowCountingChatModel(cache=False)
+    await asyncio.gather(*(model.ainvoke("popular") for _ in range(3)))
+    assert model.calls == 3
+
+
+async def test_sync_call_on_event_loop_does_not_wait_for_async_leader(
+    blockbuster: BlockBuster,
+) -> None:
+    # The sync call blocks the running loop on purpose.
+    blockbuster.deactivate()
+    model = SlowCountingChatModel(cache=InMemoryCache())
+    leader = asyncio.create_task(model.ainvoke("popular"))
+    await asyncio.sleep(0.01)
+    # Waiting for the leader here would block the loop it runs on forever.
+    model.invoke("popular")
+    await leader
+    assert model.calls == 2
+    assert len(get_in_flight_requests()) == 0
@@ -1,7 +1,9 @@
 from typing import cast
 
+import pytest
+
 from langchain_core.load import dumpd, load
-from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.messages import AIMessage, AIMessageChunk, AIMessageChunkBuilder
 from langchain_core.messages import content as types
 from langchain_core.messages.ai import (
     InputTokenDetails,
@@ -201,6 +203,75 @@ def test_add_ai_message_chunks_usage() -> None:
     )
 
 
+def test_ai_message_chunk_builder() -> None:
+    chunks = [
+        AIMessageChunk(content="", id="lc_run-1"),
+        AIMessageChunk(
+            content="Hel",
+            id="msg_1",
+            additional_kwargs={"foo": "a"},
+            tool_call_chunks=[
+                create_tool_call_chunk(name="tool1", args="", id="1", index=0)
+            ],
+        ),
+        AIMessageChunk(
+            content="lo",
+            additional_kwargs={"foo": "b"},
+            response_metadata={"model": "bar"},
+            tool_call_chunks=[
+                create_tool_call_chunk(name=None, args='{"a":', id=None, index=0),
+                create_tool_call_chunk(name="tool2", args="{}", id="2", index=1),
+            ],
+            usage_metadata=UsageMetadata(
+                input_tokens=1, output_tokens=2, total_tokens=3
+            ),
+        ),
+        AIMessageChunk(
+            content="!",
+            tool_call_chunks=[
+                create_tool_call_chunk(name=None, args=" 1}", id=None, index=0)
+            ],
+            usage_metadata=UsageMetadata(
+                input_tokens=0, output_tokens=1, total_tokens=1
+            ),
+            chunk_position="last",
+        ),
+    ]
+    builder = AIMessageChunkBuilder()
+    for chunk in chunks:
+        builder.add(chunk)
+    assert len(builder) == len(chunks)
+    result = builder.build()
+    assert result == add_ai_message_chunks(*chunks)
+    assert result.content == "Hello!"
+    assert result.id == "msg_1"
+    assert result.tool_calls == [
+        create_tool_call(name="tool1", args={"a": 1}, id="1"),
+        create_tool_call(name="tool2", args={}, id="2"),
+    ]
+    assert result.usage_metadata == UsageMetadata(
+        input_tokens=1, output_tokens=3, total_tokens=4
+    )
+    assert result.chunk_position == "last"
+
+
+def test_ai_message_chunk_builder_list_content() -> None:
+    chunks = [
+        AIMessageChunk(content=[{"type": "text", "text": "Hel", "index": 0}]),
+        AIMessageChunk(content=[{"type": "text", "text": "lo", "index": 0}]),
+        AIMessageChunk(content="!"),
+    ]
+    builder = AIMessageChunkBuilder()
+    for chunk in chunks:
+        builder.add(chunk)
+    assert builder.build() == add_ai_message_chunks(*chunks)
+
+
+def test_ai_message_chunk_builder_empty() -> None:
+    with pytest.raises(ValueError, match="No chunks"):
+        AIMessageChunkBuilder().build()
+
+
 def test_init_tool_calls() -> None:
     # Test we add "type" key on init
     msg = AIMessage("", tool_calls=[{"name": "foo", "args": {"a": "b"}, "id": "abc"}])
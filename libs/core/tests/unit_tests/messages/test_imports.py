@@ -5,11 +5,13 @@ EXPECTED_ALL = [
     "_message_from_dict",
     "AIMessage",
     "AIMessageChunk",
+    "AIMessageChunkBuilder",
     "Annotation",
     "AnyMessage",
     "AudioContentBlock",
     "BaseMessage",
     "BaseMessageChunk",
+    "CachedTokenCounter",
     "ContentBlock",
     "ChatMessage",
     "ChatMessageChunk",
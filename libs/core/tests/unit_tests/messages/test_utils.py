@@ -2,7 +2,7 @@ import base64
 import json
 import re
 from collections.abc import Callable, Sequence
-from typing import Any, TypedDict
+from typing import Any, Literal, TypedDict
 
 import pytest
 from typing_extensions import NotRequired, override
@@ -17,6 +17,7 @@ from langchain_core.messages import (
     ToolMessage,
 )
 from langchain_core.messages.utils import (
+    CachedTokenCounter,
     convert_to_messages,
     convert_to_openai_messages,
     count_tokens_approximately,
@@ -673,6 +674,86 @@ def test_trim_messages_start_on_with_allow_partial() -> None:
     assert messages == messages_copy
 
 
+def _wrapped_count_tokens_approximately(messages: list[BaseMessage]) -> int:
+    # Hides the counter, so trim_messages recounts slices of the messages.
+    return count_tokens_approximately(messages)
+
+
+@pytest.mark.parametrize(
+    ("strategy", "allow_partial", "max_tokens"),
+    [
+        ("first", False, 25),
+        ("first", True, 25),
+        ("last", False, 25),
+        ("last", True, 25),
+        ("last", True, 1),
+        ("last", False, 1000),
+    ],
+)
+def test_trim_messages_additive_token_counter(
+    strategy: Literal["first", "last"], *, allow_partial: bool, max_tokens: int
+) -> None:
+    kwargs: dict[str, Any] = {
+        "max_tokens": max_tokens,
+        "strategy": strategy,
+        "allow_partial": allow_partial,
+    }
+    expected = trim_messages(
+        _MESSAGES_TO_TRIM, token_counter=_wrapped_count_tokens_approximately, **kwargs
+    )
+    assert (
+        trim_messages(
+            _MESSAGES_TO_TRIM, token_counter=count_tokens_approximately, **kwargs
+        )
+        == expected
+    )
+    assert (
+        trim_messages(
+            _MESSAGES_TO_TRIM,
+            token_counter=CachedTokenCounter(count_tokens_approximately),
+            **kwargs,
+        )
+        == expected
+    )
+    assert _MESSAGES_TO_TRIM == _MESSAGES_TO_TRIM_COPY
+
+
+def test_cached_token_counter() -> None:
+    counted: list[BaseMessage] = []
+
+    def token_counter(messages: list[BaseMessage]) -> int:
+        counted.extend(messages)
+        return count_tokens_approximately(messages)
+
+    cached = CachedTokenCounter(token_counter, max_size=4)
+    messages = [m.model_copy(deep=True) for m in _MESSAGES_TO_TRIM]
+    expected = count_tokens_approximately(messages)
+
+    assert cached(messages) == expected
+    assert len(counted) == 5
+
+    # Only the message without an ID is counted again
+    counted.clear()
+    assert cached(messages[1:]) == expected - count_tokens_approximately(messages[:1])
+    assert cached(messages[1:]) == expected - count_tokens_approximately(messages[:1])
+    assert counted == []
+
+    # Edited messages are counted again
+    messages[-1].content = "This is an edited text."
+    assert cached.prefix_totals(messages[-2:]) == [
+        0,
+        count_tokens_approximately(messages[-2:-1]),
+        count_tokens_approximately(messages[-2:]),
+    ]
+    assert counted == [messages[-1]]
+
+    # The least recently counted messages are evicted
+    cached([HumanMessage("This is a new text.", id="fifth")])
+    counted.clear()
+    cached(messages[1:2])
+    assert counted == [messages[1]]
+
+
 class FakeTokenCountingModel(FakeChatModel):
     @override
     def get_num_tokens_from_messages(
@@ -2,6 +2,7 @@ import json
 from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
+import jsonpatch  # type: ignore[import-untyped]
 import pytest
 from pydantic import BaseModel, Field
 
@@ -11,6 +12,7 @@ from langchain_core.output_parsers.json import (
 )
 from langchain_core.utils.function_calling import convert_to_openai_function
 from langchain_core.utils.json import (
+    PartialJsonParser,
     parse_and_check_json_markdown,
     parse_json_markdown,
     parse_partial_json,
@@ -264,6 +266,93 @@ def test_parse_partial_json(json_strings: tuple[str, str]) -> None:
     assert parsed == json.loads(expected)
 
 
+@pytest.mark.parametrize("json_strings", TEST_CASES_PARTIAL)
+def test_partial_json_parser(json_strings: tuple[str, str]) -> None:
+    case, expected = json_strings
+    parser = PartialJsonParser()
+    for char in case:
+        parser.feed(char)
+    assert parser.value() == json.loads(expected)
+
+
+def test_partial_json_parser_matches_parse_partial_json() -> None:
+    text = json.dumps(
+        {
+            "text": 'say "hi" \\ \n é',
+            "numbers": [1, -2.5e3, 0.25],
+            "flags": [True, False, None],
+            "nested": {"empty": {}, "list": [[], {"a": "b"}]},
+        },
+        indent=2,
+        ensure_ascii=False,
+    )
+    parser = PartialJsonParser()
+    prev = None
+    for end in range(1, len(text) + 1):
+        changed = parser.feed(text[end - 1])
+        expected = parse_partial_json(text[:end])
+        assert parser.value() == expected
+        assert changed == (expected != prev)
+        if changed:
+            assert jsonpatch.apply_patch(prev, parser.patch()) == expected
+            prev = expected
+    assert parser.done
+
+
+def test_partial_json_parser_truncated_unicode_escape() -> None:
+    # parse_partial_json drops a string cut inside a \uXXXX escape with its key.
+    text = r'{"k0": "a\"b\u00e9", "k1": ["x\ud83d\ude00", "y\u0041"]}'
+    parser = PartialJsonParser()
+    prev = None
+    for end in range(1, len(text) + 1):
+        changed = parser.feed(text[end - 1])
+        expected = parse_partial_json(text[:end])
+        assert parser.value() == expected, text[:end]
+        assert changed == (expected != prev)
+        if changed:
+            assert jsonpatch.apply_patch(prev, parser.patch()) == expected
+            prev = expected
+
+    parser = PartialJsonParser()
+    assert parser.feed('{"k0": "a\\"b')
+    assert parser.feed("\\u0")
+    assert parser.value() == {}
+    assert parser.patch() == [{"op": "remove", "path": "/k0"}]
+    assert parser.feed("0e9")
+    assert parser.patch() == [{"op": "add", "path": "/k0", "value": 'a"b\u00e9'}]
+
+
+def test_partial_json_parser_patch() -> None:
+    parser = PartialJsonParser()
+    assert parser.feed('{"name": "Jo')
+    assert parser.patch() == [{"op": "replace", "path": "", "value": {"name": "Jo"}}]
+    assert parser.feed('hn", "tags": ["a/b')
+    assert parser.patch() == [
+        {"op": "replace", "path": "/name", "value": "John"},
+        {"op": "add", "path": "/tags", "value": ["a/b"]},
+    ]
+    assert not parser.feed('", tr')
+    assert parser.feed('ue], "a/b": {"c": 1')
+    assert parser.patch() == [
+        {"op": "add", "path": "/tags/1", "value": True},
+        {"op": "add", "path": "/a~1b", "value": {"c": 1}},
+    ]
+    # Values handed out are not modified by later chunks.
+    value = parser.value()
+    assert parser.feed("2}}")
+    assert value == {"name": "John", "tags": ["a/b", True], "a/b": {"c": 1}}
+    assert parser.value() == {"name": "John", "tags": ["a/b", True], "a/b": {"c": 12}}
+
+
+@pytest.mark.parametrize("text", ['{"foo" "bar"}', '{"foo": bar}', "[1}", '{"a": 1,}'])
+def test_partial_json_parser_invalid(text: str) -> None:
+    parser = PartialJsonParser()
+    with pytest.raises(json.JSONDecodeError):
+        parser.feed(text)
+    with pytest.raises(json.JSONDecodeError):
+        parser.feed("")
+
+
 STREAMED_TOKENS = """
 {
 
@@ -523,6 +612,26 @@ def test_partial_text_json_output_parser_diff() -> None:
     assert list(chain.stream(None)) == EXPECTED_STREAMED_JSON_DIFF
 
 
+def test_partial_text_json_output_parser_does_not_reparse(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def parse_json_markdown(*_: Any, **__: Any) -> Any:
+        msg = "The accumulated output should not be reparsed."
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(
+        "langchain_core.output_parsers.json.parse_json_markdown", parse_json_markdown
+    )
+
+    def input_iter(_: Any) -> Iterator[str]:
+        yield from ["```json\n", *STREAMED_TOKENS, "\n```\nHope this helps!"]
+
+    chain = input_iter | SimpleJsonOutputParser()
+    assert list(chain.stream(None)) == EXPECTED_STREAMED_JSON
+    chain = input_iter | SimpleJsonOutputParser(diff=True)
+    assert list(chain.stream(None)) == EXPECTED_STREAMED_JSON_DIFF
+
+
 async def test_partial_text_json_output_parser_async() -> None:
     async def input_iter(_: Any) -> AsyncIterator[str]:
         for token in STREAMED_TOKENS:
@@ -2,6 +2,7 @@ import sys
 from collections.abc import AsyncIterator, Iterator
 from typing import Any
 
+import jsonpatch  # type: ignore[import-untyped]
 import pydantic
 import pytest
 from pydantic import BaseModel, Field, ValidationError
@@ -413,6 +414,39 @@ async def test_partial_json_output_parser_async(*, use_tool_calls: bool) -> None
     assert actual == expected
 
 
+@pytest.mark.parametrize("use_tool_calls", [False, True])
+def test_partial_json_output_parser_diff(*, use_tool_calls: bool) -> None:
+    input_iter = _get_iter(use_tool_calls=use_tool_calls)
+    chain = input_iter | JsonOutputToolsParser(diff=True)
+
+    actual = []
+    value = None
+    for patch in chain.stream(None):
+        value = jsonpatch.apply_patch(value, patch)
+        actual.append(value)
+    expected: list = [[]] + [
+        [{"type": "NameCollector", "args": chunk}] for chunk in EXPECTED_STREAMED_JSON
+    ]
+    assert actual == expected
+
+
+def test_partial_json_output_parser_does_not_reparse(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def parse_result(*_: Any, **__: Any) -> Any:
+        msg = "The accumulated output should not be reparsed."
+        raise AssertionError(msg)
+
+    monkeypatch.setattr(JsonOutputToolsParser, "parse_result", parse_result)
+    input_iter = _get_iter(use_tool_calls=True)
+    chain = input_iter | JsonOutputToolsParser(first_tool_only=True)
+
+    expected: list = [[]] + [
+        {"type": "NameCollector", "args": chunk} for chunk in EXPECTED_STREAMED_JSON
+    ]
+    assert list(chain.stream(None)) == expected
+
+
 @pytest.mark.parametrize("use_tool_calls", [False, True])
 def test_partial_json_output_parser_return_id(*, use_tool_calls: bool) -> None:
     input_iter = _get_iter(use_tool_calls=use_tool_calls)
@@ -1,7 +1,11 @@
 import pytest
 
-from langchain_core.messages import AIMessage
-from langchain_core.outputs import ChatGeneration
+from langchain_core.messages import AIMessage, AIMessageChunk, ChatMessageChunk
+from langchain_core.outputs import (
+    ChatGeneration,
+    ChatGenerationChunk,
+    ChatGenerationChunkBuilder,
+)
 
 
 @pytest.mark.parametrize(
@@ -28,3 +32,32 @@ def test_msg_no_text(content: str | list) -> None:
     expected = ""
     actual = ChatGeneration(message=AIMessage(content=content)).text
     assert actual == expected
+
+
+def test_chat_generation_chunk_builder() -> None:
+    chunks = [
+        ChatGenerationChunk(message=AIMessageChunk(content="foo")),
+        ChatGenerationChunk(
+            message=AIMessageChunk(content="bar"), generation_info={"a": "b"}
+        ),
+        ChatGenerationChunk(
+            message=AIMessageChunk(content="baz"), generation_info={"c": "d"}
+        ),
+    ]
+    builder = ChatGenerationChunkBuilder()
+    assert builder.build() is None
+    for chunk in chunks:
+        builder.add(chunk)
+    assert builder.build() == chunks[0] + chunks[1:]
+
+
+def test_chat_generation_chunk_builder_other_messages() -> None:
+    chunks = [
+        ChatGenerationChunk(message=AIMessageChunk(content="foo")),
+        ChatGenerationChunk(message=AIMessageChunk(content="bar")),
+        ChatGenerationChunk(message=ChatMessageChunk(content="baz", role="ai")),
+    ]
+    builder = ChatGenerationChunkBuilder()
+    for chunk in chunks:
+        builder.add(chunk)
+    assert builder.build() == chunks[0] + chunks[1:]
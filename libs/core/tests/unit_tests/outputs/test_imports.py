@@ -3,6 +3,7 @@ from langchain_core.outputs import __all__
 EXPECTED_ALL = [
     "ChatGeneration",
     "ChatGenerationChunk",
+    "ChatGenerationChunkBuilder",
     "ChatResult",
     "Generation",
     "GenerationChunk",
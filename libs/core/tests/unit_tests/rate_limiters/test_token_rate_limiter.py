@@ -0,0 +1,146 @@
+"""Test token rate limiter."""
+
+import asyncio
+
+import pytest
+from blockbuster import BlockBuster
+from freezegun import freeze_time
+
+from langchain_core.language_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.rate_limiters import (
+    RateLimitBudget,
+    TokenRateLimiter,
+    get_rate_limit_budget,
+)
+
+
+@pytest.fixture(autouse=True)
+def deactivate_blockbuster(blockbuster: BlockBuster) -> None:
+    # Deactivate BlockBuster to not disturb the rate limiter timings
+    blockbuster.deactivate()
+
+
+def test_charges_requests_and_tokens() -> None:
+    with freeze_time("2023-01-01 00:00:00") as frozen_time:
+        rate_limiter = TokenRateLimiter(requests_per_minute=60, tokens_per_minute=600)
+        requests, tokens = rate_limiter.budgets
+        assert rate_limiter.acquire_tokens(500, blocking=False) is not None
+        assert requests.available == 59
+        assert tokens.available == 100
+        # Not enough tokens left for a second large call.
+        assert rate_limiter.acquire_tokens(200, blocking=False) is None
+        assert tokens.available == 100
+        frozen_time.tick(10)  # 10 tokens per second
+        assert rate_limiter.acquire_tokens(200, blocking=False) is not None
+        assert tokens.available == 0
+
+
+def test_waiters_are_served_in_fifo_order() -> None:
+    with freeze_time("2023-01-01 00:00:00"):
+        rate_limiter = TokenRateLimiter(tokens_per_minute=600)
+        first = rate_limiter._reserve(600, blocking=True)
+        second = rate_limiter._reserve(60, blocking=True)
+        third = rate_limiter._reserve(120, blocking=True)
+        assert first is not None
+        assert second is not None
+        assert third is not None
+        # Each waiter sleeps until the debt of everyone before it is paid back.
+        assert first.wait == 0
+        assert second.wait == pytest.approx(6)
+        assert third.wait == pytest.approx(18)
+        # A non-blocking caller does not jump the queue.
+        assert rate_limiter.acquire_tokens(1, blocking=False) is None
+
+
+def test_reconcile_with_actual_usage() -> None:
+    with freeze_time("2023-01-01 00:00:00"):
+        rate_limiter = TokenRateLimiter(requests_per_minute=60, tokens_per_minute=1000)
+        requests, tokens = rate_limiter.budgets
+        reservation = rate_limiter.acquire_tokens(500)
+        assert reservation is not None
+        reservation.reconcile(200)
+        assert tokens.available == 800
+        assert requests.available == 59
+        reservation.reconcile(900)
+        assert tokens.available == 100
+        reservation.release()
+        assert tokens.available == 1000
+        assert requests.available == 60
+
+
+async def test_cancelled_waiter_releases_its_reservation() -> None:
+    rate_limiter = TokenRateLimiter(tokens_per_minute=60)
+    tokens = rate_limiter.budgets[0]
+    await rate_limiter.aacquire_tokens(60)
+    task = asyncio.create_task(rate_limiter.aacquire_tokens(30))
+    await asyncio.sleep(0.01)
+    assert tokens.available < -29
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert tokens.available > -1
+
+
+def test_named_budgets_are_shared() -> None:
+    first = TokenRateLimiter(name="test-shared", tokens_per_minute=1000)
+    second = TokenRateLimiter(
+        name="test-shared", requests_per_minute=10, tokens_per_minute=1000
+    )
+    assert second.budgets[-1] is first.budgets[0]
+    assert (
+        get_rate_limit_budget("test-shared:tokens", 1000, unit="tokens")
+        is (first.budgets[0])
+    )
+    with pytest.raises(ValueError, match="different setup"):
+        get_rate_limit_budget("test-shared:tokens", 2000, unit="tokens")
+
+
+def test_requires_a_budget() -> None:
+    with pytest.raises(ValueError, match="at least one budget"):
+        TokenRateLimiter()
+    with pytest.raises(ValueError, match="greater than 0"):
+        RateLimitBudget(0)
+
+
+def test_estimate_tokens() -> None:
+    rate_limiter = TokenRateLimiter(tokens_per_minute=1000, default_completion_tokens=5)
+    messages = [HumanMessage("a" * 40)]
+    assert rate_limiter.estimate_tokens(messages) == 10 + 4 + 5
+    assert rate_limiter.estimate_tokens(messages, max_tokens=100) == 10 + 4 + 100
+
+
+@pytest.mark.parametrize("method", ["invoke", "ainvoke"])
+async def test_chat_model_reconciles_usage(method: str) -> None:
+    rate_limiter = TokenRateLimiter(
+        tokens_per_minute=10_000, default_completion_tokens=100
+    )
+    tokens = rate_limiter.budgets[0]
+    message = AIMessage(
+        "hello",
+        usage_metadata={"input_tokens": 7, "output_tokens": 3, "total_tokens": 10},
+    )
+    model = GenericFakeChatModel(messages=iter([message]), rate_limiter=rate_limiter)
+    # Freeze time so that the budget does not refill during the call.
+    with freeze_time("2023-01-01 00:00:00"):
+        if method == "invoke":
+            model.invoke("foo")
+        else:
+            await model.ainvoke("foo")
+        assert tokens.available == 10_000 - 10
+
+
+async def test_chat_model_stream_keeps_estimate_without_usage() -> None:
+    rate_limiter = TokenRateLimiter(
+        tokens_per_minute=10_000, default_completion_tokens=100
+    )
+    tokens = rate_limiter.budgets[0]
+    model = GenericFakeChatModel(
+        messages=iter(["hello", "world"]), rate_limiter=rate_limiter
+    )
+    estimate = rate_limiter.estimate_tokens([HumanMessage("foo")])
+    with freeze_time("2023-01-01 00:00:00"):
+        list(model.stream("foo"))
+        assert tokens.available == 10_000 - estimate
+        [chunk async for chunk in model.astream("foo")]
+        assert tokens.available == 10_000 - 2 * estimate
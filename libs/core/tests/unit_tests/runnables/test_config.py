@@ -1,4 +1,6 @@
 import json
+import threading
+import time
 import uuid
 from contextvars import copy_context
 from typing import Any, cast
@@ -13,12 +15,20 @@ from langchain_core.callbacks.manager import (
 )
 from langchain_core.callbacks.stdout import StdOutCallbackHandler
 from langchain_core.callbacks.streaming_stdout import StreamingStdOutCallbackHandler
-from langchain_core.runnables import RunnableBinding, RunnablePassthrough
+from langchain_core.runnables import (
+    RunnableBinding,
+    RunnableLambda,
+    RunnableParallel,
+    RunnablePassthrough,
+)
 from langchain_core.runnables.config import (
     RunnableConfig,
     _set_config_context,
     ensure_config,
+    get_executor,
+    get_executor_for_config,
     merge_configs,
+    register_executor,
     run_in_executor,
 )
 from langchain_core.tracers.stdout import ConsoleCallbackHandler
@@ -161,3 +171,87 @@ async def test_run_in_executor() -> None:
 
     with pytest.raises(RuntimeError):
         await run_in_executor(None, raises_stop_iter)
+
+
+def test_batch_reuses_shared_executor() -> None:
+    executor = register_executor("test-reuse", max_workers=4)
+    config: RunnableConfig = {"executor_name": "test-reuse"}
+    threads: set[int] = set()
+
+    def record(x: int) -> int:
+        threads.add(threading.get_ident())
+        return x
+
+    runnable = RunnableLambda(record)
+    for _ in range(5):
+        assert runnable.batch(list(range(8)), config) == list(range(8))
+    # The same few threads serve every batch.
+    assert len(threads) <= 4
+    stats = executor.stats()
+    assert stats.submitted == 40
+    assert stats.running == 0
+    assert stats.queued == 0
+    assert stats.max_workers == 4
+
+
+def test_max_concurrency_on_shared_executor() -> None:
+    register_executor("test-limit", max_workers=8)
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def work(x: int) -> int:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+        return x
+
+    runnable = RunnableLambda(work)
+    config: RunnableConfig = {"executor_name": "test-limit", "max_concurrency": 2}
+    assert runnable.batch(list(range(10)), config) == list(range(10))
+    assert peak == 2
+    assert sorted(
+        i for i, _ in runnable.batch_as_completed(list(range(6)), config)
+    ) == (list(range(6)))
+    assert peak == 2
+
+
+def test_nested_parallel_does_not_deadlock() -> None:
+    executor = register_executor("test-nested", max_workers=2)
+
+    def slow(x: int) -> int:
+        time.sleep(0.001)
+        return x
+
+    inner = RunnableParallel(a=slow, b=slow, c=slow)
+    outer = RunnableParallel(x=inner, y=inner, z=inner)
+    outputs = outer.batch(list(range(4)), {"executor_name": "test-nested"})
+    assert outputs == [
+        {key: {"a": i, "b": i, "c": i} for key in ("x", "y", "z")} for i in range(4)
+    ]
+    assert executor.stats().inlined > 0
+
+
+def test_executor_stats_while_running() -> None:
+    executor = register_executor("test-stats", max_workers=1)
+    release = threading.Event()
+    with get_executor_for_config({"executor_name": "test-stats"}) as limited:
+        futures = [limited.submit(release.wait) for _ in range(3)]
+        time.sleep(0.05)
+        stats = executor.stats()
+        assert stats.running == 1
+        assert stats.queued == 2
+        assert stats.utilization == 1.0
+        release.set()
+    assert all(future.result() for future in futures)
+    assert executor.stats().running == 0
+
+
+def test_unknown_executor_name() -> None:
+    assert get_executor() is get_executor("default")
+    with pytest.raises(ValueError, match="No executor named"):
+        get_executor("does-not-exist")
@@ -3345,3 +3345,29 @@ async def test_tool_call_id_passed_via_run_method(method: str) -> None:
     assert handler.tool_starts == 1
     assert len(handler.captured_tool_call_ids) == 1
     assert handler.captured_tool_call_ids[0] == "run_method_tool_call_id"
+
+
+def test_tool_schemas_are_cached() -> None:
+    @tool
+    def foo(bar: int, baz: Annotated[str, InjectedToolArg]) -> str:
+        """Foo."""
+        return str(bar) + baz
+
+    schema = foo.tool_call_schema
+    assert foo.tool_call_schema is schema
+    formatted = convert_to_openai_tool(foo)
+    assert convert_to_openai_tool(foo) == formatted
+    # Callers get their own copy of the formatted tool.
+    formatted["function"]["parameters"]["properties"].clear()
+    assert convert_to_openai_tool(foo)["function"]["parameters"]["properties"]
+    assert convert_to_openai_tool(foo, strict=True)["function"]["strict"] is True
+
+    # Reassigning a field invalidates the cached schemas.
+    foo.description = "New description."
+    assert foo.tool_call_schema is not schema
+    assert convert_to_openai_tool(foo)["function"]["description"] == (
+        "New description."
+    )
+    renamed = foo.model_copy(update={"name": "renamed"})
+    assert convert_to_openai_tool(renamed)["function"]["name"] == "renamed"
+    assert convert_to_openai_tool(foo)["function"]["name"] == "foo"
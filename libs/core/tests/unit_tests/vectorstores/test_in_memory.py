@@ -1,12 +1,15 @@
+import random
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock
 
+import numpy as np
 import pytest
 from langchain_tests.integration_tests.vectorstores import VectorStoreIntegrationTests
 
 from langchain_core.documents import Document
 from langchain_core.embeddings.fake import DeterministicFakeEmbedding
-from langchain_core.vectorstores import InMemoryVectorStore
+from langchain_core.vectorstores import InMemoryVectorStore, _matrix, in_memory
+from langchain_core.vectorstores.ann import IVFIndex
 from tests.unit_tests.stubs import _any_id_document
 
 
@@ -98,6 +101,35 @@ def test_inmemory_dump_load(tmp_path: Path) -> None:
     assert output == loaded_output
 
 
+def test_inmemory_without_numpy(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test numpy is only required to search."""
+    monkeypatch.setattr(_matrix, "_HAS_NUMPY", False)
+    monkeypatch.setattr(in_memory, "_HAS_NUMPY", False)
+    embedding = DeterministicFakeEmbedding(size=6)
+    store = InMemoryVectorStore(embedding=embedding, compact_ratio=0.1)
+    store._matrix.min_compact_rows = 1
+    store.add_documents(
+        [Document(id=id_, page_content=id_) for id_ in ["a", "b", "c", "d"]]
+    )
+    store.add_documents([Document(id="b", page_content="B")])
+    store.delete(["a"])
+    assert [doc.page_content for doc in store.get_by_ids(["a", "b", "c"])] == [
+        "B",
+        "c",
+    ]
+    assert store.store["b"]["vector"] == embedding.embed_query("B")
+
+    test_file = str(tmp_path / "test.json")
+    store.dump(test_file)
+    loaded_store = InMemoryVectorStore.load(test_file, embedding)
+    assert dict(loaded_store.store) == dict(store.store)
+
+    with pytest.raises(ImportError, match="numpy"):
+        store.similarity_search("b")
+
+
 async def test_inmemory_filter() -> None:
     """Test end to end construction and search with filter."""
     store = await InMemoryVectorStore.afrom_texts(
@@ -174,7 +206,8 @@ async def test_inmemory_upsert() -> None:
     assert item == {
         "id": "2",
         "text": "baz",
-        "vector": baz_vector,
+        # vectors are stored as float32
+        "vector": pytest.approx(baz_vector, rel=1e-6),
         "metadata": {"metadata": "value"},
     }
 
@@ -220,3 +253,353 @@ async def test_inmemory_call_embeddings_async() -> None:
     # Ensure the async embedding function is called
     assert embeddings_mock.aembed_documents.await_count == 1
     assert embeddings_mock.aembed_query.await_count == 1
+
+
+def test_inmemory_similarity_search_by_vectors() -> None:
+    """Test batched search returns the same hits as one-by-one search."""
+    embedding = DeterministicFakeEmbedding(size=6)
+    store = InMemoryVectorStore.from_texts(["foo", "bar", "baz", "qux"], embedding)
+    queries = [embedding.embed_query(text) for text in ["bar", "qux", "foo"]]
+
+    batched = store.similarity_search_with_score_by_vectors(queries, k=2)
+    for hits, query in zip(batched, queries, strict=True):
+        single = store.similarity_search_with_score_by_vector(query, k=2)
+        assert [doc for doc, _ in hits] == [doc for doc, _ in single]
+        assert [score for _, score in hits] == pytest.approx(
+            [score for _, score in single], abs=1e-6
+        )
+    assert [hits[0][0].page_content for hits in batched] == ["bar", "qux", "foo"]
+
+    docs = store.similarity_search_by_vectors(
+        queries, k=3, filter=lambda doc: doc.page_content != "qux"
+    )
+    assert all("qux" not in [doc.page_content for doc in hits] for hits in docs)
+
+
+def test_inmemory_delete_compaction() -> None:
+    """Test deleted rows are excluded from search and eventually compacted."""
+    embedding = DeterministicFakeEmbedding(size=6)
+    store = InMemoryVectorStore(embedding=embedding, compact_ratio=0.5)
+    store._matrix.min_compact_rows = 2
+    texts = [f"text {i}" for i in range(6)]
+    ids = store.add_texts(texts, ids=[str(i) for i in range(6)])
+
+    store.delete(["1"])
+    assert store._matrix.size == 6
+    assert "1" not in store.store
+    output = store.similarity_search("text 1", k=6)
+    assert [doc.id for doc in output if doc.id == "1"] == []
+    assert len(output) == 5
+
+    store.delete(["2", "3"])
+    assert store._matrix.size == 3
+    assert list(store.store) == [ids[0], ids[4], ids[5]]
+    assert store.similarity_search("text 4", k=1)[0].id == "4"
+
+
+def test_inmemory_dimension_mismatch() -> None:
+    store = InMemoryVectorStore(embedding=DeterministicFakeEmbedding(size=6))
+    store.add_texts(["foo"])
+    store.embedding = DeterministicFakeEmbedding(size=3)
+    with pytest.raises(ValueError, match="dimension mismatch"):
+        store.add_texts(["bar"])
+
+
+def _ivf_store(n: int = 200) -> tuple[InMemoryVectorStore, list[str]]:
+    store = InMemoryVectorStore(
+        embedding=DeterministicFakeEmbedding(size=8),
+        index=IVFIndex(n_lists=8, nprobe=8, min_train_size=50),
+    )
+    texts = [f"text {i}" for i in range(n)]
+    ids = store.add_texts(
+        texts, metadatas=[{"even": i % 2 == 0} for i in range(n)], ids=texts
+    )
+    return store, ids
+
+
+def test_inmemory_ivf_index() -> None:
+    """Test IVF search probing every cell matches exact search."""
+    store, _ = _ivf_store()
+    exact = InMemoryVectorStore.from_texts(
+        list(store.store), DeterministicFakeEmbedding(size=8)
+    )
+
+    output = store.similarity_search("text 3", k=5)
+    assert store.index is not None
+    assert store.index.is_trained  # type: ignore[attr-defined]
+    assert [doc.page_content for doc in output] == [
+        doc.page_content for doc in exact.similarity_search("text 3", k=5)
+    ]
+
+    # rows added after training are assigned to an existing cell
+    store.add_texts(["new text"], ids=["new"])
+    assert store.similarity_search("new text", k=1)[0].id == "new"
+
+    # filtered searches never come back short
+    output = store.similarity_search(
+        "text 3", k=5, filter=lambda doc: doc.metadata.get("even", False)
+    )
+    assert len(output) == 5
+    assert all(doc.metadata["even"] for doc in output)
+
+
+def test_inmemory_ivf_index_compaction() -> None:
+    store, ids = _ivf_store()
+    store._matrix.min_compact_rows = 1
+    store.similarity_search("text 0", k=1)
+
+    store.delete(ids[:100])
+    assert store._matrix.size == 100
+    assert store.similarity_search("text 150", k=1)[0].id == "text 150"
+
+
+def test_inmemory_ivf_index_dump_load(tmp_path: Path) -> None:
+    """Test the trained index is persisted next to the documents."""
+    store, _ = _ivf_store()
+    store.index.nprobe = 3  # type: ignore[union-attr]
+    output = store.similarity_search("text 7", k=4)
+
+    test_file = tmp_path / "test.json"
+    store.dump(str(test_file))
+    assert (tmp_path / "test.json.index.npz").exists()
+
+    loaded_store = InMemoryVectorStore.load(
+        str(test_file), DeterministicFakeEmbedding(size=8)
+    )
+    assert isinstance(loaded_store.index, IVFIndex)
+    assert loaded_store.index.is_trained
+    assert loaded_store.index.nprobe == 3
+    assert loaded_store.similarity_search("text 7", k=4) == output
+
+    # dumping without an index removes the stale index file
+    loaded_store.index = None
+    loaded_store.dump(str(test_file))
+    assert not (tmp_path / "test.json.index.npz").exists()
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_inmemory_dump_load_binary(tmp_path: Path, mmap: bool) -> None:  # noqa: FBT001
+    """Test the binary directory layout round-trips and is memory-mapped."""
+    embedding = DeterministicFakeEmbedding(size=6)
+    store = InMemoryVectorStore.from_texts(
+        ["foo", "bar", "baz"], embedding, metadatas=[{"a": 1}, {"a": 2}, {"a": 3}]
+    )
+    store.delete([next(iter(store.store))])
+    output = store.similarity_search_with_score("bar", k=2)
+
+    store_dir = tmp_path / "store"
+    store.dump(str(store_dir), format="binary")
+    assert sorted(p.name for p in store_dir.iterdir()) == [
+        "documents.json",
+        "norms.npy",
+        "vectors.npy",
+    ]
+
+    loaded_store = InMemoryVectorStore.load(str(store_dir), embedding, mmap=mmap)
+    assert isinstance(loaded_store._matrix.vectors, np.memmap) is mmap
+    assert list(loaded_store.store) == list(store.store)
+    assert loaded_store.similarity_search_with_score("bar", k=2) == output
+
+    # a memory-mapped store can be modified and dumped over its own directory
+    loaded_store.add_texts(["qux"], ids=["qux"])
+    loaded_store.dump(str(store_dir), format="binary")
+    reloaded_store = InMemoryVectorStore.load(str(store_dir), embedding)
+    assert len(reloaded_store.store) == 3
+    assert reloaded_store.similarity_search("qux", k=1)[0].id == "qux"
+
+
+def test_inmemory_dump_load_binary_index(tmp_path: Path) -> None:
+    store, _ = _ivf_store()
+    output = store.similarity_search("text 7", k=4)
+
+    store.dump(str(tmp_path), format="binary")
+    assert (tmp_path / "index.npz").exists()
+
+    loaded_store = InMemoryVectorStore.load(
+        str(tmp_path), DeterministicFakeEmbedding(size=8)
+    )
+    assert isinstance(loaded_store.index, IVFIndex)
+    assert loaded_store.index.is_trained
+    assert loaded_store.similarity_search("text 7", k=4) == output
+
+
+def _metadata_store() -> InMemoryVectorStore:
+    store = InMemoryVectorStore(embedding=DeterministicFakeEmbedding(size=6))
+    store.add_documents(
+        [
+            Document(
+                id="1", page_content="a", metadata={"genre": "drama", "year": 1999}
+            ),
+            Document(
+                id="2", page_content="b", metadata={"genre": "drama", "year": 2005}
+            ),
+            Document(
+                id="3", page_content="c", metadata={"genre": "comedy", "year": 2010.5}
+            ),
+            Document(id="4", page_content="d", metadata={"genre": "horror"}),
+            Document(
+                id="5", page_content="e", metadata={"tags": ["x", "y"], "year": "n/a"}
+            ),
+        ]
+    )
+    return store
+
+
+@pytest.mark.parametrize(
+    ("filter_", "expected"),
+    [
+        ({"genre": "drama"}, {"1", "2"}),
+        ({"genre": {"$eq": "drama"}}, {"1", "2"}),
+        ({"genre": {"$ne": "drama"}}, {"3", "4", "5"}),
+        ({"genre": {"$in": ["comedy", "horror"]}}, {"3", "4"}),
+        ({"genre": {"$nin": ["comedy", "horror"]}}, {"1", "2", "5"}),
+        ({"year": {"$gt": 1999}}, {"2", "3"}),
+        ({"year": {"$gte": 1999, "$lt": 2010}}, {"1", "2"}),
+        ({"year": {"$lte": 2005}}, {"1", "2"}),
+        ({"year": {"$gte": "a"}}, {"5"}),
+        ({"genre": "drama", "year": {"$gt": 2000}}, {"2"}),
+        ({"$or": [{"genre": "horror"}, {"year": {"$gt": 2006}}]}, {"3", "4"}),
+        ({"$and": [{"genre": "drama"}, {"year": 1999}]}, {"1"}),
+        ({"tags": ["x", "y"]}, {"5"}),
+        ({"missing": 1}, set()),
+    ],
+)
+def test_inmemory_metadata_filter(filter_: dict, expected: set[str]) -> None:
+    store = _metadata_store()
+    output = store.similarity_search("a", k=10, filter=filter_)
+    assert {doc.id for doc in output} == expected
+
+
+async def test_inmemory_metadata_filter_updates() -> None:
+    """Test metadata indexes follow inserts, updates and deletes."""
+    store = _metadata_store()
+    assert {
+        doc.id for doc in store.similarity_search("a", filter={"genre": "drama"})
+    } == {"1", "2"}
+
+    await store.aadd_documents(
+        [
+            Document(id="6", page_content="f", metadata={"genre": "drama"}),
+            Document(id="1", page_content="a", metadata={"genre": "comedy"}),
+        ]
+    )
+    store.delete(["2"])
+    output = await store.asimilarity_search("a", filter={"genre": "drama"})
+    assert {doc.id for doc in output} == {"6"}
+
+    mmr_output = store.max_marginal_relevance_search(
+        "a", k=2, filter={"genre": {"$in": ["comedy", "drama"]}}
+    )
+    assert {doc.id for doc in mmr_output} <= {"1", "3", "6"}
+
+
+def test_inmemory_metadata_filter_after_store_view_mutation() -> None:
+    """Test records returned by `store` are copies the indexes can ignore."""
+    store = _metadata_store()
+    assert {doc.id for doc in store.similarity_search("a", filter={"year": 1999})} == {
+        "1"
+    }
+
+    store.store["1"]["metadata"]["year"] = 2020
+    assert store.store["1"]["metadata"]["year"] == 1999
+    output = store.similarity_search("a", k=10, filter={"year": 1999})
+    assert [(doc.id, doc.metadata["year"]) for doc in output] == [("1", 1999)]
+    assert store.similarity_search("a", filter={"year": 2020}) == []
+
+
+@pytest.mark.parametrize(
+    "filter_",
+    [
+        {"genre": {"$regex": "d.*"}},
+        {"$not": {"genre": "drama"}},
+        {"genre": {"$in": "drama"}},
+        {"year": {"$gt": [2000]}},
+        {"$or": []},
+    ],
+)
+def test_inmemory_metadata_filter_invalid(filter_: dict) -> None:
+    store = _metadata_store()
+    with pytest.raises(ValueError):  # noqa: PT011
+        store.similarity_search("a", filter=filter_)
+
+
+@pytest.mark.parametrize(
+    ("filter_", "expected"),
+    [
+        ({"k": True}, {"a"}),
+        ({"k": 1}, {"b"}),
+        ({"k": {"$in": [1, 5]}}, {"b", "c"}),
+        ({"k": {"$ne": True}}, {"b", "c"}),
+        ({"k": {"$gte": 1}}, {"b", "c"}),
+        ({"k": {"$lt": 3}}, {"b"}),
+    ],
+)
+def test_inmemory_metadata_filter_bools(filter_: dict, expected: set[str]) -> None:
+    """Test booleans don't share index entries with the numbers 0 and 1."""
+    store = InMemoryVectorStore(embedding=DeterministicFakeEmbedding(size=6))
+    store.add_documents(
+        [
+            Document(id="a", page_content="a", metadata={"k": True}),
+            Document(id="b", page_content="b", metadata={"k": 1}),
+            Document(id="c", page_content="c", metadata={"k": 5}),
+        ]
+    )
+    output = store.similarity_search("a", k=10, filter=filter_)
+    assert {doc.id for doc in output} == expected
+
+
+def _reference_match(metadata: dict, operator: str, value: object) -> bool:
+    if "k" not in metadata:
+        return operator in {"$ne", "$nin"}
+    actual = metadata["k"]
+    if operator in {"$eq", "$ne", "$in", "$nin"}:
+        values = value if operator in {"$in", "$nin"} else [value]
+        equal = any(
+            isinstance(actual, bool) == isinstance(item, bool) and actual == item
+            for item in values  # type: ignore[attr-defined]
+        )
+        return equal if operator in {"$eq", "$in"} else not equal
+    if isinstance(value, str):
+        if not isinstance(actual, str):
+            return False
+    elif not isinstance(actual, (int, float)) or isinstance(actual, bool):
+        return False
+    return {
+        "$gt": actual > value,
+        "$gte": actual >= value,
+        "$lt": actual < value,
+        "$lte": actual <= value,
+    }[operator]
+
+
+def test_inmemory_metadata_filter_random() -> None:
+    """Test indexed filters against a brute-force evaluation."""
+    rng = random.Random(0)
+    values = [True, False, 0, 1, 1.0, 2.5, 5, "a", "b", None]
+    store = InMemoryVectorStore(embedding=DeterministicFakeEmbedding(size=6))
+    documents = [
+        Document(
+            id=str(i),
+            page_content=str(i),
+            metadata={"k": rng.choice(values)} if rng.random() < 0.9 else {},
+        )
+        for i in range(60)
+    ]
+    store.add_documents(documents)
+    for _ in range(200):
+        operator = rng.choice(["$eq", "$ne", "$in", "$nin", "$gt", "$gte", "$lt"])
+        if operator in {"$in", "$nin"}:
+            value: object = rng.sample(values, 3)
+        elif operator in {"$eq", "$ne"}:
+            value = rng.choice(values)
+        else:
+            value = rng.choice([0, 1, 2.5, 4, "a", "b"])
+        output = store.similarity_search(
+            "0", k=len(documents), filter={"k": {operator: value}}
+        )
+        expected = {
+            doc.id
+            for doc in documents
+            if _reference_match(doc.metadata, operator, value)
+        }
+        assert {doc.id for doc in output} == expected, (operator, value)
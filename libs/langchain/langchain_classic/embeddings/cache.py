@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import struct
 import uuid
 import warnings
 from collections.abc import Callable, Sequence
@@ -78,11 +79,70 @@ def _value_serializer(value: Sequence[float]) -> bytes:
     return json.dumps(value).encode()
 
 
+# Binary values start with a NUL byte, which never starts a JSON document, followed
+# by the struct format character of the floats and the little-endian floats.
+_BINARY_VALUE_PREFIX = b"\x00lcv"
+_BINARY_VALUE_FORMATS = {"float32": "f", "float16": "e"}
+
+
+def _make_value_serializer(
+    value_codec: Literal["json", "float32", "float16"],
+) -> Callable[[Sequence[float]], bytes]:
+    """Create a value serializer for the given codec.
+
+    Args:
+        value_codec:
+           * `'json'` - a JSON list, lossless but large and slow to parse
+           * `'float32'` - 4 bytes per dimension
+           * `'float16'` - 2 bytes per dimension, with about 3 significant digits
+
+    Returns:
+        A function that serializes an embedding.
+    """
+    if value_codec == "json":
+        return _value_serializer
+    if value_codec not in _BINARY_VALUE_FORMATS:
+        msg = f"Unsupported value codec: {value_codec}"
+        raise ValueError(msg)
+    format_char = _BINARY_VALUE_FORMATS[value_codec]
+    header = _BINARY_VALUE_PREFIX + format_char.encode()
+
+    def _binary_value_serializer(value: Sequence[float]) -> bytes:
+        """Serialize a value as packed floats."""
+        return header + struct.pack(f"<{len(value)}{format_char}", *value)
+
+    return _binary_value_serializer
+
+
 def _value_deserializer(serialized_value: bytes) -> list[float]:
-    """Deserialize a value."""
+    """Deserialize a value written by any of the value serializers."""
+    if serialized_value.startswith(_BINARY_VALUE_PREFIX):
+        offset = len(_BINARY_VALUE_PREFIX) + 1
+        format_char = chr(serialized_value[offset - 1])
+        count = (len(serialized_value) - offset) // struct.calcsize(format_char)
+        return list(
+            struct.unpack_from(f"<{count}{format_char}", serialized_value, offset)
+        )
     return cast("list[float]", json.loads(serialized_value.decode()))
 
 
+def _gather_vectors(
+    texts: list[str], vectors_by_text: dict[str, list[float] | None]
+) -> list[list[float]]:
+    """Return the vector of each text, copying the vectors of repeated texts."""
+    vectors: list[list[float]] = []
+    seen: set[str] = set()
+    for text in texts:
+        # Nones should have been resolved by now
+        vector = cast("list[float]", vectors_by_text[text])
+        if text in seen:
+            vector = list(vector)
+        else:
+            seen.add(text)
+        vectors.append(vector)
+    return vectors
+
+
 # The warning is global; track emission, so it appears only once.
 _warned_about_sha1: bool = False
 
@@ -175,28 +235,24 @@ class CacheBackedEmbeddings(Embeddings):
         Returns:
             A list of embeddings for the given texts.
         """
-        vectors: list[list[float] | None] = self.document_embedding_store.mget(
-            texts,
-        )
-        all_missing_indices: list[int] = [
-            i for i, vector in enumerate(vectors) if vector is None
+        # Look up and embed each distinct text once.
+        unique_texts = list(dict.fromkeys(texts))
+        cached = self.document_embedding_store.mget(unique_texts)
+        vectors_by_text = dict(zip(unique_texts, cached, strict=True))
+        all_missing_texts = [
+            text
+            for text, vector in zip(unique_texts, cached, strict=True)
+            if vector is None
         ]
 
-        for missing_indices in batch_iterate(self.batch_size, all_missing_indices):
-            missing_texts = [texts[i] for i in missing_indices]
+        for missing_texts in batch_iterate(self.batch_size, all_missing_texts):
             missing_vectors = self.underlying_embeddings.embed_documents(missing_texts)
             self.document_embedding_store.mset(
                 list(zip(missing_texts, missing_vectors, strict=False)),
             )
-            for index, updated_vector in zip(
-                missing_indices, missing_vectors, strict=False
-            ):
-                vectors[index] = updated_vector
+            vectors_by_text.update(zip(missing_texts, missing_vectors, strict=False))
 
-        return cast(
-            "list[list[float]]",
-            vectors,
-        )  # Nones should have been resolved by now
+        return _gather_vectors(texts, vectors_by_text)
 
     async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
         """Embed a list of texts.
@@ -211,32 +267,28 @@ class CacheBackedEmbeddings(Embeddings):
         Returns:
             A list of embeddings for the given texts.
         """
-        vectors: list[list[float] | None] = await self.document_embedding_store.amget(
-            texts
-        )
-        all_missing_indices: list[int] = [
-            i for i, vector in enumerate(vectors) if vector is None
+        # Look up and embed each distinct text once.
+        unique_texts = list(dict.fromkeys(texts))
+        cached = await self.document_embedding_store.amget(unique_texts)
+        vectors_by_text = dict(zip(unique_texts, cached, strict=True))
+        all_missing_texts = [
+            text
+            for text, vector in zip(unique_texts, cached, strict=True)
+            if vector is None
         ]
 
         # batch_iterate supports None batch_size which returns all elements at once
         # as a single batch.
-        for missing_indices in batch_iterate(self.batch_size, all_missing_indices):
-            missing_texts = [texts[i] for i in missing_indices]
+        for missing_texts in batch_iterate(self.batch_size, all_missing_texts):
             missing_vectors = await self.underlying_embeddings.aembed_documents(
                 missing_texts,
             )
             await self.document_embedding_store.amset(
                 list(zip(missing_texts, missing_vectors, strict=False)),
             )
-            for index, updated_vector in zip(
-                missing_indices, missing_vectors, strict=False
-            ):
-                vectors[index] = updated_vector
+            vectors_by_text.update(zip(missing_texts, missing_vectors, strict=False))
 
-        return cast(
-            "list[list[float]]",
-            vectors,
-        )  # Nones should have been resolved by now
+        return _gather_vectors(texts, vectors_by_text)
 
     def embed_query(self, text: str) -> list[float]:
         """Embed query text.
@@ -295,6 +347,7 @@ class CacheBackedEmbeddings(Embeddings):
         query_embedding_cache: bool | ByteStore = False,
         key_encoder: Callable[[str], str]
         | Literal["sha1", "blake2b", "sha256", "sha512"] = "sha1",
+        value_codec: Literal["json", "float32", "float16"] = "json",
     ) -> CacheBackedEmbeddings:
         """On-ramp that adds the necessary serialization and encoding to the store.
 
@@ -321,6 +374,16 @@ class CacheBackedEmbeddings(Embeddings):
                 just creating a new cache, to avoid (the potential for)
                 collisions with existing keys or having duplicate keys
                 for the same text in the cache.
+            value_codec: How embeddings are written to the cache.
+
+                * `'json'` - a JSON list of floats, lossless
+                * `'float32'` - packed 32-bit floats, about 5x smaller than JSON and
+                    much faster to read
+                * `'float16'` - packed 16-bit floats, half the size of `'float32'`
+                    with about 3 significant digits
+
+                Embeddings are read back whatever codec they were written with, so
+                the codec of an existing cache can be changed at any time.
 
         Returns:
             An instance of CacheBackedEmbeddings that uses the provided cache.
@@ -343,11 +406,12 @@ class CacheBackedEmbeddings(Embeddings):
                 "or a callable that encodes keys."
             )
             raise ValueError(msg)  # noqa: TRY004
+        value_serializer = _make_value_serializer(value_codec)
 
         document_embedding_store = EncoderBackedStore[str, list[float]](
             document_embedding_cache,
             key_encoder,
-            _value_serializer,
+            value_serializer,
             _value_deserializer,
         )
         if query_embedding_cache is True:
@@ -358,7 +422,7 @@ class CacheBackedEmbeddings(Embeddings):
             query_embedding_store = EncoderBackedStore[str, list[float]](
                 query_embedding_cache,
                 key_encoder,
-                _value_serializer,
+                value_serializer,
                 _value_deserializer,
             )
 
@@ -3,10 +3,12 @@ from typing import Any
 from langchain_core._api import deprecated
 from langchain_core.messages import BaseMessage, get_buffer_string
 from langchain_core.utils import pre_init
+from pydantic import PrivateAttr
 from typing_extensions import override
 
 from langchain_classic.memory.chat_memory import BaseChatMemory
 from langchain_classic.memory.summary import SummarizerMixin
+from langchain_classic.memory.utils import _MessageTokenLedger
 
 
 @deprecated(
@@ -29,6 +31,10 @@ class ConversationSummaryBufferMemory(BaseChatMemory, SummarizerMixin):
     moving_summary_buffer: str = ""
     memory_key: str = "history"
 
+    _token_ledger: _MessageTokenLedger = PrivateAttr(
+        default_factory=_MessageTokenLedger
+    )
+
     @property
     def buffer(self) -> str | list[BaseMessage]:
         """String buffer of memory."""
@@ -112,12 +118,12 @@ class ConversationSummaryBufferMemory(BaseChatMemory, SummarizerMixin):
     def prune(self) -> None:
         """Prune buffer if it exceeds max token limit."""
         buffer = self.chat_memory.messages
-        curr_buffer_length = self.llm.get_num_tokens_from_messages(buffer)
+        curr_buffer_length = self._token_ledger.count(self.llm, buffer)
         if curr_buffer_length > self.max_token_limit:
             pruned_memory = []
             while curr_buffer_length > self.max_token_limit:
                 pruned_memory.append(buffer.pop(0))
-                curr_buffer_length = self.llm.get_num_tokens_from_messages(buffer)
+                curr_buffer_length = self._token_ledger.popleft()
             self.moving_summary_buffer = self.predict_new_summary(
                 pruned_memory,
                 self.moving_summary_buffer,
@@ -126,12 +132,12 @@ class ConversationSummaryBufferMemory(BaseChatMemory, SummarizerMixin):
     async def aprune(self) -> None:
         """Asynchronously prune buffer if it exceeds max token limit."""
         buffer = self.chat_memory.messages
-        curr_buffer_length = self.llm.get_num_tokens_from_messages(buffer)
+        curr_buffer_length = self._token_ledger.count(self.llm, buffer)
         if curr_buffer_length > self.max_token_limit:
             pruned_memory = []
             while curr_buffer_length > self.max_token_limit:
                 pruned_memory.append(buffer.pop(0))
-                curr_buffer_length = self.llm.get_num_tokens_from_messages(buffer)
+                curr_buffer_length = self._token_ledger.popleft()
             self.moving_summary_buffer = await self.apredict_new_summary(
                 pruned_memory,
                 self.moving_summary_buffer,
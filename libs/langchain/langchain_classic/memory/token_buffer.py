@@ -3,9 +3,11 @@ from typing import Any
 from langchain_core._api import deprecated
 from langchain_core.language_models import BaseLanguageModel
 from langchain_core.messages import BaseMessage, get_buffer_string
+from pydantic import PrivateAttr
 from typing_extensions import override
 
 from langchain_classic.memory.chat_memory import BaseChatMemory
+from langchain_classic.memory.utils import _MessageTokenLedger
 
 
 @deprecated(
@@ -29,6 +31,10 @@ class ConversationTokenBufferMemory(BaseChatMemory):
     memory_key: str = "history"
     max_token_limit: int = 2000
 
+    _token_ledger: _MessageTokenLedger = PrivateAttr(
+        default_factory=_MessageTokenLedger
+    )
+
     @property
     def buffer(self) -> Any:
         """String buffer of memory."""
@@ -63,9 +69,9 @@ class ConversationTokenBufferMemory(BaseChatMemory):
         super().save_context(inputs, outputs)
         # Prune buffer if it exceeds max token limit
         buffer = self.chat_memory.messages
-        curr_buffer_length = self.llm.get_num_tokens_from_messages(buffer)
+        curr_buffer_length = self._token_ledger.count(self.llm, buffer)
         if curr_buffer_length > self.max_token_limit:
             pruned_memory = []
             while curr_buffer_length > self.max_token_limit:
                 pruned_memory.append(buffer.pop(0))
-                curr_buffer_length = self.llm.get_num_tokens_from_messages(buffer)
+                curr_buffer_length = self._token_ledger.popleft()
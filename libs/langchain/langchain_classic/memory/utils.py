@@ -1,5 +1,9 @@
+from collections import deque
 from typing import Any
 
+from langchain_core.language_models import BaseLanguageModel
+from langchain_core.messages import BaseMessage
+
 
 def get_prompt_input_key(inputs: dict[str, Any], memory_variables: list[str]) -> str:
     """Get the prompt input key.
@@ -18,3 +22,55 @@ def get_prompt_input_key(inputs: dict[str, Any], memory_variables: list[str]) ->
         msg = f"One input key expected got {prompt_input_keys}"
         raise ValueError(msg)
     return prompt_input_keys[0]
+
+
+class _MessageTokenLedger:
+    """Running token count of a buffer of messages.
+
+    Each message is counted once when it is added to the buffer, and pruning the
+    oldest message subtracts its cached count instead of recounting the buffer.
+    """
+
+    def __init__(self) -> None:
+        self._entries: deque[tuple[BaseMessage, int]] = deque()
+        self._llm: BaseLanguageModel | None = None
+        self._overhead: int | None = None
+        self.total = 0
+
+    def count(self, llm: BaseLanguageModel, messages: list[BaseMessage]) -> int:
+        """Count the new messages at the end of `messages` and return the total.
+
+        The ledger is rebuilt if `messages` does not start with the messages it
+        has already counted, e.g. after the buffer was cleared.
+        """
+        if llm is not self._llm:
+            self._llm = llm
+            self._overhead = None
+            self._entries.clear()
+        elif len(messages) < len(self._entries) or any(
+            message is not counted and message != counted
+            for message, (counted, _) in zip(messages, self._entries, strict=False)
+        ):
+            self._entries.clear()
+
+        if self._overhead is None and messages:
+            # Models may count a fixed number of tokens per list of messages on top
+            # of the per-message counts, e.g. to prime the reply.
+            single = llm.get_num_tokens_from_messages(messages[:1])
+            pair = llm.get_num_tokens_from_messages([messages[0], messages[0]])
+            self._overhead = 2 * single - pair
+        overhead = self._overhead or 0
+
+        if not self._entries:
+            self.total = overhead
+        for message in messages[len(self._entries) :]:
+            tokens = llm.get_num_tokens_from_messages([message]) - overhead
+            self._entries.append((message, tokens))
+            self.total += tokens
+        return self.total
+
+    def popleft(self) -> int:
+        """Remove the count of the oldest message and return the new total."""
+        _, tokens = self._entries.popleft()
+        self.total -= tokens
+        return self.total
@@ -148,11 +148,12 @@ class ConversationVectorStoreTokenBufferMemory(ConversationTokenBufferMemory):
         self._timestamps.append(datetime.now().astimezone())
         # Prune buffer if it exceeds max token limit
         buffer = self.chat_memory.messages
-        curr_buffer_length = self.llm.get_num_tokens_from_messages(buffer)
+        curr_buffer_length = self._token_ledger.count(self.llm, buffer)
         if curr_buffer_length > self.max_token_limit:
             while curr_buffer_length > self.max_token_limit:
                 self._pop_and_store_interaction(buffer)
-                curr_buffer_length = self.llm.get_num_tokens_from_messages(buffer)
+                self._token_ledger.popleft()
+                curr_buffer_length = self._token_ledger.popleft()
 
     def save_remainder(self) -> None:
         """Save the remainder of the conversation buffer to the vector store.
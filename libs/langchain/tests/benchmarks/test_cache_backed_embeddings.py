@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from langchain_core.stores import ByteStore, InMemoryByteStore
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from langchain_classic.embeddings import CacheBackedEmbeddings
+from langchain_classic.storage import LocalFileStore
+
+TEXTS = [f"document {i}" for i in range(200)]
+
+
+def _store(kind: str, tmp_path: Path) -> ByteStore:
+    if kind == "local_file":
+        return LocalFileStore(tmp_path)
+    return InMemoryByteStore()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("value_codec", ["json", "float32", "float16"])
+@pytest.mark.parametrize("store_kind", ["in_memory", "local_file"])
+def test_cache_hits(
+    benchmark: BenchmarkFixture, tmp_path: Path, store_kind: str, value_codec: str
+) -> None:
+    store = _store(store_kind, tmp_path)
+    embedder = CacheBackedEmbeddings.from_bytes_store(
+        DeterministicFakeEmbedding(size=1536),
+        store,
+        key_encoder="sha256",
+        value_codec=value_codec,  # type: ignore[arg-type]
+    )
+    embedder.embed_documents(TEXTS)
+    keys = list(store.yield_keys())
+    benchmark.extra_info["bytes_per_vector"] = sum(
+        len(value) for value in store.mget(keys) if value is not None
+    ) // len(keys)
+
+    @benchmark  # type: ignore[misc]
+    def embed_cached() -> None:
+        embedder.embed_documents(TEXTS)
@@ -0,0 +1,32 @@
+import pytest
+from langchain_core.language_models import FakeListLLM
+from pytest_benchmark.fixture import BenchmarkFixture
+from typing_extensions import override
+
+from langchain_classic.memory import (
+    ConversationSummaryBufferMemory,
+    ConversationTokenBufferMemory,
+)
+
+
+class WordCountingLLM(FakeListLLM):
+    @override
+    def get_num_tokens(self, text: str) -> int:
+        return len(text.split())
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "memory_cls", [ConversationTokenBufferMemory, ConversationSummaryBufferMemory]
+)
+def test_save_context_500_turns(benchmark: BenchmarkFixture, memory_cls: type) -> None:
+    llm = WordCountingLLM(responses=["summary"])
+
+    @benchmark  # type: ignore[misc]
+    def run_conversation() -> None:
+        memory = memory_cls(llm=llm, max_token_limit=2000)
+        for i in range(500):
+            memory.save_context(
+                {"input": f"question {i} " + "word " * 20},
+                {"output": f"answer {i} " + "word " * 40},
+            )
@@ -1,12 +1,22 @@
+from collections.abc import Sequence
+from typing import Any
+
 import pytest
+from langchain_core.messages import BaseMessage, get_buffer_string
+from typing_extensions import override
 
 from langchain_classic.base_memory import BaseMemory
 from langchain_classic.chains.conversation.memory import (
     ConversationBufferMemory,
     ConversationBufferWindowMemory,
+    ConversationSummaryBufferMemory,
     ConversationSummaryMemory,
 )
-from langchain_classic.memory import ReadOnlySharedMemory, SimpleMemory
+from langchain_classic.memory import (
+    ConversationTokenBufferMemory,
+    ReadOnlySharedMemory,
+    SimpleMemory,
+)
 from tests.unit_tests.llms.fake_llm import FakeLLM
 
 
@@ -35,3 +45,50 @@ def test_readonly_memory(memory: BaseMemory) -> None:
     assert read_only_memory.load_memory_variables({}) == memory.load_memory_variables(
         {},
     )
+
+
+def _count_tokens(messages: list[BaseMessage]) -> int:
+    # Like OpenAI models, count a fixed number of tokens to prime the reply.
+    return 3 + sum(len(get_buffer_string([m]).split()) for m in messages)
+
+
+class PrimingFakeLLM(FakeLLM):
+    counted_messages: int = 0
+
+    @override
+    def get_num_tokens_from_messages(
+        self,
+        messages: list[BaseMessage],
+        tools: Sequence[Any] | None = None,
+    ) -> int:
+        self.counted_messages += len(messages)
+        return _count_tokens(messages)
+
+
+@pytest.mark.parametrize(
+    "memory_cls", [ConversationTokenBufferMemory, ConversationSummaryBufferMemory]
+)
+def test_token_memory_prunes_with_cached_counts(memory_cls: type) -> None:
+    llm = PrimingFakeLLM(
+        queries=dict.fromkeys(range(30), "summary"), sequential_responses=True
+    )
+    memory = memory_cls(llm=llm, max_token_limit=40)
+    expected: list[BaseMessage] = []
+    for i in range(30):
+        inputs, outputs = {"input": "bar " * (i % 7)}, {"output": f"foo {i}"}
+        memory.save_context(inputs, outputs)
+
+        reference = ConversationBufferMemory()
+        reference.save_context(inputs, outputs)
+        expected.extend(reference.chat_memory.messages)
+        while _count_tokens(expected) > memory.max_token_limit:
+            expected.pop(0)
+        assert memory.chat_memory.messages == expected
+
+    # Every message is counted once, plus the pair used to measure the overhead
+    assert llm.counted_messages == 60 + 3
+
+    memory.clear()
+    memory.save_context({"input": "bar"}, {"output": "foo"})
+    assert len(memory.chat_memory.messages) == 2
+    assert llm.counted_messages == 60 + 3 + 2
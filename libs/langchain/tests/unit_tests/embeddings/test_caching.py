@@ -251,3 +251,69 @@ def test_custom_encoder() -> None:
     cbe.embed_documents([txt])
 
     assert list(cbe.document_embedding_store.yield_keys()) == ["CUSTOM_X"]
+
+
+@pytest.mark.parametrize(
+    ("value_codec", "expected_size"),
+    [("json", 6), ("float32", 13), ("float16", 9)],
+)
+def test_value_codec(value_codec: str, expected_size: int) -> None:
+    store = InMemoryStore()
+    cbe = CacheBackedEmbeddings.from_bytes_store(
+        MockEmbeddings(),
+        store,
+        key_encoder="sha256",
+        value_codec=value_codec,  # type: ignore[arg-type]
+    )
+    assert cbe.embed_documents(["hello"]) == [[5.0, 6.0]]
+    (key,) = store.yield_keys()
+    (value,) = store.mget([key])
+    assert value is not None
+    assert len(value) == expected_size
+    # Served from the cache.
+    assert cbe.embed_documents(["hello"]) == [[5.0, 6.0]]
+
+
+def test_binary_value_codec_reads_json_entries() -> None:
+    store = InMemoryStore()
+    json_cbe = CacheBackedEmbeddings.from_bytes_store(
+        MockEmbeddings(), store, key_encoder="sha256"
+    )
+    json_cbe.embed_documents(["hello"])
+    binary_cbe = CacheBackedEmbeddings.from_bytes_store(
+        MockEmbeddings(), store, key_encoder="sha256", value_codec="float32"
+    )
+    assert binary_cbe.document_embedding_store.mget(["hello"]) == [[5.0, 6.0]]
+    binary_cbe.embed_documents(["world"])
+    assert json_cbe.document_embedding_store.mget(["hello", "world"]) == [
+        [5.0, 6.0],
+        [5.0, 6.0],
+    ]
+
+
+def test_unsupported_value_codec() -> None:
+    with pytest.raises(ValueError, match="Unsupported value codec"):
+        CacheBackedEmbeddings.from_bytes_store(
+            MockEmbeddings(),
+            InMemoryStore(),
+            key_encoder="sha256",
+            value_codec="float64",  # type: ignore[arg-type]
+        )
+
+
+def test_embed_documents_repeated_texts(
+    cache_embeddings: CacheBackedEmbeddings,
+) -> None:
+    embedded: list[str] = []
+    underlying = cache_embeddings.underlying_embeddings
+    original = underlying.embed_documents
+
+    def embed_documents(texts: list[str]) -> list[list[float]]:
+        embedded.extend(texts)
+        return original(texts)
+
+    underlying.embed_documents = embed_documents  # type: ignore[method-assign]
+    vectors = cache_embeddings.embed_documents(["a", "bb", "a"])
+    assert vectors == [[1.0, 2.0], [2.0, 3.0], [1.0, 2.0]]
+    assert vectors[0] is not vectors[2]
+    assert embedded == ["a", "bb"]
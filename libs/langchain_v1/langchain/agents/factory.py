@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import itertools
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import (
     TYPE_CHECKING,
     Annotated,
@@ -398,6 +401,73 @@ def _supports_provider_strategy(model: str | BaseChatModel, tools: list | None =
     )
 
 
+@dataclass(frozen=True)
+class _BoundModel:
+    """A model bound for one combination of model request settings."""
+
+    model: BaseChatModel
+    tools: tuple[BaseTool | dict, ...]
+    response_format: ResponseFormat | None
+    tool_choice: Any
+    model_settings: dict[str, Any]
+    bound_model: Runnable
+    effective_response_format: ResponseFormat | None
+
+
+class _BoundModelCache:
+    """Reuse the model bound for a model request across agent turns.
+
+    Binding tools formats the schema of every tool, so the bound model is memoized
+    per model, tools and response format (compared by identity) plus tool choice and
+    model settings (compared by equality). Middleware that changes the tool list,
+    such as `LLMToolSelectorMiddleware`, gets its own entry. The least recently used
+    entries are evicted once `maxsize` is reached.
+    """
+
+    def __init__(self, maxsize: int = 32) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[int, ...], _BoundModel] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        request: ModelRequest,
+        bind: Callable[[ModelRequest], tuple[Runnable, ResponseFormat | None]],
+    ) -> tuple[Runnable, ResponseFormat | None]:
+        """Return the bound model for `request`, calling `bind` on a cache miss."""
+        # Entries hold on to the objects whose ids make up the key, so an id cannot
+        # be reused by another object while its entry is cached.
+        key = (
+            id(request.model),
+            id(request.response_format),
+            *(id(tool) for tool in request.tools),
+        )
+        with self._lock:
+            entry = self._entries.get(key)
+            if (
+                entry is not None
+                and entry.tool_choice == request.tool_choice
+                and entry.model_settings == request.model_settings
+            ):
+                self._entries.move_to_end(key)
+                return entry.bound_model, entry.effective_response_format
+        bound_model, effective_response_format = bind(request)
+        with self._lock:
+            self._entries[key] = _BoundModel(
+                model=request.model,
+                tools=tuple(request.tools),
+                response_format=request.response_format,
+                tool_choice=request.tool_choice,
+                model_settings=dict(request.model_settings),
+                bound_model=bound_model,
+                effective_response_format=effective_response_format,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return bound_model, effective_response_format
+
+
 def _handle_structured_output_error(
     exception: Exception,
     response_format: ResponseFormat,
@@ -973,7 +1043,13 @@ def create_agent(
 
         return {"messages": [output]}
 
+    bound_models = _BoundModelCache()
+
     def _get_bound_model(request: ModelRequest) -> tuple[Runnable, ResponseFormat | None]:
+        """Get the model with appropriate tool bindings, reusing earlier bindings."""
+        return bound_models.get(request, _bind_model)
+
+    def _bind_model(request: ModelRequest) -> tuple[Runnable, ResponseFormat | None]:
         """Get the model with appropriate tool bindings.
 
         Performs auto-detection of strategy if needed based on model capabilities.
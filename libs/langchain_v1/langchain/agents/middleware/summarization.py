@@ -1,5 +1,6 @@
 """Summarization middleware."""
 
+import bisect
 import uuid
 import warnings
 from collections.abc import Callable, Iterable, Mapping
@@ -13,7 +14,11 @@ from langchain_core.messages import (
     ToolMessage,
 )
 from langchain_core.messages.human import HumanMessage
-from langchain_core.messages.utils import count_tokens_approximately, trim_messages
+from langchain_core.messages.utils import (
+    CachedTokenCounter,
+    count_tokens_approximately,
+    trim_messages,
+)
 from langgraph.graph.message import (
     REMOVE_ALL_MESSAGES,
 )
@@ -244,7 +249,10 @@ class SummarizationMiddleware(AgentMiddleware):
 
         self.keep = self._validate_context_size(keep, "keep")
         if token_counter is count_tokens_approximately:
-            self.token_counter = _get_approximate_token_counter(self.model)
+            # Messages keep their IDs across turns, so each turn only counts new ones
+            self.token_counter: TokenCounter = CachedTokenCounter(
+                _get_approximate_token_counter(self.model)
+            )
         else:
             self.token_counter = token_counter
         self.summary_prompt = summary_prompt
@@ -371,27 +379,36 @@ class SummarizationMiddleware(AgentMiddleware):
         if target_token_count <= 0:
             target_token_count = 1
 
-        if self.token_counter(messages) <= target_token_count:
-            return 0
+        if isinstance(self.token_counter, CachedTokenCounter):
+            totals = self.token_counter.prefix_totals(messages)
+            if totals[-1] <= target_token_count:
+                return 0
+
+            # The suffix messages[mid:] is within the token budget when
+            # totals[mid] >= totals[-1] - target_token_count, find the earliest one.
+            cutoff_candidate = bisect.bisect_left(totals, totals[-1] - target_token_count)
+        else:
+            if self.token_counter(messages) <= target_token_count:
+                return 0
 
-        # Use binary search to identify the earliest message index that keeps the
-        # suffix within the token budget.
-        left, right = 0, len(messages)
-        cutoff_candidate = len(messages)
-        max_iterations = len(messages).bit_length() + 1
-        for _ in range(max_iterations):
-            if left >= right:
-                break
-
-            mid = (left + right) // 2
-            if self.token_counter(messages[mid:]) <= target_token_count:
-                cutoff_candidate = mid
-                right = mid
-            else:
-                left = mid + 1
-
-        if cutoff_candidate == len(messages):
-            cutoff_candidate = left
+            # Use binary search to identify the earliest message index that keeps the
+            # suffix within the token budget.
+            left, right = 0, len(messages)
+            cutoff_candidate = len(messages)
+            max_iterations = len(messages).bit_length() + 1
+            for _ in range(max_iterations):
+                if left >= right:
+                    break
+
+                mid = (left + right) // 2
+                if self.token_counter(messages[mid:]) <= target_token_count:
+                    cutoff_candidate = mid
+                    right = mid
+                else:
+                    left = mid + 1
+
+            if cutoff_candidate == len(messages):
+                cutoff_candidate = left
 
         if cutoff_candidate >= len(messages):
             if len(messages) == 1:
@@ -2,6 +2,15 @@
 
 from langchain_core.language_models import BaseChatModel
 
-from langchain.chat_models.base import init_chat_model
+from langchain.chat_models.base import (
+    clear_chat_model_cache,
+    configure_chat_model_cache,
+    init_chat_model,
+)
 
-__all__ = ["BaseChatModel", "init_chat_model"]
+__all__ = [
+    "BaseChatModel",
+    "clear_chat_model_cache",
+    "configure_chat_model_cache",
+    "init_chat_model",
+]
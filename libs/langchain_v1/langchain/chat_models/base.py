@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import threading
+import time
 import warnings
+from collections import OrderedDict
 from importlib import util
 from typing import TYPE_CHECKING, Any, Literal, TypeAlias, cast, overload
 
@@ -12,7 +15,7 @@ from langchain_core.runnables import Runnable, RunnableConfig, ensure_config
 from typing_extensions import override
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+    from collections.abc import AsyncIterator, Callable, Hashable, Iterator, Sequence
 
     from langchain_core.runnables.schema import StreamEvent
     from langchain_core.tools import BaseTool
@@ -544,6 +547,108 @@ def _remove_prefix(s: str, prefix: str) -> str:
 _DECLARATIVE_METHODS = ("bind_tools", "with_structured_output")
 
 
+class _ModelCache:
+    """Bounded LRU cache of the models built by `_ConfigurableModel`.
+
+    Building a model re-validates its parameters and creates new HTTP clients, so
+    configurable models reuse the model built for the same parameters and declarative
+    operations instead.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float | None = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # key -> (model, expiry time, objects keyed by identity)
+        self._entries: OrderedDict[Hashable, tuple[Runnable, float | None, list[Any]]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Runnable | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            model, expires_at, _ = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return model
+
+    def put(self, key: Hashable, model: Runnable, refs: list[Any]) -> None:
+        if self.maxsize <= 0:
+            return
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (model, expires_at, refs)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_MODEL_CACHE = _ModelCache()
+
+
+def configure_chat_model_cache(*, maxsize: int = 128, ttl: float | None = None) -> None:
+    """Configure the cache of models built by configurable chat models.
+
+    A configurable chat model (see `init_chat_model`) builds the underlying model
+    from the runtime config on each call. Built models are cached, keyed by their
+    resolved parameters and queued declarative operations (`bind_tools`,
+    `with_structured_output`, ...), so that later calls reuse the model and its HTTP
+    clients. Arguments without value equality, such as `BaseTool` instances, are
+    matched by identity.
+
+    Calling this clears the cache.
+
+    Args:
+        maxsize: The maximum number of models to keep. `0` disables the cache.
+        ttl: The number of seconds after which a model is rebuilt. If `None`, models
+            are kept until evicted or cleared.
+    """
+    global _MODEL_CACHE  # noqa: PLW0603
+    _MODEL_CACHE.clear()
+    _MODEL_CACHE = _ModelCache(maxsize=maxsize, ttl=ttl)
+
+
+def clear_chat_model_cache() -> None:
+    """Drop every model cached by configurable chat models.
+
+    Use this after changing something a cached model captured when it was built,
+    such as credentials read from the environment.
+    """
+    _MODEL_CACHE.clear()
+
+
+def _freeze(value: Any, refs: list[Any]) -> Hashable:
+    """Turn `value` into a hashable cache key component.
+
+    Containers are compared by value. Other objects are compared by value if they are
+    hashable and by identity otherwise; those are appended to `refs` so that they
+    outlive the cache entry and their `id` cannot be reused.
+    """
+    if isinstance(value, dict):
+        return (dict, frozenset((k, _freeze(v, refs)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v, refs) for v in value))
+    if isinstance(value, (set, frozenset)):
+        return (frozenset, frozenset(_freeze(v, refs) for v in value))
+    try:
+        hash(value)
+    except TypeError:
+        refs.append(value)
+        return (object, id(value))
+    return (type(value), value)
+
+
 class _ConfigurableModel(Runnable[LanguageModelInput, Any]):
     def __init__(
         self,
@@ -598,9 +703,16 @@ class _ConfigurableModel(Runnable[LanguageModelInput, Any]):
 
     def _model(self, config: RunnableConfig | None = None) -> Runnable:
         params = {**self._default_config, **self._model_params(config)}
+        cache = _MODEL_CACHE
+        refs: list[Any] = []
+        key = _freeze((params, self._queued_declarative_operations), refs)
+        model = cache.get(key)
+        if model is not None:
+            return model
         model = _init_chat_model_helper(**params)
         for name, args, kwargs in self._queued_declarative_operations:
             model = getattr(model, name)(*args, **kwargs)
+        cache.put(key, model, refs)
         return model
 
     def _model_params(self, config: RunnableConfig | None) -> dict:
@@ -0,0 +1,56 @@
+from collections.abc import Callable, Sequence
+from itertools import cycle
+from typing import Any
+
+import pytest
+from langchain_core.language_models import GenericFakeChatModel, LanguageModelInput
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import Runnable
+from langchain_core.tools import BaseTool, tool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from pytest_benchmark.fixture import BenchmarkFixture
+from typing_extensions import override
+
+from langchain.agents import create_agent
+
+
+class ToolCallingFakeChatModel(GenericFakeChatModel):
+    @override
+    def bind_tools(
+        self,
+        tools: Sequence[dict[str, Any] | type | Callable | BaseTool],
+        *,
+        tool_choice: str | None = None,
+        **kwargs: Any,
+    ) -> Runnable[LanguageModelInput, AIMessage]:
+        formatted_tools = [convert_to_openai_tool(tool) for tool in tools]
+        return self.bind(tools=formatted_tools, tool_choice=tool_choice, **kwargs)
+
+
+def _make_tool(i: int) -> BaseTool:
+    @tool(f"tool_{i}")
+    def lookup(query: str, limit: int = 10) -> str:
+        """Look something up.
+
+        Args:
+            query: What to look up.
+            limit: The maximum number of results.
+        """
+        return query[:limit]
+
+    return lookup
+
+
+@pytest.mark.benchmark
+def test_create_agent_model_turns(benchmark: BenchmarkFixture) -> None:
+    tool_call = {"name": "tool_0", "args": {"query": "foo"}, "id": "call_0"}
+    # Every run makes ten model calls: nine tool calls and a final answer.
+    messages = cycle([*[AIMessage("", tool_calls=[tool_call])] * 9, AIMessage("done")])
+    agent = create_agent(
+        ToolCallingFakeChatModel(messages=messages),
+        tools=[_make_tool(i) for i in range(30)],
+    )
+
+    @benchmark  # type: ignore[misc]
+    def run_agent() -> None:
+        agent.invoke({"messages": [HumanMessage("hi")]})
@@ -4,6 +4,7 @@ import pytest
 from langchain_core.language_models import ModelProfile
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import AIMessage, AnyMessage, HumanMessage, RemoveMessage, ToolMessage
+from langchain_core.messages.utils import CachedTokenCounter, count_tokens_approximately
 from langchain_core.outputs import ChatGeneration, ChatResult
 from langgraph.graph.message import REMOVE_ALL_MESSAGES
 
@@ -660,6 +661,24 @@ def test_summarization_middleware_binary_search_edge_cases() -> None:
     assert cutoff == 0
 
 
+@pytest.mark.parametrize("keep_tokens", [1, 40, 100, 250, 1000])
+def test_summarization_middleware_cached_token_cutoff(keep_tokens: int) -> None:
+    """Test the cached default token counter finds the same cutoff as recounting."""
+    middleware = SummarizationMiddleware(
+        model=MockChatModel(), trigger=("messages", 5), keep=("tokens", keep_tokens)
+    )
+    assert isinstance(middleware.token_counter, CachedTokenCounter)
+
+    messages: list[AnyMessage] = [
+        HumanMessage(content="x" * (i * 37 % 100), id=str(i)) for i in range(20)
+    ]
+    cutoff = middleware._find_token_based_cutoff(messages)
+    assert middleware.token_counter(messages) == count_tokens_approximately(messages)
+
+    middleware.token_counter = count_tokens_approximately
+    assert middleware._find_token_based_cutoff(messages) == cutoff
+
+
 def test_summarization_middleware_find_safe_cutoff_point() -> None:
     """Test _find_safe_cutoff_point finds safe cutoff past ToolMessages."""
     model = FakeToolCallingModel()
@@ -0,0 +1,81 @@
+"""Test that create_agent reuses the bound model across agent turns."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import BaseMessage, HumanMessage
+from langchain_core.runnables import Runnable
+from langchain_core.tools import BaseTool, tool
+from pydantic import BaseModel
+
+from langchain.agents import create_agent
+from langchain.agents.middleware import wrap_model_call
+
+from .model import FakeToolCallingModel
+
+
+@tool
+def tool_a(x: int) -> str:
+    """Tool A."""
+    return f"A: {x}"
+
+
+@tool
+def tool_b(x: int) -> str:
+    """Tool B."""
+    return f"B: {x}"
+
+
+class CountingModel(FakeToolCallingModel):
+    bind_tools_calls: int = 0
+
+    def bind_tools(
+        self,
+        tools: Sequence[dict[str, Any] | type[BaseModel] | Callable | BaseTool],
+        **kwargs: Any,
+    ) -> Runnable[LanguageModelInput, BaseMessage]:
+        self.bind_tools_calls += 1
+        return super().bind_tools(tools, **kwargs)
+
+
+TOOL_CALLS = [
+    [{"args": {"x": 1}, "id": "1", "name": "tool_a"}],
+    [{"args": {"x": 2}, "id": "2", "name": "tool_b"}],
+    [],
+]
+
+
+def test_bound_model_is_reused_across_turns() -> None:
+    model = CountingModel(tool_calls=TOOL_CALLS)
+    agent = create_agent(model=model, tools=[tool_a, tool_b])
+
+    result = agent.invoke({"messages": [HumanMessage("Hello")]})
+    assert len(result["messages"]) == 6
+    assert model.bind_tools_calls == 1
+
+    model.index = 0
+    agent.invoke({"messages": [HumanMessage("Hello again")]})
+    assert model.bind_tools_calls == 1
+
+
+def test_bound_model_is_rebound_when_tools_change() -> None:
+    model = CountingModel(tool_calls=TOOL_CALLS)
+    turns = 0
+
+    @wrap_model_call
+    def alternate_tools(request, handler):
+        nonlocal turns
+        turns += 1
+        if turns % 2:
+            return handler(request)
+        tools = [t for t in request.tools if t.name != "tool_a"]
+        return handler(request.override(tools=tools))
+
+    agent = create_agent(model=model, tools=[tool_a, tool_b], middleware=[alternate_tools])
+    agent.invoke({"messages": [HumanMessage("Hello")]})
+    assert turns == 3
+    # Each tool list is bound once, the third turn reuses the first binding.
+    assert model.bind_tools_calls == 2
@@ -1,13 +1,22 @@
 import os
-from typing import TYPE_CHECKING
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any
 from unittest import mock
 
 import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnableConfig, RunnableSequence
+from langchain_core.tools import tool
 from pydantic import SecretStr
 
-from langchain.chat_models import __all__, init_chat_model
+from langchain.chat_models import (
+    __all__,
+    clear_chat_model_cache,
+    configure_chat_model_cache,
+    init_chat_model,
+)
+from langchain.chat_models import base as chat_models_base
 
 if TYPE_CHECKING:
     from langchain_core.language_models import BaseChatModel
@@ -15,9 +24,18 @@ if TYPE_CHECKING:
 EXPECTED_ALL = [
     "init_chat_model",
     "BaseChatModel",
+    "clear_chat_model_cache",
+    "configure_chat_model_cache",
 ]
 
 
+@pytest.fixture(autouse=True)
+def _clear_model_cache() -> Iterator[None]:
+    clear_chat_model_cache()
+    yield
+    configure_chat_model_cache()
+
+
 def test_all_imports() -> None:
     """Test that all expected imports are present in the module's __all__."""
     assert set(__all__) == set(EXPECTED_ALL)
@@ -285,3 +303,71 @@ def test_configurable_with_default() -> None:
     prompt = ChatPromptTemplate.from_messages([("system", "foo")])
     chain = prompt | model_with_config
     assert isinstance(chain, RunnableSequence)
+
+
+class _FakeToolModel(GenericFakeChatModel):
+    def bind_tools(self, tools: Any, **kwargs: Any) -> Any:
+        return self.bind(tools=tools, **kwargs)
+
+
+@pytest.fixture
+def fake_init() -> Iterator[mock.MagicMock]:
+    def build(**params: Any) -> _FakeToolModel:
+        return _FakeToolModel(messages=iter(["hello"] * 10), name=params.get("model"))
+
+    with mock.patch.object(chat_models_base, "_init_chat_model_helper", side_effect=build) as init:
+        yield init
+
+
+def test_configurable_model_is_cached(fake_init: mock.MagicMock) -> None:
+    model = init_chat_model(configurable_fields=("model",))
+    config: RunnableConfig = {"configurable": {"model": "a"}}
+    assert model.invoke("hi", config=config).content == "hello"
+    assert model.invoke("hi", config=config).content == "hello"
+    assert fake_init.call_count == 1
+
+    # Different params build a different model.
+    model.invoke("hi", config={"configurable": {"model": "b"}})
+    assert fake_init.call_count == 2
+
+    # Equal declarative operations share the cached model, even across instances.
+    tools = [{"name": "foo", "description": "foo", "parameters": {}}]
+    first = model.bind_tools(tools)._model(config)  # type: ignore[attr-defined]
+    second = model.bind_tools([dict(tools[0])])._model(config)  # type: ignore[attr-defined]
+    assert first is second
+    assert fake_init.call_count == 3
+
+    clear_chat_model_cache()
+    model.invoke("hi", config=config)
+    assert fake_init.call_count == 4
+
+
+def test_configurable_model_cache_unhashable_args(fake_init: mock.MagicMock) -> None:
+    @tool
+    def foo(x: int) -> int:
+        """Foo."""
+        return x
+
+    @tool
+    def bar(x: int) -> int:
+        """Foo."""
+        return x
+
+    model = init_chat_model("a", configurable_fields=("model",))
+    assert model.bind_tools([foo])._model() is model.bind_tools([foo])._model()  # type: ignore[attr-defined]
+    assert model.bind_tools([foo])._model() is not model.bind_tools([bar])._model()  # type: ignore[attr-defined]
+    assert fake_init.call_count == 2
+
+
+def test_configurable_model_cache_bounds(fake_init: mock.MagicMock) -> None:
+    configure_chat_model_cache(maxsize=2)
+    model = init_chat_model(configurable_fields=("model",))
+    for name in ("a", "b", "c", "a"):
+        model._model({"configurable": {"model": name}})
+    assert fake_init.call_count == 4
+    assert len(chat_models_base._MODEL_CACHE) == 2
+
+    configure_chat_model_cache(ttl=0)
+    model._model({"configurable": {"model": "a"}})
+    model._model({"configurable": {"model": "a"}})
+    assert fake_init.call_count == 6
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 import warnings
 from collections.abc import Awaitable, Callable, Iterable, Mapping, Sequence
 from typing import Any, Literal, cast
@@ -83,6 +85,79 @@ def _process_batched_chunked_embeddings(
     return embeddings
 
 
+def _token_limited_batches(
+    token_counts: list[int], chunk_size: int
+) -> list[tuple[int, int]]:
+    """Split chunks into `(start, end)` batches for the embeddings API.
+
+    Each batch holds at most `chunk_size` chunks and `MAX_TOKENS_PER_REQUEST`
+    tokens, except for a single chunk that exceeds the limit on its own.
+    """
+    batches = []
+    i = 0
+    while i < len(token_counts):
+        # Determine how many chunks we can include in this batch
+        batch_token_count = 0
+        batch_end = i
+
+        for j in range(i, min(i + chunk_size, len(token_counts))):
+            chunk_tokens = token_counts[j]
+            # Check if adding this chunk would exceed the limit
+            if batch_token_count + chunk_tokens > MAX_TOKENS_PER_REQUEST:
+                if batch_end == i:
+                    # Single chunk exceeds limit - handle it anyway
+                    batch_end = j + 1
+                break
+            batch_token_count += chunk_tokens
+            batch_end = j + 1
+
+        batches.append((i, batch_end))
+        i = batch_end
+    return batches
+
+
+class _SharedBackoff:
+    """Rate limit backoff shared by the concurrent requests of one async call.
+
+    Once a request is rate limited, no request of the call is sent until the
+    backoff delay has passed. The delay doubles with each consecutive rate limit
+    error, from `min_seconds` up to `max_seconds`, unless the API sends a
+    `retry-after` header.
+    """
+
+    def __init__(self, min_seconds: float, max_seconds: float) -> None:
+        self.min_seconds = min_seconds
+        self.max_seconds = max_seconds
+        self._resume_at = 0.0
+        self._failures = 0
+
+    async def wait(self) -> None:
+        """Sleep until requests may be sent again."""
+        delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def rate_limited(self, error: openai.RateLimitError) -> None:
+        """Pause all requests after a rate limit error."""
+        self._failures += 1
+        delay = _retry_after(error)
+        if delay is None:
+            delay = min(self.max_seconds, self.min_seconds * 2 ** (self._failures - 1))
+        logger.warning("Embedding requests were rate limited, retrying in %ss", delay)
+        self._resume_at = max(self._resume_at, time.monotonic() + delay)
+
+    def succeeded(self) -> None:
+        """Reset the delay after a successful request."""
+        self._failures = 0
+
+
+def _retry_after(error: openai.RateLimitError) -> float | None:
+    try:
+        return float(error.response.headers["retry-after"])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
 class OpenAIEmbeddings(BaseModel, Embeddings):
     """OpenAI embedding model integration.
 
@@ -229,6 +304,22 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
     max_retries: int = 2
     """Maximum number of retries to make when generating."""
 
+    max_concurrent_requests: int = Field(default=1, ge=1)
+    """Maximum number of embedding requests in flight at once in async calls.
+
+    Texts are still sent in batches of `chunk_size` and embeddings are returned in
+    input order.
+    """
+
+    max_rate_limit_retries: int = Field(default=0, ge=0)
+    """Maximum number of retries of a rate limited request in async calls.
+
+    These come on top of the `max_retries` retries made by the client itself, so
+    they are disabled by default. Once a request is rate limited, all requests of
+    the call back off together for `retry_min_seconds` to `retry_max_seconds`, or
+    as long as the API's `retry-after` header asks.
+    """
+
     request_timeout: float | tuple[float, float] | Any | None = Field(
         default=None, alias="timeout"
     )
@@ -554,32 +645,12 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
         batched_embeddings: list[list[float]] = []
 
         # Process in batches respecting the token limit
-        i = 0
-        while i < len(tokens):
-            # Determine how many chunks we can include in this batch
-            batch_token_count = 0
-            batch_end = i
-
-            for j in range(i, min(i + _chunk_size, len(tokens))):
-                chunk_tokens = token_counts[j]
-                # Check if adding this chunk would exceed the limit
-                if batch_token_count + chunk_tokens > MAX_TOKENS_PER_REQUEST:
-                    if batch_end == i:
-                        # Single chunk exceeds limit - handle it anyway
-                        batch_end = j + 1
-                    break
-                batch_token_count += chunk_tokens
-                batch_end = j + 1
-
-            # Make API call with this batch
-            batch_tokens = tokens[i:batch_end]
-            response = self.client.create(input=batch_tokens, **client_kwargs)
+        for start, end in _token_limited_batches(token_counts, _chunk_size):
+            response = self.client.create(input=tokens[start:end], **client_kwargs)
             if not isinstance(response, dict):
                 response = response.model_dump()
             batched_embeddings.extend(r["embedding"] for r in response["data"])
 
-            i = batch_end
-
         embeddings = _process_batched_chunked_embeddings(
             len(texts), tokens, batched_embeddings, indices, self.skip_empty
         )
@@ -625,36 +696,14 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
         _iter, tokens, indices, token_counts = await run_in_executor(
             None, self._tokenize, texts, _chunk_size
         )
-        batched_embeddings: list[list[float]] = []
-
         # Process in batches respecting the token limit
-        i = 0
-        while i < len(tokens):
-            # Determine how many chunks we can include in this batch
-            batch_token_count = 0
-            batch_end = i
-
-            for j in range(i, min(i + _chunk_size, len(tokens))):
-                chunk_tokens = token_counts[j]
-                # Check if adding this chunk would exceed the limit
-                if batch_token_count + chunk_tokens > MAX_TOKENS_PER_REQUEST:
-                    if batch_end == i:
-                        # Single chunk exceeds limit - handle it anyway
-                        batch_end = j + 1
-                    break
-                batch_token_count += chunk_tokens
-                batch_end = j + 1
-
-            # Make API call with this batch
-            batch_tokens = tokens[i:batch_end]
-            response = await self.async_client.create(
-                input=batch_tokens, **client_kwargs
-            )
-            if not isinstance(response, dict):
-                response = response.model_dump()
-            batched_embeddings.extend(r["embedding"] for r in response["data"])
-
-            i = batch_end
+        batched_embeddings = await self._aembed_batches(
+            [
+                tokens[start:end]
+                for start, end in _token_limited_batches(token_counts, _chunk_size)
+            ],
+            client_kwargs,
+        )
 
         embeddings = _process_batched_chunked_embeddings(
             len(texts), tokens, batched_embeddings, indices, self.skip_empty
@@ -674,6 +723,49 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
 
         return [e if e is not None else await empty_embedding() for e in embeddings]
 
+    async def _aembed_batches(
+        self, batches: Sequence[Sequence[str | list[int]]], client_kwargs: dict
+    ) -> list[list[float]]:
+        """Embed batches concurrently, up to `max_concurrent_requests` at a time.
+
+        Args:
+            batches: The inputs of each embeddings request.
+            client_kwargs: Keyword arguments for the embeddings client.
+
+        Returns:
+            The embeddings of all batches, in order.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        backoff = _SharedBackoff(self.retry_min_seconds, self.retry_max_seconds)
+
+        async def embed_batch(batch: Sequence[str | list[int]]) -> list[list[float]]:
+            async with semaphore:
+                for attempt in range(self.max_rate_limit_retries + 1):
+                    await backoff.wait()
+                    try:
+                        response = await self.async_client.create(
+                            input=batch, **client_kwargs
+                        )
+                    except openai.RateLimitError as e:
+                        if attempt == self.max_rate_limit_retries:
+                            raise
+                        backoff.rate_limited(e)
+                    else:
+                        backoff.succeeded()
+                        break
+            if not isinstance(response, dict):
+                response = response.model_dump()
+            return [r["embedding"] for r in response["data"]]
+
+        tasks = [asyncio.ensure_future(embed_batch(batch)) for batch in batches]
+        try:
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return [embedding for result in results for embedding in result]
+
     def embed_documents(
         self, texts: list[str], chunk_size: int | None = None, **kwargs: Any
     ) -> list[list[float]]:
@@ -728,15 +820,10 @@ class OpenAIEmbeddings(BaseModel, Embeddings):
         chunk_size_ = chunk_size or self.chunk_size
         client_kwargs = {**self._invocation_params, **kwargs}
         if not self.check_embedding_ctx_length:
-            embeddings: list[list[float]] = []
-            for i in range(0, len(texts), chunk_size_):
-                response = await self.async_client.create(
-                    input=texts[i : i + chunk_size_], **client_kwargs
-                )
-                if not isinstance(response, dict):
-                    response = response.model_dump()
-                embeddings.extend(r["embedding"] for r in response["data"])
-            return embeddings
+            return await self._aembed_batches(
+                [texts[i : i + chunk_size_] for i in range(0, len(texts), chunk_size_)],
+                client_kwargs,
+            )
 
         # Unconditionally call _get_len_safe_embeddings to handle length safety.
         # This could be optimized to avoid double work when all texts are short enough.
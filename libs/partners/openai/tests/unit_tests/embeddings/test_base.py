@@ -1,7 +1,10 @@
+import asyncio
 import os
 from typing import Any
 from unittest.mock import Mock, patch
 
+import httpx
+import openai
 import pytest
 from pydantic import SecretStr
 
@@ -100,6 +103,73 @@ async def test_embed_with_kwargs_async() -> None:
     assert result == [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
 
 
+async def test_aembed_documents_concurrent_batches() -> None:
+    embeddings = OpenAIEmbeddings(
+        model="text-embedding-3-small",
+        api_key=SecretStr("test-key"),
+        check_embedding_ctx_length=False,
+        chunk_size=2,
+        max_concurrent_requests=3,
+        max_rate_limit_retries=1,
+    )
+    in_flight = 0
+    max_in_flight = 0
+    calls: list[list[str]] = []
+
+    async def mock_create(*, input: list[str], **kwargs: Any) -> dict:  # noqa: A002
+        nonlocal in_flight, max_in_flight
+        calls.append(input)
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            if input == ["4", "5"] and calls.count(input) == 1:
+                request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+                response = httpx.Response(
+                    429, request=request, headers={"retry-after": "0"}
+                )
+                msg = "Rate limited"
+                raise openai.RateLimitError(msg, response=response, body=None)
+            # Later batches finish first.
+            await asyncio.sleep(0.01 * (10 - int(input[0])))
+        finally:
+            in_flight -= 1
+        return {"data": [{"embedding": [float(text)]} for text in input]}
+
+    embeddings.async_client.create = mock_create
+
+    texts = [str(i) for i in range(10)]
+    result = await embeddings.aembed_documents(texts)
+
+    assert result == [[float(i)] for i in range(10)]
+    assert max_in_flight == 3
+    # The rate limited batch was retried once.
+    assert len(calls) == 6
+
+
+async def test_aembed_documents_no_rate_limit_retries_by_default() -> None:
+    embeddings = OpenAIEmbeddings(
+        model="text-embedding-3-small",
+        api_key=SecretStr("test-key"),
+        check_embedding_ctx_length=False,
+    )
+    calls = 0
+
+    async def mock_create(*, input: list[str], **kwargs: Any) -> dict:  # noqa: A002
+        nonlocal calls
+        calls += 1
+        request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+        response = httpx.Response(429, request=request)
+        msg = "Rate limited"
+        raise openai.RateLimitError(msg, response=response, body=None)
+
+    embeddings.async_client.create = mock_create
+
+    with pytest.raises(openai.RateLimitError):
+        await embeddings.aembed_documents(["1", "2"])
+    # Rate limit retries are left to the client.
+    assert calls == 1
+
+
 def test_embeddings_respects_token_limit() -> None:
     """Test that embeddings respect the 300k token per request limit."""
     # Create embeddings instance
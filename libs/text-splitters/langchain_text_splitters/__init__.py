@@ -34,6 +34,7 @@ from langchain_text_splitters.markdown import (
     MarkdownTextSplitter,
 )
 from langchain_text_splitters.nltk import NLTKTextSplitter
+from langchain_text_splitters.parallel import ParallelSplitter
 from langchain_text_splitters.python import PythonCodeTextSplitter
 from langchain_text_splitters.sentence_transformers import (
     SentenceTransformersTokenTextSplitter,
@@ -56,6 +57,7 @@ __all__ = [
     "MarkdownHeaderTextSplitter",
     "MarkdownTextSplitter",
     "NLTKTextSplitter",
+    "ParallelSplitter",
     "PythonCodeTextSplitter",
     "RecursiveCharacterTextSplitter",
     "RecursiveJsonSplitter",
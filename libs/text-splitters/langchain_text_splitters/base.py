@@ -5,6 +5,8 @@ from __future__ import annotations
 import copy
 import logging
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import AsyncIterable
 from dataclasses import dataclass
 from enum import Enum
 from typing import (
@@ -15,10 +17,18 @@ from typing import (
 )
 
 from langchain_core.documents import BaseDocumentTransformer, Document
+from langchain_core.runnables.config import run_in_executor
 from typing_extensions import Self, override
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Collection, Iterable, Sequence
+    from collections.abc import (
+        AsyncIterator,
+        Callable,
+        Collection,
+        Iterable,
+        Iterator,
+        Sequence,
+    )
     from collections.abc import Set as AbstractSet
 
 
@@ -40,6 +50,27 @@ logger = logging.getLogger(__name__)
 
 TS = TypeVar("TS", bound="TextSplitter")
 
+_ATOMIC_TYPES = (str, int, float, bool, bytes, type(None))
+
+
+def _is_flat_metadata(metadata: dict[Any, Any]) -> bool:
+    """Whether `metadata` only holds immutable scalar keys and values."""
+    return all(
+        type(key) in _ATOMIC_TYPES and type(value) in _ATOMIC_TYPES
+        for key, value in metadata.items()
+    )
+
+
+async def _aiter_documents(
+    documents: Iterable[Document] | AsyncIterable[Document],
+) -> AsyncIterator[Document]:
+    if isinstance(documents, AsyncIterable):
+        async for doc in documents:
+            yield doc
+    else:
+        for doc in documents:
+            yield doc
+
 
 class TextSplitter(BaseDocumentTransformer, ABC):
     """Interface for splitting text into chunks."""
@@ -95,19 +126,31 @@ class TextSplitter(BaseDocumentTransformer, ABC):
         metadatas_ = metadatas or [{}] * len(texts)
         documents = []
         for i, text in enumerate(texts):
-            index = 0
-            previous_chunk_len = 0
-            for chunk in self.split_text(text):
-                metadata = copy.deepcopy(metadatas_[i])
-                if self._add_start_index:
-                    offset = index + previous_chunk_len - self._chunk_overlap
-                    index = text.find(chunk, max(0, offset))
+            # Copying a flat dict is equivalent to a deep copy, and much cheaper
+            copy_metadata = dict if _is_flat_metadata(metadatas_[i]) else copy.deepcopy
+            if self._add_start_index:
+                for chunk, index in self._split_text_with_start_index(text):
+                    metadata = copy_metadata(metadatas_[i])
                     metadata["start_index"] = index
-                    previous_chunk_len = len(chunk)
-                new_doc = Document(page_content=chunk, metadata=metadata)
-                documents.append(new_doc)
+                    documents.append(Document(page_content=chunk, metadata=metadata))
+            else:
+                for chunk in self.split_text(text):
+                    metadata = copy_metadata(metadatas_[i])
+                    documents.append(Document(page_content=chunk, metadata=metadata))
         return documents
 
+    def _split_text_with_start_index(self, text: str) -> list[tuple[str, int]]:
+        """Split text into chunks paired with their start index in `text`."""
+        chunks = []
+        index = 0
+        previous_chunk_len = 0
+        for chunk in self.split_text(text):
+            offset = index + previous_chunk_len - self._chunk_overlap
+            index = text.find(chunk, max(0, offset))
+            chunks.append((chunk, index))
+            previous_chunk_len = len(chunk)
+        return chunks
+
     def split_documents(self, documents: Iterable[Document]) -> list[Document]:
         """Split documents."""
         texts, metadatas = [], []
@@ -116,6 +159,42 @@ class TextSplitter(BaseDocumentTransformer, ABC):
             metadatas.append(doc.metadata)
         return self.create_documents(texts, metadatas=metadatas)
 
+    def lazy_split_documents(self, documents: Iterable[Document]) -> Iterator[Document]:
+        """Lazily split documents.
+
+        Documents are consumed one at a time, and only the chunks of the current
+        document are held in memory. The result can be passed straight to
+        `langchain_core.indexing.index`.
+
+        Args:
+            documents: The documents to split, e.g. from a loader's `lazy_load`.
+
+        Yields:
+            The chunks of each document, in order.
+        """
+        for doc in documents:
+            yield from self.create_documents([doc.page_content], [doc.metadata])
+
+    async def alazy_split_documents(
+        self, documents: Iterable[Document] | AsyncIterable[Document]
+    ) -> AsyncIterator[Document]:
+        """Asynchronously and lazily split documents.
+
+        Each document is split in an executor, so the event loop is not blocked.
+
+        Args:
+            documents: The documents to split, e.g. from a loader's `alazy_load`.
+
+        Yields:
+            The chunks of each document, in order.
+        """
+        async for doc in _aiter_documents(documents):
+            chunks = await run_in_executor(
+                None, self.create_documents, [doc.page_content], [doc.metadata]
+            )
+            for chunk in chunks:
+                yield chunk
+
     def _join_docs(self, docs: list[str], separator: str) -> str | None:
         text = separator.join(docs)
         if self._strip_whitespace:
@@ -166,6 +245,65 @@ class TextSplitter(BaseDocumentTransformer, ABC):
             docs.append(doc)
         return docs
 
+    def _merge_spans(
+        self, text: str, splits: Iterable[tuple[int, int, int]]
+    ) -> list[tuple[str, int]]:
+        """Merge contiguous spans of `text` into chunks.
+
+        Equivalent to `_merge_splits` with an empty separator for splits given as
+        `(start, end, length)` offsets into `text`, but returns each chunk together
+        with its start index.
+        """
+        separator_len = self._length_function("")
+
+        chunks = []
+        current_doc: deque[tuple[int, int, int]] = deque()
+        total = 0
+        for split in splits:
+            len_ = split[2]
+            if (
+                total + len_ + (separator_len if len(current_doc) > 0 else 0)
+                > self._chunk_size
+            ):
+                if total > self._chunk_size:
+                    logger.warning(
+                        "Created a chunk of size %d, which is longer than the "
+                        "specified %d",
+                        total,
+                        self._chunk_size,
+                    )
+                if len(current_doc) > 0:
+                    chunk = self._join_span(text, current_doc[0][0], current_doc[-1][1])
+                    if chunk is not None:
+                        chunks.append(chunk)
+                    # Keep on popping if:
+                    # - we have a larger chunk than in the chunk overlap
+                    # - or if we still have any chunks and the length is long
+                    while total > self._chunk_overlap or (
+                        total + len_ + (separator_len if len(current_doc) > 0 else 0)
+                        > self._chunk_size
+                        and total > 0
+                    ):
+                        popped_separator_len = (
+                            separator_len if len(current_doc) > 1 else 0
+                        )
+                        total -= current_doc.popleft()[2] + popped_separator_len
+            current_doc.append(split)
+            total += len_ + (separator_len if len(current_doc) > 1 else 0)
+        if current_doc:
+            chunk = self._join_span(text, current_doc[0][0], current_doc[-1][1])
+            if chunk is not None:
+                chunks.append(chunk)
+        return chunks
+
+    def _join_span(self, text: str, start: int, end: int) -> tuple[str, int] | None:
+        chunk = text[start:end]
+        if self._strip_whitespace:
+            stripped = chunk.lstrip()
+            start += len(chunk) - len(stripped)
+            chunk = stripped.rstrip()
+        return (chunk, start) if chunk else None
+
     @classmethod
     def from_huggingface_tokenizer(
         cls, tokenizer: PreTrainedTokenizerBase, **kwargs: Any
@@ -182,10 +320,7 @@ class TextSplitter(BaseDocumentTransformer, ABC):
             msg = "Tokenizer received was not an instance of PreTrainedTokenizerBase"  # type: ignore[unreachable]
             raise ValueError(msg)  # noqa: TRY004
 
-        def _huggingface_tokenizer_length(text: str) -> int:
-            return len(tokenizer.tokenize(text))
-
-        return cls(length_function=_huggingface_tokenizer_length, **kwargs)
+        return cls(length_function=_HuggingFaceTokenizerLength(tokenizer), **kwargs)
 
     @classmethod
     def from_tiktoken_encoder(
@@ -210,14 +345,7 @@ class TextSplitter(BaseDocumentTransformer, ABC):
         else:
             enc = tiktoken.get_encoding(encoding_name)
 
-        def _tiktoken_encoder(text: str) -> int:
-            return len(
-                enc.encode(
-                    text,
-                    allowed_special=allowed_special,
-                    disallowed_special=disallowed_special,
-                )
-            )
+        _tiktoken_encoder = _TiktokenLength(enc, allowed_special, disallowed_special)
 
         if issubclass(cls, TokenTextSplitter):
             extra_kwargs = {
@@ -238,6 +366,32 @@ class TextSplitter(BaseDocumentTransformer, ABC):
         return self.split_documents(list(documents))
 
 
+# Length functions are classes rather than closures so that splitters using them
+# can be pickled, e.g. to split documents in worker processes.
+@dataclass(frozen=True)
+class _HuggingFaceTokenizerLength:
+    tokenizer: Any
+
+    def __call__(self, text: str) -> int:
+        return len(self.tokenizer.tokenize(text))
+
+
+@dataclass(frozen=True)
+class _TiktokenLength:
+    encoding: Any
+    allowed_special: Literal["all"] | AbstractSet[str]
+    disallowed_special: Literal["all"] | Collection[str]
+
+    def __call__(self, text: str) -> int:
+        return len(
+            self.encoding.encode(
+                text,
+                allowed_special=self.allowed_special,
+                disallowed_special=self.disallowed_special,
+            )
+        )
+
+
 class TokenTextSplitter(TextSplitter):
     """Splitting text to tokens using model tokenizer."""
 
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import itertools
 import re
 from typing import Any, Literal
 
+from typing_extensions import override
+
 from langchain_text_splitters.base import Language, TextSplitter
 
 
@@ -78,6 +81,24 @@ def _split_text_with_regex(
     return [s for s in splits if s]
 
 
+def _split_spans_with_regex(
+    text: str, separator: str, *, keep_separator: bool | Literal["start", "end"]
+) -> list[tuple[int, int]]:
+    """Offsets of the splits `_split_text_with_regex` returns when keeping separators.
+
+    Each separator is kept at the start of the following split, or at the end of the
+    preceding one if `keep_separator` is `'end'`.
+    """
+    if not separator:
+        return [(i, i + 1) for i in range(len(text))]
+    bounds = [
+        match.end() if keep_separator == "end" else match.start()
+        for match in re.finditer(separator, text)
+    ]
+    edges = [0, *bounds, len(text)]
+    return [(start, end) for start, end in itertools.pairwise(edges) if start < end]
+
+
 class RecursiveCharacterTextSplitter(TextSplitter):
     """Splitting text by recursively look at characters.
 
@@ -139,6 +160,70 @@ class RecursiveCharacterTextSplitter(TextSplitter):
             final_chunks.extend(merged_text)
         return final_chunks
 
+    def _split_spans(
+        self, text: str, start: int, end: int, separators: list[str]
+    ) -> list[tuple[str, int]]:
+        """Split `text[start:end]` into chunks paired with their start index.
+
+        Equivalent to `_split_text`, but works on offsets into `text`. Only valid when
+        the separators are kept, so that every chunk is a contiguous span of `text`.
+        """
+        piece = text[start:end] if start or end < len(text) else text
+        final_chunks = []
+        # Get appropriate separator to use
+        separator = separators[-1]
+        new_separators = []
+        for i, _s in enumerate(separators):
+            separator_ = _s if self._is_separator_regex else re.escape(_s)
+            if not _s:
+                separator = _s
+                break
+            if re.search(separator_, piece):
+                separator = _s
+                new_separators = separators[i + 1 :]
+                break
+
+        separator_ = separator if self._is_separator_regex else re.escape(separator)
+        splits = _split_spans_with_regex(
+            piece, separator_, keep_separator=self._keep_separator
+        )
+
+        # Now go merging things, recursively splitting longer texts.
+        good_splits = []
+        for relative_start, relative_end in splits:
+            split_start, split_end = start + relative_start, start + relative_end
+            if self._length_function is len:
+                len_ = split_end - split_start
+            else:
+                len_ = self._length_function(text[split_start:split_end])
+            if len_ < self._chunk_size:
+                good_splits.append((split_start, split_end, len_))
+            else:
+                if good_splits:
+                    final_chunks.extend(self._merge_spans(text, good_splits))
+                    good_splits = []
+                if not new_separators:
+                    final_chunks.append((text[split_start:split_end], split_start))
+                else:
+                    final_chunks.extend(
+                        self._split_spans(text, split_start, split_end, new_separators)
+                    )
+        if good_splits:
+            final_chunks.extend(self._merge_spans(text, good_splits))
+        return final_chunks
+
+    def _splits_contiguous_spans(self) -> bool:
+        """Whether every chunk is a contiguous span of the input text.
+
+        That holds when the separators are kept with the splits, and a regex
+        separator has no groups, which would add extra items to `re.split`.
+        """
+        if not self._keep_separator:
+            return False
+        return not self._is_separator_regex or not any(
+            re.compile(separator).groups for separator in self._separators
+        )
+
     def split_text(self, text: str) -> list[str]:
         """Split the input text into smaller chunks based on predefined separators.
 
@@ -148,8 +233,23 @@ class RecursiveCharacterTextSplitter(TextSplitter):
         Returns:
             A list of text chunks obtained after splitting.
         """
+        if self._splits_contiguous_spans():
+            return [
+                chunk
+                for chunk, _ in self._split_spans(text, 0, len(text), self._separators)
+            ]
         return self._split_text(text, self._separators)
 
+    @override
+    def _split_text_with_start_index(self, text: str) -> list[tuple[str, int]]:
+        # Subclasses may split with other separators in an overridden `split_text`
+        if (
+            type(self).split_text is RecursiveCharacterTextSplitter.split_text
+            and self._splits_contiguous_spans()
+        ):
+            return self._split_spans(text, 0, len(text), self._separators)
+        return super()._split_text_with_start_index(text)
+
     @classmethod
     def from_language(
         cls, language: Language, **kwargs: Any
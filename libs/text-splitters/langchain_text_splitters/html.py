@@ -18,12 +18,21 @@ from typing import (
 import requests
 from langchain_core._api import beta
 from langchain_core.documents import BaseDocumentTransformer, Document
+from langchain_core.runnables.config import run_in_executor
 from typing_extensions import override
 
+from langchain_text_splitters.base import _aiter_documents
 from langchain_text_splitters.character import RecursiveCharacterTextSplitter
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Iterator, Sequence
+    from collections.abc import (
+        AsyncIterable,
+        AsyncIterator,
+        Callable,
+        Iterable,
+        Iterator,
+        Sequence,
+    )
 
     from bs4.element import ResultSet
 
@@ -373,6 +382,31 @@ class HTMLSectionSplitter:
 
         return text_splitter.split_documents(results)
 
+    def lazy_split_documents(self, documents: Iterable[Document]) -> Iterator[Document]:
+        """Lazily split documents.
+
+        Documents are consumed one at a time, and only the chunks of the current
+        document are held in memory.
+        """
+        text_splitter = RecursiveCharacterTextSplitter(**self.kwargs)
+        for doc in documents:
+            yield from text_splitter.split_documents(self._split_sections(doc))
+
+    async def alazy_split_documents(
+        self, documents: Iterable[Document] | AsyncIterable[Document]
+    ) -> AsyncIterator[Document]:
+        """Asynchronously and lazily split documents."""
+        text_splitter = RecursiveCharacterTextSplitter(**self.kwargs)
+        async for doc in _aiter_documents(documents):
+            sections = await run_in_executor(None, self._split_sections, doc)
+            async for chunk in text_splitter.alazy_split_documents(sections):
+                yield chunk
+
+    def _split_sections(self, document: Document) -> list[Document]:
+        return self.create_documents(
+            [document.page_content], metadatas=[document.metadata]
+        )
+
     def split_text(self, text: str) -> list[Document]:
         """Split HTML text string.
 
@@ -698,19 +732,36 @@ class HTMLSemanticPreservingSplitter(BaseDocumentTransformer):
         self, documents: Sequence[Document], **kwargs: Any
     ) -> list[Document]:
         """Transform sequence of documents by splitting them."""
-        transformed = []
+        return list(self.lazy_split_documents(documents))
+
+    def lazy_split_documents(self, documents: Iterable[Document]) -> Iterator[Document]:
+        """Lazily split documents.
+
+        Documents are consumed one at a time, and only the chunks of the current
+        document are held in memory.
+        """
         for doc in documents:
-            splits = self.split_text(doc.page_content)
-            if self._preserve_parent_metadata:
-                splits = [
-                    Document(
-                        page_content=split_doc.page_content,
-                        metadata={**doc.metadata, **split_doc.metadata},
-                    )
-                    for split_doc in splits
-                ]
-            transformed.extend(splits)
-        return transformed
+            yield from self._split_document(doc)
+
+    async def alazy_split_documents(
+        self, documents: Iterable[Document] | AsyncIterable[Document]
+    ) -> AsyncIterator[Document]:
+        """Asynchronously and lazily split documents."""
+        async for doc in _aiter_documents(documents):
+            for split_doc in await run_in_executor(None, self._split_document, doc):
+                yield split_doc
+
+    def _split_document(self, document: Document) -> list[Document]:
+        splits = self.split_text(document.page_content)
+        if self._preserve_parent_metadata:
+            splits = [
+                Document(
+                    page_content=split_doc.page_content,
+                    metadata={**document.metadata, **split_doc.metadata},
+                )
+                for split_doc in splits
+            ]
+        return splits
 
     def _process_media(self, soup: BeautifulSoup) -> None:
         """Processes the media elements.
@@ -0,0 +1,148 @@
+"""Split documents in parallel across worker processes."""
+
+from __future__ import annotations
+
+import itertools
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from langchain_core.documents import BaseDocumentTransformer, Document
+from typing_extensions import override
+
+from langchain_text_splitters.base import TextSplitter
+from langchain_text_splitters.html import HTMLHeaderTextSplitter, HTMLSectionSplitter
+from langchain_text_splitters.markdown import (
+    ExperimentalMarkdownSyntaxTextSplitter,
+    MarkdownHeaderTextSplitter,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from multiprocessing.context import BaseContext
+
+_Splitter = (
+    BaseDocumentTransformer
+    | HTMLHeaderTextSplitter
+    | HTMLSectionSplitter
+    | MarkdownHeaderTextSplitter
+    | ExperimentalMarkdownSyntaxTextSplitter
+)
+
+# The splitter of the current worker process, set once by the pool initializer
+_worker_splitter: Any = None
+
+
+def _init_worker(splitter: _Splitter) -> None:
+    global _worker_splitter  # noqa: PLW0603
+    _worker_splitter = splitter
+
+
+def _split_batch(documents: list[Document]) -> list[Document]:
+    return _split_documents(_worker_splitter, documents)
+
+
+def _split_documents(splitter: _Splitter, documents: list[Document]) -> list[Document]:
+    if isinstance(splitter, (TextSplitter, HTMLSectionSplitter)):
+        return splitter.split_documents(documents)
+    if isinstance(splitter, BaseDocumentTransformer):
+        return list(splitter.transform_documents(documents))
+    # Header splitters split raw text, so carry over the metadata of each document
+    return [
+        Document(
+            page_content=chunk.page_content,
+            metadata={**document.metadata, **chunk.metadata},
+        )
+        for document in documents
+        for chunk in splitter.split_text(document.page_content)
+    ]
+
+
+class ParallelSplitter(BaseDocumentTransformer):
+    """Split documents with a splitter across a pool of worker processes.
+
+    Documents are sent to the workers in batches of `chunksize`, and the chunks are
+    returned in the order of the input documents. The splitter is pickled and sent
+    to every worker once, so it must be picklable: custom length functions should
+    be module-level functions rather than lambdas or closures.
+
+    Splitters that only split raw text, like `MarkdownHeaderTextSplitter`, merge the
+    metadata of each document into the metadata of its chunks.
+
+    Example:
+        ```python
+        from langchain_text_splitters import (
+            ParallelSplitter,
+            RecursiveCharacterTextSplitter,
+        )
+
+        splitter = ParallelSplitter(
+            RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200),
+            max_workers=8,
+        )
+        chunks = splitter.split_documents(documents)
+        ```
+    """
+
+    def __init__(
+        self,
+        splitter: _Splitter,
+        *,
+        max_workers: int | None = None,
+        chunksize: int = 100,
+        mp_context: BaseContext | None = None,
+    ) -> None:
+        """Create a new ParallelSplitter.
+
+        Args:
+            splitter: The splitter to split documents with.
+            max_workers: Number of worker processes. Defaults to the number of CPUs.
+            chunksize: Number of documents sent to a worker at a time.
+            mp_context: Multiprocessing context used to start the workers.
+        """
+        if max_workers is not None and max_workers <= 0:
+            msg = f"max_workers must be > 0, got {max_workers}"
+            raise ValueError(msg)
+        if chunksize <= 0:
+            msg = f"chunksize must be > 0, got {chunksize}"
+            raise ValueError(msg)
+        self._splitter = splitter
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._chunksize = chunksize
+        self._mp_context = mp_context
+
+    def split_documents(self, documents: Iterable[Document]) -> list[Document]:
+        """Split documents."""
+        return list(self.lazy_split_documents(documents))
+
+    def lazy_split_documents(self, documents: Iterable[Document]) -> Iterator[Document]:
+        """Lazily split documents.
+
+        Documents are read as workers become available, so at most a few batches
+        per worker are held in memory.
+        """
+        executor = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=self._mp_context,
+            initializer=_init_worker,
+            initargs=(self._splitter,),
+        )
+        pending: deque[Future[list[Document]]] = deque()
+        try:
+            iterator = iter(documents)
+            while batch := list(itertools.islice(iterator, self._chunksize)):
+                pending.append(executor.submit(_split_batch, batch))
+                if len(pending) >= 2 * self._max_workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @override
+    def transform_documents(
+        self, documents: Sequence[Document], **kwargs: Any
+    ) -> list[Document]:
+        """Transform sequence of documents by splitting them."""
+        return self.split_documents(documents)
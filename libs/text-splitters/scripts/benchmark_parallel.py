@@ -0,0 +1,70 @@
+"""Benchmark the throughput of `ParallelSplitter` across worker counts.
+
+Usage:
+    python scripts/benchmark_parallel.py --documents 2000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import random
+import string
+import time
+
+from langchain_core.documents import Document
+
+from langchain_text_splitters import ParallelSplitter, RecursiveCharacterTextSplitter
+
+
+def _make_documents(n: int, words_per_document: int) -> list[Document]:
+    rng = random.Random(0)
+    vocabulary = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 9)))
+        for _ in range(5000)
+    ]
+    documents = []
+    for i in range(n):
+        words = rng.choices(vocabulary, k=words_per_document)
+        paragraphs = [" ".join(words[j : j + 80]) for j in range(0, len(words), 80)]
+        documents.append(
+            Document(page_content="\n\n".join(paragraphs), metadata={"source": i})
+        )
+    return documents
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=2000)
+    parser.add_argument("--words-per-document", type=int, default=2000)
+    parser.add_argument("--chunksize", type=int, default=50)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+    )
+    args = parser.parse_args()
+
+    documents = _make_documents(args.documents, args.words_per_document)
+    splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
+
+    start = time.perf_counter()
+    expected = splitter.split_documents(documents)
+    elapsed = time.perf_counter() - start
+    print(f"{'sequential':>12}: {len(documents) / elapsed:10.1f} docs/s")  # noqa: T201
+
+    for workers in args.workers:
+        parallel_splitter = ParallelSplitter(
+            splitter, max_workers=workers, chunksize=args.chunksize
+        )
+        start = time.perf_counter()
+        chunks = parallel_splitter.split_documents(documents)
+        elapsed = time.perf_counter() - start
+        if chunks != expected:
+            msg = "Parallel splitting returned different chunks"
+            raise RuntimeError(msg)
+        label = f"{workers} workers"
+        print(f"{label:>12}: {len(documents) / elapsed:10.1f} docs/s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ from __future__ import annotations
 import random
 import re
 import string
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 import pytest
 from langchain_core._api import suppress_langchain_beta_warning
@@ -30,10 +30,11 @@ from langchain_text_splitters.markdown import (
     ExperimentalMarkdownSyntaxTextSplitter,
     MarkdownHeaderTextSplitter,
 )
+from langchain_text_splitters.parallel import ParallelSplitter
 from langchain_text_splitters.python import PythonCodeTextSplitter
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import AsyncIterator, Callable, Iterator
 
     from bs4 import Tag
 
@@ -306,6 +307,16 @@ def test_create_documents_with_metadata() -> None:
                 Document(page_content="w1", metadata={"start_index": 24}),
             ],
         ),
+        (
+            RecursiveCharacterTextSplitter(
+                chunk_size=2, chunk_overlap=1, add_start_index=True
+            ),
+            "a a",
+            [
+                Document(page_content="a", metadata={"start_index": 0}),
+                Document(page_content="a", metadata={"start_index": 2}),
+            ],
+        ),
     ],
 )
 def test_create_documents_with_start_index(
@@ -319,6 +330,30 @@ def test_create_documents_with_start_index(
         assert text[s_i : s_i + len(doc.page_content)] == doc.page_content
 
 
+@pytest.mark.parametrize("keep_separator", [True, "end"])
+@pytest.mark.parametrize(
+    "separators", [None, ["\n\n", "\n", "(?<=[.!?]) ", ""], ["(?=ba)", r"\s+"]]
+)
+def test_recursive_character_split_spans(
+    separators: list[str] | None, *, keep_separator: bool | Literal["start", "end"]
+) -> None:
+    """Test that splitting on offsets matches splitting substrings."""
+    text = "Foo bar.  Baz ba ba!\n\nBar baz foo? Foo.\nba ba ba foo bar baz ba.  " * 3
+    splitter = RecursiveCharacterTextSplitter(
+        separators=separators,
+        keep_separator=keep_separator,
+        is_separator_regex=separators is not None,
+        chunk_size=12,
+        chunk_overlap=5,
+    )
+    expected = splitter._split_text(text, splitter._separators)
+    chunks = splitter._split_text_with_start_index(text)
+    assert [chunk for chunk, _ in chunks] == expected
+    assert splitter.split_text(text) == expected
+    for chunk, start_index in chunks:
+        assert text[start_index : start_index + len(chunk)] == chunk
+
+
 def test_metadata_not_shallow() -> None:
     """Test that metadatas are not shallow."""
     texts = ["foo bar"]
@@ -431,6 +466,95 @@ def test_split_documents() -> None:
     assert splitter.split_documents(docs) == expected_output
 
 
+def test_lazy_split_documents() -> None:
+    """Test that lazy_split_documents consumes one document at a time."""
+    splitter = CharacterTextSplitter(separator="", chunk_size=1, chunk_overlap=0)
+    docs = [
+        Document(page_content="foo", metadata={"source": "1"}),
+        Document(page_content="ba", metadata={"source": "2"}),
+    ]
+    consumed = []
+
+    def load() -> Iterator[Document]:
+        for doc in docs:
+            consumed.append(doc)
+            yield doc
+
+    chunks = splitter.lazy_split_documents(load())
+    assert consumed == []
+    assert [next(chunks) for _ in range(3)] == splitter.split_documents(docs[:1])
+    assert consumed == docs[:1]
+    assert [*chunks] == splitter.split_documents(docs[1:])
+    assert consumed == docs
+
+
+async def test_alazy_split_documents() -> None:
+    """Test alazy_split_documents with sync and async iterables of documents."""
+    splitter = CharacterTextSplitter(separator="", chunk_size=1, chunk_overlap=0)
+    docs = [
+        Document(page_content="foo", metadata={"source": "1"}),
+        Document(page_content="ba", metadata={"source": "2"}),
+    ]
+
+    async def aload() -> AsyncIterator[Document]:
+        for doc in docs:
+            yield doc
+
+    expected = splitter.split_documents(docs)
+    assert [chunk async for chunk in splitter.alazy_split_documents(docs)] == expected
+    assert [
+        chunk async for chunk in splitter.alazy_split_documents(aload())
+    ] == expected
+
+
+def test_parallel_splitter() -> None:
+    """Test that ParallelSplitter keeps the order and metadata of the chunks."""
+    splitter = RecursiveCharacterTextSplitter(chunk_size=10, chunk_overlap=3)
+    docs = [
+        Document(page_content=f"foo bar baz {i} " * (i % 4 + 1), metadata={"i": i})
+        for i in range(25)
+    ]
+    parallel_splitter = ParallelSplitter(splitter, max_workers=2, chunksize=3)
+    assert parallel_splitter.split_documents(docs) == splitter.split_documents(docs)
+    assert parallel_splitter.transform_documents(docs[:2]) == splitter.split_documents(
+        docs[:2]
+    )
+    assert parallel_splitter.split_documents([]) == []
+
+
+def test_parallel_splitter_markdown_header() -> None:
+    """Test that ParallelSplitter merges document metadata into header chunks."""
+    splitter = MarkdownHeaderTextSplitter(headers_to_split_on=[("#", "Header 1")])
+    docs = [
+        Document(page_content="# Foo\n\nHi this is Jim", metadata={"source": "1"}),
+        Document(page_content="# Bar\n\nHi this is Joe", metadata={"source": "2"}),
+    ]
+    assert ParallelSplitter(splitter, max_workers=2, chunksize=1).split_documents(
+        docs
+    ) == [
+        Document(
+            page_content="Hi this is Jim", metadata={"source": "1", "Header 1": "Foo"}
+        ),
+        Document(
+            page_content="Hi this is Joe", metadata={"source": "2", "Header 1": "Bar"}
+        ),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"max_workers": 0}, "max_workers must be > 0, got 0"),
+        ({"chunksize": 0}, "chunksize must be > 0, got 0"),
+    ],
+)
+def test_parallel_splitter_invalid_arguments(
+    kwargs: dict[str, Any], message: str
+) -> None:
+    with pytest.raises(ValueError, match=message):
+        ParallelSplitter(CharacterTextSplitter(), **kwargs)
+
+
 def test_python_text_splitter() -> None:
     splitter = PythonCodeTextSplitter(chunk_size=30, chunk_overlap=0)
     splits = splitter.split_text(FAKE_PYTHON_TEXT)
@@ -3311,6 +3435,33 @@ def custom_iframe_extractor(iframe_tag: Tag) -> str:
     return f"[iframe:{iframe_src}]({iframe_src})"
 
 
+@pytest.mark.requires("bs4")
+async def test_html_semantic_preserving_splitter_lazy_split_documents() -> None:
+    """Test lazily splitting documents with HTMLSemanticPreservingSplitter."""
+    docs = [
+        Document(
+            page_content="<h1>Section 1</h1><p>Content of section 1.</p>",
+            metadata={"source": "1"},
+        ),
+        Document(
+            page_content="<h1>Section 2</h1><p>Content of section 2.</p>",
+            metadata={"source": "2"},
+        ),
+    ]
+    with suppress_langchain_beta_warning():
+        splitter = HTMLSemanticPreservingSplitter(
+            headers_to_split_on=[("h1", "Header 1")],
+            preserve_parent_metadata=True,
+        )
+    expected = splitter.transform_documents(docs)
+    assert [doc.metadata for doc in expected] == [
+        {"source": "1", "Header 1": "Section 1"},
+        {"source": "2", "Header 1": "Section 2"},
+    ]
+    assert list(splitter.lazy_split_documents(iter(docs))) == expected
+    assert [doc async for doc in splitter.alazy_split_documents(docs)] == expected
+
+
 @pytest.mark.requires("bs4")
 def test_html_splitter_with_custom_extractor() -> None:
     """Test HTML splitting with a custom extractor."""
@@ -3879,3 +4030,12 @@ def test_character_text_splitter_chunk_size_effect(
         keep_separator=False,
     )
     assert splitter.split_text(text) == expected
+
+
+def test_nested_metadata_not_shallow() -> None:
+    """Test that nested metadatas are copied for every chunk."""
+    splitter = CharacterTextSplitter(separator=" ", chunk_size=3, chunk_overlap=0)
+    docs = splitter.create_documents(["foo bar"], [{"tags": ["1"]}])
+    docs[0].metadata["tags"].append("2")
+    assert docs[0].metadata == {"tags": ["1", "2"]}
+    assert docs[1].metadata == {"tags": ["1"]}